@@ -0,0 +1,575 @@
+##########################################################################################################
+#
+# benchmark.py
+#
+# Laufzeitmessungen (nicht Teil des eigentlichen Programms).
+#
+#   python benchmark.py                          => Einzelne Messungen als Tabellen
+#   python benchmark.py suite [--scales ...]     => Komplette Suite, Ergebnisse als JSON-Datei
+#   python benchmark.py compare ALT.json NEU.json => Zwei Ergebnisse vergleichen (z.B. zwei Commits)
+#
+##########################################################################################################
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime
+from pathlib import Path
+
+from utils import CohortAnalytics, ConsoleUI, DatabaseConnector, WriteBehind
+from models.Course import Course
+from models.CourseRepository import CourseRepository
+from models.CourseStats import CourseStats
+from models.DashboardStats import DashboardStats
+from models.ExamScoreStore import ExamScoreStore
+from models.exams.AdvancedWorkbook import AdvancedWorkbook
+from models.exams.ClassTest import ClassTest
+from models.Student import Student
+from utils.Settings import Settings
+
+##########################################################################################################
+
+def _generateCourses(courseCount:int,rng:random.Random):
+    """
+    Erzeugt zufällige Kurse (Generator, damit auch sehr große Datenmengen nicht komplett im Speicher liegen).
+
+    Args:
+        courseCount (int)  : Wie viele Kurse erzeugt werden sollen
+        rng (random.Random): Der Zufallsgenerator
+
+    Returns:
+        Generator: Ein Tupel pro Kurs (Spalten der Tabelle "courses")
+    """
+    for i in range(courseCount):
+        yield (f"Kurs {i}",f"BENCH{i:07d}","Benchmark",rng.randint(1,10),f"2025-{rng.randint(1,12):02d}-01")
+
+def _generateExams(courseCount:int,examsPerCourse:int,examType:int,rng:random.Random):
+    """
+    Erzeugt zufällige Exams einer Prüfungsart für alle Kurse (Generator).
+
+    Args:
+        courseCount (int)   : Anzahl der Kurse
+        examsPerCourse (int): Wie viele Exams (Advanced Workbooks und Klausuren im Wechsel) pro Kurs
+        examType (int)      : 0 = Advanced Workbooks (gerade Exam-Nummern) / 1 = Klausuren (ungerade)
+        rng (random.Random) : Der Zufallsgenerator
+
+    Returns:
+        Generator: Ein Tupel pro Exam (Spalten der Tabelle "advancedworkbooks" bzw. "classtests")
+    """
+    examsOfType = (examsPerCourse + 1 - examType) // 2
+    for i in range(courseCount):
+        courseId = f"BENCH{i:07d}"
+        for _ in range(examsOfType):
+            if examType == 0:
+                yield ("2025-02-01",courseId,*[rng.randint(0,15) for _ in range(6)],rng.randint(0,10))
+            else:
+                yield ("2025-02-01",courseId,rng.randint(0,100))
+
+def fillDatabase(courseCount:int,examsPerCourse:int,seed:int = None):
+    """
+    Füllt die (leere) Datenbank mit zufälligen Kursen und Exams. Gleicher Seed => Gleiche Daten. Die Zeilen
+    werden gestreamt und in einer Transaktion (mit ausgesetzten "course_stats"-Triggern) geschrieben.
+
+    Args:
+        courseCount (int)   : Wie viele Kurse erzeugt werden sollen
+        examsPerCourse (int): Wie viele Exams (Advanced Workbooks und Klausuren im Wechsel) pro Kurs
+        seed (int)          : Startwert für den Zufallsgenerator (OPTIONAL, Standard = "courseCount")
+    """
+    seed = courseCount if seed is None else seed
+    with CourseStats.deferred():
+        DatabaseConnector.executeMany(
+            "INSERT INTO courses VALUES (?,?,?,?,?)",
+            _generateCourses(courseCount,random.Random(f"{seed}-courses"))
+        )
+        DatabaseConnector.executeMany(
+            "INSERT INTO advancedworkbooks VALUES (?,?,?,?,?,?,?,?,?)",
+            _generateExams(courseCount,examsPerCourse,0,random.Random(f"{seed}-advancedworkbooks"))
+        )
+        DatabaseConnector.executeMany(
+            "INSERT INTO classtests VALUES (?,?,?)",
+            _generateExams(courseCount,examsPerCourse,1,random.Random(f"{seed}-classtests"))
+        )
+
+def benchmarkGetAllFromDB(courseCount:int,examsPerCourse:int = 4) -> float:
+    """
+    Misst die Laufzeit von "Course.getAllFromDB" auf einer frischen Datenbank.
+
+    Args:
+        courseCount (int)   : Anzahl der Kurse
+        examsPerCourse (int): Anzahl der Exams pro Kurs
+
+    Returns:
+        float: Laufzeit in Sekunden
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        DatabaseConnector._databaseFile = Path(directory) / "benchmark.db"
+        DatabaseConnector.connectToDB()
+        DatabaseConnector.createDatabase()
+        DatabaseConnector.migrateDatabase()
+        fillDatabase(courseCount,examsPerCourse)
+
+        start = time.perf_counter()
+        courses = Course.getAllFromDB()
+        duration = time.perf_counter() - start
+
+        DatabaseConnector.disconnectFromDB()
+
+    assert len(courses) == courseCount + 5 #Plus Demo-Daten
+    return duration
+
+def benchmarkMemory(courseCount:int,examsPerCourse:int = 10) -> float:
+    """
+    Misst den Speicherverbrauch von "Course.getAllFromDB" pro geladenem Exam (inkl. Anteil der Kurse).
+
+    Args:
+        courseCount (int)   : Anzahl der Kurse
+        examsPerCourse (int): Anzahl der Exams pro Kurs
+
+    Returns:
+        float: Bytes pro Exam
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        DatabaseConnector._databaseFile = Path(directory) / "benchmark.db"
+        DatabaseConnector.connectToDB()
+        DatabaseConnector.createDatabase()
+        DatabaseConnector.migrateDatabase()
+        fillDatabase(courseCount,examsPerCourse)
+
+        tracemalloc.start()
+        courses = Course.getAllFromDB()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        examCount = sum(course.tries() for course in courses)
+        DatabaseConnector.disconnectFromDB()
+
+    return memory / examCount
+
+def benchmarkDashboardStats(courseCount:int,examsPerCourse:int = 2) -> tuple:
+    """
+    Misst "DashboardStats.fromCourses" (Python) und "DashboardStats.fromDatabase" (SQL). Dass beide die gleichen
+    Kennzahlen liefern, prüft "tests/test_consistency.py".
+
+    Args:
+        courseCount (int)   : Anzahl der Kurse
+        examsPerCourse (int): Anzahl der Exams pro Kurs
+
+    Returns:
+        tuple: (Sekunden Python inkl. Laden der Kurse, Sekunden SQL)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        DatabaseConnector._databaseFile = Path(directory) / "benchmark.db"
+        DatabaseConnector.connectToDB()
+        DatabaseConnector.createDatabase()
+        DatabaseConnector.migrateDatabase()
+        fillDatabase(courseCount,examsPerCourse)
+
+        start = time.perf_counter()
+        DashboardStats.fromCourses(Course.getAllFromDB())
+        pythonDuration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        DashboardStats.fromDatabase()
+        sqlDuration = time.perf_counter() - start
+
+        DatabaseConnector.disconnectFromDB()
+
+    return pythonDuration, sqlDuration
+
+def benchmarkScoreStore(courseCount:int,examsPerCourse:int = 10) -> tuple:
+    """
+    Vergleicht Punkte, Bestanden-Status und Noten aller Exams über die Exam-Objekte mit dem spaltenweisen
+    "ExamScoreStore" (beide inkl. Laden aus der Datenbank) und prüft, ob die Ergebnisse gleich sind.
+
+    Args:
+        courseCount (int)   : Anzahl der Kurse
+        examsPerCourse (int): Anzahl der Exams pro Kurs
+
+    Returns:
+        tuple: (Sekunden Exam-Objekte, Sekunden ExamScoreStore)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        DatabaseConnector._databaseFile = Path(directory) / "benchmark.db"
+        DatabaseConnector.connectToDB()
+        DatabaseConnector.createDatabase()
+        DatabaseConnector.migrateDatabase()
+        fillDatabase(courseCount,examsPerCourse)
+
+        start = time.perf_counter()
+        exams = [exam for course in Course.getAllFromDB() for exam in course.exams]
+        objectPoints = [exam.points() for exam in exams]
+        objectPassed = sum(exam.passed() for exam in exams)
+        objectGrades = [Settings._gradingScheme.getGrade(points) for points in objectPoints]
+        objectDuration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store = ExamScoreStore.fromDatabase()
+        storePoints = store.points()
+        storePassed = sum(store.passedFlags(storePoints))
+        storeGrades = store.grades(storePoints)
+        storeDuration = time.perf_counter() - start
+
+        DatabaseConnector.disconnectFromDB()
+
+    #Reihenfolge der Exams unterscheidet sich (pro Kurs vs. pro Prüfungsart), daher sortiert vergleichen
+    assert sorted(objectPoints) == sorted(int(points) for points in storePoints)
+    assert objectPassed == storePassed
+    assert sorted(objectGrades) == sorted(float(grade) for grade in storeGrades)
+    return objectDuration, storeDuration
+
+def benchmarkCohort(studentCount:int,workerCounts:list,courseCount:int = 200,examsPerCourse:int = 6) -> list:
+    """
+    Misst "CohortAnalytics.compute" mit unterschiedlich vielen Prozessen über gleich viele Studenten-Datenbanken
+    und prüft, ob alle Durchläufe das gleiche Ergebnis liefern.
+
+    Args:
+        studentCount (int)  : Anzahl der Studenten (Datenbanken)
+        workerCounts (list) : Anzahl der Prozesse pro Durchlauf, z.B. [1,2,4]
+        courseCount (int)   : Anzahl der Kurse pro Student
+        examsPerCourse (int): Anzahl der Exams pro Kurs
+
+    Returns:
+        list: Laufzeit in Sekunden pro Eintrag in "workerCounts"
+    """
+    students = Settings._students
+    databaseDirectory = Settings._databaseDirectory
+    durations = list()
+    with tempfile.TemporaryDirectory() as directory:
+        Settings._databaseDirectory = Path(directory)
+        Settings._students = dict()
+        for i in range(studentCount):
+            studentNumber = f"BENCH{i:05d}"
+            Settings._students[studentNumber] = Student(
+                f"Student {i}",date(2000,1,1),studentNumber,"Benchmark",list(),6,date(2024,10,1),180
+            )
+            DatabaseConnector._databaseFile = Settings.getDatabaseFile(studentNumber)
+            DatabaseConnector.connectToDB()
+            DatabaseConnector.createDatabase()
+            DatabaseConnector.migrateDatabase()
+            fillDatabase(courseCount,examsPerCourse,seed=i)
+            DatabaseConnector.disconnectFromDB()
+
+        try:
+            results = list()
+            for workers in workerCounts:
+                stats, duration = CohortAnalytics.compute(workers,date(2026,1,1))
+                results.append((stats.studentCount,stats.onTrackCount,stats.courses,stats.grades,stats.students))
+                durations.append(duration)
+        finally:
+            Settings._students = students
+            Settings._databaseDirectory = databaseDirectory
+
+    assert all(result == results[0] for result in results)
+    assert results[0][0] == studentCount
+    return durations
+
+##########################################################################################################
+#-- Suite --
+
+#Seiten der UI und die Eingaben, mit denen sie gerendert werden (Abbruch bzw. ein neuer Kurs bei Seite 4)
+_pages = {
+    0: (ConsoleUI.showMainMenu,""),
+    1: (ConsoleUI.showDashboard,""),
+    2: (ConsoleUI.showSettings,""),
+    3: (ConsoleUI.showCourses,""),
+    4: (ConsoleUI.showCreateCourse,"Suite\nSUITE{run}\nBenchmark\n5\n"),
+    5: (ConsoleUI.showDeleteCourse,"0\n"),
+    6: (ConsoleUI.showSetExam,"0\n"),
+    7: (ConsoleUI.showImport,"0\n"),
+    8: (ConsoleUI.showExport,"\n")
+}
+
+def _measure(function,repeat:int) -> float:
+    """
+    Misst eine Funktion mehrfach und gibt die schnellste Laufzeit zurück (am wenigsten durch andere Prozesse
+    gestört).
+
+    Args:
+        function (callable): Die Funktion (bekommt die Nummer des Durchlaufs als Parameter)
+        repeat (int)       : Anzahl der Durchläufe
+
+    Returns:
+        float: Laufzeit in Sekunden
+    """
+    durations = list()
+    for run in range(repeat):
+        start = time.perf_counter()
+        function(run)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+def _renderPage(page:int,run:int):
+    """
+    Rendert eine Seite der UI, die Ausgabe wird verworfen und Eingaben kommen aus "_pages".
+
+    Args:
+        page (int): Die Seitennummer
+        run (int) : Nummer des Durchlaufs (für eindeutige Eingaben)
+    """
+    function, inputs = _pages[page]
+    stdin = sys.stdin
+    sys.stdin = io.StringIO(inputs.format(run=run))
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            function()
+    finally:
+        sys.stdin = stdin
+
+def _saveMany(create,count:int) -> float:
+    """
+    Speichert einzeln (jeweils mit eigenem Commit, wie in der UI) neue Objekte per "saveToDB". Läuft
+    "WriteBehind", wird inkl. Warten auf den letzten Commit gemessen.
+
+    Args:
+        create (callable): Erstellt das i-te Objekt
+        count (int)      : Anzahl der Objekte
+
+    Returns:
+        float: Laufzeit pro "saveToDB" in Sekunden
+    """
+    objects = [create(i) for i in range(count)]
+    start = time.perf_counter()
+    for obj in objects:
+        obj.saveToDB()
+    WriteBehind.flush()
+    return (time.perf_counter() - start) / count
+
+def runSuiteScale(examCount:int,seed:int,profile:str = None,examsPerCourse:int = 4,saveCount:int = 100) -> dict:
+    """
+    Misst alle Schritte der Suite auf einer frischen Datenbank mit "examCount" Exams.
+
+    Args:
+        examCount (int)     : Anzahl der Exams (Advanced Workbooks und Klausuren im Wechsel)
+        seed (int)          : Startwert für den Zufallsgenerator
+        profile (str)       : Speicherprofil der Datenbank (OPTIONAL, sonst "Settings._storageProfile")
+        examsPerCourse (int): Anzahl der Exams pro Kurs (=> "examCount / examsPerCourse" Kurse)
+        saveCount (int)     : Wie viele Objekte pro "saveToDB"-Messung gespeichert werden
+
+    Returns:
+        dict: Name der Messung => Sekunden
+    """
+    courseCount = max(examCount // examsPerCourse,1)
+    repeat = 3 if examCount <= 100000 else 1
+    results = dict()
+
+    students = Settings._students
+    student = Settings._student
+    with tempfile.TemporaryDirectory() as directory:
+        DatabaseConnector._databaseFile = Path(directory) / "suite.db"
+        Settings._student = Student("Suite",date(2000,1,1),"SUITE","Benchmark",list(),6,date(2024,10,1),180)
+        Settings._students = {"SUITE": Settings._student}
+        try:
+            start = time.perf_counter()
+            DatabaseConnector.connectToDB(Settings.getStoragePragmas(profile))
+            DatabaseConnector.createDatabase()
+            DatabaseConnector.migrateDatabase()
+            results["createDatabase"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            fillDatabase(courseCount,examsPerCourse,seed)
+            results["fillDatabase"] = time.perf_counter() - start
+
+            results["Course.getAllFromDB"] = _measure(lambda run: Course.getAllFromDB(),repeat)
+
+            CourseRepository.load()
+            results["DashboardStats.fromCourses"] = _measure(
+                lambda run: DashboardStats.fromCourses(CourseRepository.getAll()),repeat
+            )
+            results["DashboardStats.fromDatabase"] = _measure(lambda run: DashboardStats.fromDatabase(),repeat)
+
+            #Erster Aufruf ohne Zwischenspeicher (z.B. Dashboard-Kennzahlen), danach mit
+            for page in _pages:
+                results[f"ConsoleUI.page{page}"] = _measure(lambda run: _renderPage(page,run),1)
+                results[f"ConsoleUI.page{page}.warm"] = _measure(lambda run: _renderPage(page,run + 1),repeat)
+
+            results["Course.saveToDB"] = _saveMany(
+                lambda i: Course(f"Neu {i}",f"SAVE{i:07d}","Benchmark",5,list()),saveCount
+            )
+            results["AdvancedWorkbook.saveToDB"] = _saveMany(
+                lambda i: AdvancedWorkbook(date(2025,3,1),f"SAVE{i:07d}",10,10,10,10,10,10,5),saveCount
+            )
+            results["ClassTest.saveToDB"] = _saveMany(
+                lambda i: ClassTest(date(2025,3,1),f"SAVE{i:07d}",75),saveCount
+            )
+
+            #Die gleichen Schreibvorgänge im Hintergrund, gesammelt in wenigen Transaktionen
+            WriteBehind.start()
+            try:
+                results["Course.saveToDB.writeBehind"] = _saveMany(
+                    lambda i: Course(f"Neu {i}",f"WB{i:07d}","Benchmark",5,list()),saveCount
+                )
+                results["AdvancedWorkbook.saveToDB.writeBehind"] = _saveMany(
+                    lambda i: AdvancedWorkbook(date(2025,3,1),f"WB{i:07d}",10,10,10,10,10,10,5),saveCount
+                )
+                results["ClassTest.saveToDB.writeBehind"] = _saveMany(
+                    lambda i: ClassTest(date(2025,3,1),f"WB{i:07d}",75),saveCount
+                )
+            finally:
+                WriteBehind.stop()
+        finally:
+            DatabaseConnector.disconnectFromDB()
+            CourseRepository.clear()
+            Settings._students = students
+            Settings._student = student
+
+    return results
+
+def _gitCommit() -> str:
+    """
+    Gibt den aktuellen Git-Commit zurück (für die Zuordnung der Ergebnisse).
+
+    Returns:
+        str: Kurzer Commit-Hash oder None, wenn Git nicht verfügbar ist
+    """
+    try:
+        return subprocess.run(
+            ["git","rev-parse","--short","HEAD"],capture_output=True,text=True,check=True,
+            cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError,subprocess.CalledProcessError):
+        return None
+
+def runSuite(scales:list,seed:int,outputFile:Path,profile:str = None) -> dict:
+    """
+    Führt die Suite für alle Größen aus und schreibt die Ergebnisse als JSON-Datei.
+
+    Args:
+        scales (list)    : Anzahl der Exams pro Durchlauf, z.B. [1000,10000,100000]
+        seed (int)       : Startwert für den Zufallsgenerator (gleicher Seed => gleiche Daten)
+        profile (str)    : Speicherprofil der Datenbank (OPTIONAL, sonst "Settings._storageProfile")
+        outputFile (Path): Zieldatei
+
+    Returns:
+        dict: Die Ergebnisse (Inhalt der Datei)
+    """
+    suite = {
+        "meta": {
+            "commit": _gitCommit(),
+            "createdAt": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "seed": seed,
+            "profile": profile if profile is not None else Settings._storageProfile
+        },
+        "results": dict()
+    }
+    for examCount in scales:
+        print(f"{examCount} Exams ...",flush=True)
+        suite["results"][str(examCount)] = runSuiteScale(examCount,seed,profile)
+
+    with open(outputFile,"w",encoding="utf-8") as file:
+        json.dump(suite,file,indent=2)
+    return suite
+
+def compareSuites(oldFile:Path,newFile:Path,threshold:float,minDelta:float) -> int:
+    """
+    Vergleicht zwei Ergebnisdateien der Suite und markiert Messungen, die um mehr als "threshold" langsamer
+    geworden sind. Sehr kurze Messungen schwanken stark, daher zählen nur Unterschiede ab "minDelta".
+
+    Args:
+        oldFile (Path)   : Ergebnisse vorher (z.B. vom letzten Commit)
+        newFile (Path)   : Ergebnisse nachher
+        threshold (float): Erlaubte Verschlechterung, z.B. 0.2 = 20%
+        minDelta (float) : Mindestunterschied in Sekunden, z.B. 0.0001
+
+    Returns:
+        int: Anzahl der Verschlechterungen
+    """
+    with open(oldFile,encoding="utf-8") as file:
+        old = json.load(file)
+    with open(newFile,encoding="utf-8") as file:
+        new = json.load(file)
+
+    print(f"Vorher : {old['meta']['commit']} ({old['meta']['createdAt']}, {old['meta'].get('profile','?')})")
+    print(f"Nachher: {new['meta']['commit']} ({new['meta']['createdAt']}, {new['meta'].get('profile','?')})\n")
+    print(f"{'Exams':>8} {'Messung':<28} {'Vorher (s)':>12} {'Nachher (s)':>12} {'Faktor':>8}")
+
+    regressions = 0
+    for scale, newResults in new["results"].items():
+        oldResults = old["results"].get(scale,dict())
+        for name, newDuration in newResults.items():
+            if name not in oldResults:
+                continue
+            oldDuration = oldResults[name]
+            factor = newDuration / oldDuration if oldDuration > 0 else 1.0
+            marker = ""
+            if factor > 1 + threshold and newDuration - oldDuration > minDelta:
+                marker = "  << LANGSAMER"
+                regressions += 1
+            print(f"{scale:>8} {name:<28} {oldDuration:>12.6f} {newDuration:>12.6f} {factor:>8.2f}{marker}")
+
+    print(f"\n{regressions} Messung(en) mehr als {threshold:.0%} langsamer.")
+    return regressions
+
+def printTables():
+    """
+    Gibt die einzelnen Messungen als Tabellen aus (ohne Argumente auf der Kommandozeile).
+    """
+    print("-- Course.getAllFromDB --\n")
+    print(f"{'Kurse':>8} {'Exams':>8} {'Sekunden':>10} {'µs / Kurs':>10}")
+    for courseCount in [1000,2000,4000,8000,16000]:
+        duration = benchmarkGetAllFromDB(courseCount)
+        print(f"{courseCount:>8} {courseCount * 4:>8} {duration:>10.4f} {duration / courseCount * 1e6:>10.2f}")
+
+    print("\n-- DashboardStats: Python vs. SQL --\n")
+    print(f"{'Kurse':>8} {'Python (s)':>12} {'SQL (s)':>10}")
+    for courseCount in [1000,10000,50000]:
+        pythonDuration, sqlDuration = benchmarkDashboardStats(courseCount)
+        print(f"{courseCount:>8} {pythonDuration:>12.4f} {sqlDuration:>10.4f}")
+
+    print("\n-- Speicher von Course.getAllFromDB --\n")
+    print(f"{'Kurse':>8} {'Exams':>8} {'Bytes / Exam':>14}")
+    for courseCount in [1000,10000]:
+        bytesPerExam = benchmarkMemory(courseCount)
+        print(f"{courseCount:>8} {courseCount * 10:>8} {bytesPerExam:>14.1f}")
+
+    print("\n-- Punkte / Bestanden / Noten aller Exams: Objekte vs. ExamScoreStore --\n")
+    print(f"{'Kurse':>8} {'Exams':>8} {'Objekte (s)':>12} {'Store (s)':>10}")
+    for courseCount in [1000,10000]:
+        objectDuration, storeDuration = benchmarkScoreStore(courseCount)
+        print(f"{courseCount:>8} {courseCount * 10:>8} {objectDuration:>12.4f} {storeDuration:>10.4f}")
+
+    print("\n-- CohortAnalytics (200 Kurse pro Student) --\n")
+    workerCounts = sorted({1,2,max(os.cpu_count() or 1,1),4})
+    print(f"{'Studenten':>10} " + " ".join(f"{f'{workers} Proz. (s)':>14}" for workers in workerCounts))
+    for studentCount in [50,200]:
+        durations = benchmarkCohort(studentCount,workerCounts)
+        print(f"{studentCount:>10} " + " ".join(f"{duration:>14.4f}" for duration in durations))
+
+##########################################################################################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Laufzeitmessungen für StudyTrack")
+    commands = parser.add_subparsers(dest="command")
+
+    suiteParser = commands.add_parser("suite",help="Komplette Suite ausführen und als JSON speichern")
+    suiteParser.add_argument("--scales",default="1000,10000,100000",help="Anzahl Exams, z.B. 1000,1000000")
+    suiteParser.add_argument("--seed",type=int,default=42)
+    suiteParser.add_argument("--output",type=Path,default=Path("benchmark_results.json"))
+    suiteParser.add_argument("--profile",choices=Settings._storageProfiles,help="Speicherprofil der Datenbank")
+
+    compareParser = commands.add_parser("compare",help="Zwei Ergebnisdateien vergleichen")
+    compareParser.add_argument("old",type=Path)
+    compareParser.add_argument("new",type=Path)
+    compareParser.add_argument("--threshold",type=float,default=0.2,help="Erlaubte Verschlechterung (0.2 = 20%%)")
+    compareParser.add_argument("--min-delta",type=float,default=0.0001,help="Mindestunterschied in Sekunden")
+
+    arguments = parser.parse_args()
+    if arguments.command == "suite":
+        runSuite([int(scale) for scale in arguments.scales.split(",")],arguments.seed,arguments.output,arguments.profile)
+        print(f"Ergebnisse gespeichert in '{arguments.output}'")
+    elif arguments.command == "compare":
+        sys.exit(1 if compareSuites(arguments.old,arguments.new,arguments.threshold,arguments.min_delta) > 0 else 0)
+    else:
+        printTables()
\ No newline at end of file
@@ -1,30 +1,98 @@
-##########################################################################################################
-#
-# main.py
-#
-# Einstiegspunkt in das Programm
-#
-##########################################################################################################
-
-from utils import ConsoleUI, DatabaseConnector
-from utils import Settings
-from models.Course import Course
-
-##########################################################################################################
-
-#Konsole leeren, falls nicht in eigenem Fenster gestartet
-ConsoleUI.clearConsole()
-
-#Datenbankverbindung und ggf. Setup
-DatabaseConnector.connectToDB()
-setupRan = DatabaseConnector.createDatabase()
-if setupRan:
-    ConsoleUI.writeLine("<< Datenbanksetup ausgeführt! >>")
-
-#Kurse aus Datenbank laden
-Settings._student.courses = Course.getAllFromDB()
-
-#UI-Loop starten
-ConsoleUI.drawMenu()
-
+##########################################################################################################
+#
+# main.py
+#
+# Einstiegspunkt in das Programm
+#
+##########################################################################################################
+
+import atexit
+import sys
+
+from utils import CohortAnalytics, ConsoleUI, DatabaseConnector, Metrics, QueryTracer, WriteBehind
+from utils import Settings
+from models.CourseRepository import CourseRepository
+from models.CourseStats import CourseStats
+from models.TaskAnalytics import TaskAnalytics
+
+##########################################################################################################
+
+def openStudent(studentNumber:str):
+    """
+    Wählt einen Studenten aus und öffnet seine Datenbank (inkl. Setup, Migrationen und Laden der Kurse).
+    Zwischengespeicherte Daten des vorherigen Studenten werden verworfen.
+
+    Args:
+        studentNumber (str): Die Matrikelnummer
+    """
+    WriteBehind.flush()
+    CourseRepository.clear()
+    TaskAnalytics.invalidate()
+    Settings.selectStudent(studentNumber)
+
+    #Datenbankverbindung (mit dem eingestellten Speicherprofil) und ggf. Setup
+    DatabaseConnector.connectToDB(Settings.getStoragePragmas())
+    setupRan = DatabaseConnector.createDatabase()
+    if setupRan:
+        ConsoleUI.writeLine("<< Datenbanksetup ausgeführt! >>")
+
+    #Schema ggf. auf aktuelle Version bringen (z.B. Indizes für bestehende Datenbanken)
+    migrationsRan = DatabaseConnector.migrateDatabase()
+    if migrationsRan > 0:
+        ConsoleUI.writeLine(f"<< {migrationsRan} Datenbankmigration(en) ausgeführt! >>")
+
+    #Einstellungen für die Kurs-Zusammenfassung ("course_stats") in die Datenbank übernehmen
+    CourseStats.sync()
+
+    #Kurse aus Datenbank laden
+    CourseRepository.load()
+
+def runCohort(workers:int = None):
+    """
+    Kommando "cohort": Wertet alle Studenten parallel aus und gibt das Ergebnis aus.
+
+    Args:
+        workers (int): Anzahl Prozesse (OPTIONAL, Standard = Anzahl CPU-Kerne)
+    """
+    stats, seconds = CohortAnalytics.compute(workers)
+    ConsoleUI.writeLine(stats)
+    ConsoleUI.writeLine(f"{stats.studentCount} Datenbank(en) in {round(seconds,2)} s ausgewertet.")
+
+##########################################################################################################
+
+#Nur beim direkten Start ausführen (nicht in den Worker-Prozessen von "CohortAnalytics")
+if __name__ == "__main__":
+
+    #Kommandozeile: "python main.py cohort [workers]" => Auswertung über alle Studenten statt UI
+    if len(sys.argv) > 1 and sys.argv[1] == "cohort":
+        runCohort(int(sys.argv[2]) if len(sys.argv) > 2 else None)
+        sys.exit(0)
+
+    #Datenbankabfragen mitschreiben (Zusammenfassung auf der Seite "Einstellungen", Datei beim Beenden)
+    if Settings._traceQueries:
+        QueryTracer.enable()
+        if Settings._traceFile is not None:
+            atexit.register(QueryTracer.dump,Settings._traceFile)
+
+    #Kennzahlen regelmäßig und beim Beenden in eine Datei schreiben (z.B. für ein Monitoring)
+    if Settings._metricsFile is not None:
+        Metrics.startPeriodicFlush(Settings._metricsFile,Settings._metricsInterval)
+        atexit.register(Metrics.flush,Settings._metricsFile)
+        atexit.register(Metrics.stopPeriodicFlush) #Wird zuerst aufgerufen ("atexit" in umgekehrter Reihenfolge)
+
+    #"saveToDB" im Hintergrund, beim Beenden wird alles Ausstehende noch geschrieben (vor den Kennzahlen, da
+    #"atexit" in umgekehrter Reihenfolge aufruft)
+    if Settings._writeBehind:
+        WriteBehind.start(Settings._writeBehindBatchSize,Settings._writeBehindDelay)
+        atexit.register(WriteBehind.stop)
+
+    #Konsole leeren, falls nicht in eigenem Fenster gestartet
+    ConsoleUI.clearConsole()
+
+    #Studenten auswählen, jeder Student hat seine eigene Datenbank
+    openStudent(ConsoleUI.showStudentSelection())
+
+    #UI-Loop starten
+    ConsoleUI.drawMenu()
+
 ##########################################################################################################
\ No newline at end of file
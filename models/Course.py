@@ -1,223 +1,366 @@
-##########################################################################################################
-#
-# Course.py
-#
-# Ein zu überwachender Kurs.
-#
-##########################################################################################################
-
-from datetime import date, datetime
-
-from utils.DatabaseConnector import DatabaseConnector
-
-from .exams.AdvancedWorkbook import AdvancedWorkbook
-from .exams.ClassTest import ClassTest
-from .exams.Exam import Exam
-from typing import Optional
-
-class Course:
-
-    def __init__(self,name:str,courseId:str,description:str,ects:int,
-        exams:list,startedAt:date = date.today()
-    ):
-        """
-        Konstruktor
-        
-        Args:
-            name (str)       : Der Kursname
-            courseId (str)   : Die Kursnummer / ID (kann Zahlen und Buchstaben haben) ; Ist PrimaryKey in DB
-            description (str): Beschreibung des Kurses und seiner Inhalte
-            ects (int)       : Wie viele ECTS der Kurs bringt
-            exams (list)     : Liste mit "Exam"-Objekten => Alle geschriebenen Prüfungen
-            startedAt (date) : Wann der Kurs gestartet wurde (Automatisch, kann manuell gesetzt werden)
-        """
-        self.name         = name
-        self.courseId     = courseId
-        self.description  = description
-        self.ects         = ects
-        self.exams        = exams
-        self.startedAt    = startedAt
-
-    def __str__(self) -> str:
-        """
-        Repräsentation für UI
-
-        Returns:
-            str: Stringrepräsentation des Objektes
-        """
-        s  = "-- Kurs --\n\n"
-        s += f"Name        : {self.name}\n"
-        s += f"Kursnummer  : {self.courseId}\n"
-        s += f"Beschreibung: {self.description}\n"
-        s += f"ECTS        : {self.ects}\n"
-        s += f"Gestartet am: {self.startedAt}\n"
-        s += f"Bestanden   : {self.passed()}\n"
-        s += f"Versuche    : {self.tries()}\n"
-        s += f"Note        : {self.getGrade()}\n"
-        for exam in self.exams:
-            s += exam.__str__()
-        return s
-
-    def shortRepresentation(self) -> str:
-        """
-        Repräsentation für UI (ohne Kurse und Headline)
-
-        Returns:
-            str: Stringrepräsentation des Objektes in Kurzform
-        """
-        s  = f"Name        : {self.name}\n"
-        s += f"Kursnummer  : {self.courseId}\n"
-        s += f"Beschreibung: {self.description}\n"
-        s += f"ECTS        : {self.ects}\n"
-        s += f"Gestartet am: {self.startedAt}\n"
-        s += f"Bestanden   : {self.passed()}\n"
-        s += f"Versuche    : {self.tries()}\n"
-        s += f"Note        : {self.getGrade()}\n"
-        return s
-
-    def __eq__(self,other) -> bool:
-        """
-        Gleichheit
-
-        Returns:
-            bool: True wenn beide gleich sind
-        """
-        return self.courseId == other.courseId
-
-    ######################################################################################################
-
-    def getFirstPassedExam(self) -> Optional[Exam]:
-        """
-        Gibt das erste gefundene Examen zurück, welches als bestanden markiert ist.
-
-        Returns:
-            Exam: Bzw. eines der Unterklassen oder None wenn kein Examen gefunden wurde
-        """
-        for exam in self.exams:
-            if exam.passed():
-                return exam
-        return None
-
-    def passed(self) -> str:
-        """
-        Prüft, ob der Kurs bereits bestanden wurde (es muss ein Exam verknüpft sein, welches als bestanden
-        markiert wurde).
-
-        Returns:
-            str: "Ja" / "Nein" / "Endgültig nicht"
-        """
-
-        #Prüfe, ob es ein bestandenes Examen gibt
-        if self.getFirstPassedExam() is not None:
-            return "Ja"
-
-        #Wenn es kein bestandenes Examen gibt und es 3 oder mehr Versuche sind, ist der Kurs endgültig
-        #nicht bestanden
-        if self.tries() >= 3:
-            return "Endgültig nicht"
-
-        #Wenn es kein bestandenes Examen gibt, aber noch weniger als 3 Versuche sind, kann der Kurs noch
-        #bestanden werden
-        return "Nein"
-    
-    def tries(self) -> int:
-        """
-        Wie viele Versuche für den Kurs bereits absolviert wurden (hängt an Anzahl verknüpfter Examen).
-
-        Returns:
-            int: Anzahl der Examen
-        """
-        return len(self.exams)
-
-    def getGrade(self) -> float:
-        """
-        Gibt die Note aus den Punkten zurück. Implementiert den Notenschlüssel der IU.
-
-        Returns:
-            float: 1.0, 1.3, 1.7 etc. / 0.0 wenn kein bestandenes Examen verknüpft ist
-        """
-
-        passedExam = self.getFirstPassedExam()
-        if passedExam is None:
-            return 0.0
-
-        grades = [
-            (96,100,1.0),
-            (91,95.9,1.3),
-            (86,90.9,1.7),
-            (81,85.9,2.0),
-            (76,80.9,2.3),
-            (71,75.9,2.7),
-            (66,70.9,3.0),
-            (61,65.9,3.3),
-            (56,60.9,3.7),
-            (50,55.9,4.0),
-            (0,49.9,5.0)
-        ]
-
-        for minPoints, maxPoints, grade in grades:
-            if minPoints <= passedExam.points() <= maxPoints:
-                return grade
-
-    ######################################################################################################
-    #-- Datenbank --
-
-    def saveToDB(self):
-        """
-        Speichert einen/den Course in die Datenbank.
-        """
-        DatabaseConnector.execute(
-            """
-            INSERT INTO courses (name,courseId,description,ects,startedAt) VALUES (?,?,?,?,?)
-            """,
-            (self.name,self.courseId,self.description,self.ects,self.startedAt,)
-        )
-
-    @staticmethod
-    def getAllFromDB() -> list:
-        """
-        Fragt alle Course-Objekte aus der Datenbank ab.
-
-        Returns:
-            list: Eine Liste mit Course-Objekten
-        """
-
-        #Alle Kurse aus DB abfragen
-        courseTuples = DatabaseConnector.query(
-            """
-            SELECT * FROM courses;
-            """
-        )
-
-        #Hole alle Exams aus der Datenbank
-        aws = AdvancedWorkbook.getAllFromDB()
-        cts = ClassTest.getAllFromDB()
-
-        #Rückgabe
-        courses = list()
-
-        #Aus DB geladene Tuple in Objekte parsen
-        for courseTuple in courseTuples:
-
-            #Um mehrfachzugriffe zu vermeiden
-            courseId = courseTuple[1]
-
-            #Suche alle Exams heraus, die zu der "courseId" des aktuellen Kurses passen
-            courseAws = [aw for aw in aws if aw.courseId == courseId]
-            courseCts = [ct for ct in cts if ct.courseId == courseId]
-
-            #Merge aller gefundenen Exams
-            examsForCourse = courseAws + courseCts
-
-            courses.append(
-                Course(
-                    courseTuple[0],
-                    courseId,
-                    courseTuple[2],
-                    courseTuple[3],
-                    examsForCourse,
-                    datetime.strptime(courseTuple[4],"%Y-%m-%d").date()
-                )   
-            )
-
-        return courses
\ No newline at end of file
+##########################################################################################################
+#
+# Course.py
+#
+# Ein zu überwachender Kurs.
+#
+##########################################################################################################
+
+from datetime import date
+
+from utils.DatabaseConnector import DatabaseConnector
+from utils.Metrics import Metrics
+from utils.Settings import Settings
+from utils.WriteBehind import WriteBehind
+
+from .exams.AdvancedWorkbook import AdvancedWorkbook
+from .exams.ClassTest import ClassTest
+from .exams.Exam import Exam
+from typing import Optional
+
+class Course:
+
+    #Feste Attribute statt "__dict__" (inkl. zwischengespeichertem, abgeleitetem Zustand)
+    __slots__ = (
+        "name","courseId","description","ects","_exams","startedAt",
+        "_revision","_derivedKey","_firstPassedExam","_grade"
+    )
+
+    def __init__(self,name:str,courseId:str,description:str,ects:int,
+        exams:list,startedAt:date = date.today()
+    ):
+        """
+        Konstruktor
+        
+        Args:
+            name (str)       : Der Kursname
+            courseId (str)   : Die Kursnummer / ID (kann Zahlen und Buchstaben haben) ; Ist PrimaryKey in DB
+            description (str): Beschreibung des Kurses und seiner Inhalte
+            ects (int)       : Wie viele ECTS der Kurs bringt
+            exams (list)     : Liste mit "Exam"-Objekten => Alle geschriebenen Prüfungen
+            startedAt (date) : Wann der Kurs gestartet wurde (Automatisch, kann manuell gesetzt werden)
+        """
+        self.name         = name
+        self.courseId     = courseId
+        self.description  = description
+        self.ects         = ects
+        self._exams       = exams #Siehe Property "exams"
+        self.startedAt    = startedAt
+
+        #Zwischengespeicherter, abgeleiteter Zustand (siehe "_refreshDerivedState"). "_revision" wird beim
+        #Setzen von "exams" und über "invalidate" erhöht.
+        self._revision        = 0
+        self._derivedKey      = None
+        self._firstPassedExam = None
+        self._grade           = 0.0
+
+    def __str__(self) -> str:
+        """
+        Repräsentation für UI
+
+        Returns:
+            str: Stringrepräsentation des Objektes
+        """
+        s  = "-- Kurs --\n\n"
+        s += f"Name        : {self.name}\n"
+        s += f"Kursnummer  : {self.courseId}\n"
+        s += f"Beschreibung: {self.description}\n"
+        s += f"ECTS        : {self.ects}\n"
+        s += f"Gestartet am: {self.startedAt}\n"
+        s += f"Bestanden   : {self.passed()}\n"
+        s += f"Versuche    : {self.tries()}\n"
+        s += f"Note        : {self.getGrade()}\n"
+        for exam in self.exams:
+            s += exam.__str__()
+        return s
+
+    def shortRepresentation(self) -> str:
+        """
+        Repräsentation für UI (ohne Kurse und Headline)
+
+        Returns:
+            str: Stringrepräsentation des Objektes in Kurzform
+        """
+        s  = f"Name        : {self.name}\n"
+        s += f"Kursnummer  : {self.courseId}\n"
+        s += f"Beschreibung: {self.description}\n"
+        s += f"ECTS        : {self.ects}\n"
+        s += f"Gestartet am: {self.startedAt}\n"
+        s += f"Bestanden   : {self.passed()}\n"
+        s += f"Versuche    : {self.tries()}\n"
+        s += f"Note        : {self.getGrade()}\n"
+        return s
+
+    def __eq__(self,other) -> bool:
+        """
+        Gleichheit
+
+        Returns:
+            bool: True wenn beide gleich sind
+        """
+        return self.courseId == other.courseId
+
+    ######################################################################################################
+
+    @property
+    def exams(self) -> list:
+        """
+        Liste mit "Exam"-Objekten => Alle geschriebenen Prüfungen
+        """
+        return self._exams
+
+    @exams.setter
+    def exams(self,exams:list):
+        """
+        Setzt die Exams (neue Liste => Abgeleiteter Zustand wird beim nächsten Zugriff neu berechnet).
+        """
+        self._exams = exams
+        self._revision += 1
+
+    def _refreshDerivedState(self):
+        """
+        Berechnet die von den Exams abgeleiteten Werte (erstes bestandenes Examen, Note) nur neu, wenn die
+        Exam-Liste neu gesetzt wurde oder eine andere Länge hat, "invalidate" aufgerufen wurde oder sich
+        "Settings._pointsToPass" bzw. der Notenschlüssel (nach Wert, siehe "GradingScheme.key") geändert haben.
+        Ansonsten werden die zwischengespeicherten Werte genutzt.
+        """
+        derivedKey = (self._revision,len(self._exams),Settings._pointsToPass,Settings._gradingScheme.key)
+        if derivedKey == self._derivedKey:
+            return
+
+        self._firstPassedExam = None
+        for exam in self.exams:
+            if exam.passed():
+                self._firstPassedExam = exam
+                break
+
+        self._grade = 0.0
+        if self._firstPassedExam is not None:
+            self._grade = Settings._gradingScheme.getGrade(self._firstPassedExam.points())
+
+        self._derivedKey = derivedKey
+
+    def invalidate(self):
+        """
+        Verwirft den zwischengespeicherten, abgeleiteten Zustand. Nur nötig, wenn ein Exam in der Liste
+        ausgetauscht oder nachträglich verändert wurde (neue Listen und geänderte Längen werden automatisch
+        erkannt).
+        """
+        self._revision += 1
+
+    def getFirstPassedExam(self) -> Optional[Exam]:
+        """
+        Gibt das erste gefundene Examen zurück, welches als bestanden markiert ist.
+
+        Returns:
+            Exam: Bzw. eines der Unterklassen oder None wenn kein Examen gefunden wurde
+        """
+        self._refreshDerivedState()
+        return self._firstPassedExam
+
+    def passed(self) -> str:
+        """
+        Prüft, ob der Kurs bereits bestanden wurde (es muss ein Exam verknüpft sein, welches als bestanden
+        markiert wurde).
+
+        Returns:
+            str: "Ja" / "Nein" / "Endgültig nicht"
+        """
+
+        #Prüfe, ob es ein bestandenes Examen gibt
+        if self.getFirstPassedExam() is not None:
+            return "Ja"
+
+        #Wenn es kein bestandenes Examen gibt und es 3 oder mehr Versuche sind, ist der Kurs endgültig
+        #nicht bestanden
+        if self.tries() >= 3:
+            return "Endgültig nicht"
+
+        #Wenn es kein bestandenes Examen gibt, aber noch weniger als 3 Versuche sind, kann der Kurs noch
+        #bestanden werden
+        return "Nein"
+    
+    def tries(self) -> int:
+        """
+        Wie viele Versuche für den Kurs bereits absolviert wurden (hängt an Anzahl verknüpfter Examen).
+
+        Returns:
+            int: Anzahl der Examen
+        """
+        return len(self.exams)
+
+    def getGrade(self) -> float:
+        """
+        Gibt die Note aus den Punkten zurück (Notenschlüssel aus "Settings._gradingScheme").
+
+        Returns:
+            float: 1.0, 1.3, 1.7 etc. / 0.0 wenn kein bestandenes Examen verknüpft ist
+        """
+        self._refreshDerivedState()
+        return self._grade
+
+    ######################################################################################################
+    #-- Datenbank --
+
+    def saveToDB(self,afterWrite = None):
+        """
+        Speichert einen/den Course in die Datenbank. Innerhalb von "DatabaseConnector.transaction" wird erst
+        am Ende der Transaktion committet, wenn "WriteBehind" läuft im Hintergrund.
+
+        Args:
+            afterWrite (callable): Siehe "WriteBehind.write" (OPTIONAL)
+
+        Returns:
+            Future: Siehe "WriteBehind.write" (None, wenn direkt geschrieben wurde)
+        """
+        return WriteBehind.write(
+            """
+            INSERT INTO courses (name,courseId,description,ects,startedAt) VALUES (?,?,?,?,?)
+            """,
+            (self.name,self.courseId,self.description,self.ects,self.startedAt,),
+            "Course",
+            afterWrite
+        )
+
+    @staticmethod
+    def fromRow(cursor,row:tuple):
+        """
+        Row-Factory für "DatabaseConnector.query" / "iterQuery": Erstellt das Objekt direkt aus einer Zeile der
+        Tabelle "courses" ("startedAt" bereits als date). Die Exams sind noch leer und werden vom Aufrufer gesetzt.
+
+        Args:
+            cursor (Cursor): Der Cursor (wird nicht benötigt, Vorgabe von sqlite3)
+            row (tuple)    : Die Zeile
+
+        Returns:
+            Course: Das Objekt
+        """
+        return Course(row[0],row[1],row[2],row[3],list(),row[4])
+
+    @staticmethod
+    def getAllFromDB() -> list:
+        """
+        Fragt alle Course-Objekte aus der Datenbank ab.
+
+        Returns:
+            list: Eine Liste mit Course-Objekten
+        """
+
+        #Alle Kurse aus DB abfragen (per "fromRow" direkt als Objekte, Exams werden unten gesetzt)
+        courses = DatabaseConnector.query(
+            """
+            SELECT * FROM courses;
+            """,
+            rowFactory=Course.fromRow
+        )
+
+        #Alle Exams aus der Datenbank holen und in einem Durchlauf nach "courseId" gruppieren, damit pro
+        #Kurs nicht erneut über alle Exams iteriert werden muss (linear statt Kurse x Exams)
+        examsByCourse = dict()
+        for examClass in (AdvancedWorkbook,ClassTest):
+            examCount = 0
+            for exam in examClass.iterFromDB():
+                examsByCourse.setdefault(exam.courseId, list()).append(exam)
+                examCount += 1
+            Metrics.increment("studytrack_models_hydrated",{"type": examClass.__name__},examCount)
+
+        #Exams den Kursen zuordnen
+        for course in courses:
+            course.exams = examsByCourse.get(course.courseId, list())
+
+        Metrics.increment("studytrack_models_hydrated",{"type": "Course"},len(courses))
+        return courses
+
+    @staticmethod
+    def getFromDB(courseId:str) -> Optional["Course"]:
+        """
+        Fragt einen einzelnen Kurs inkl. seiner Exams aus der Datenbank ab (nutzt die Indizes auf "courseId").
+
+        Args:
+            courseId (str): Die Kursnummer
+
+        Returns:
+            Course: Der Kurs oder None, wenn es keinen Kurs mit der Kursnummer gibt
+        """
+        courses = DatabaseConnector.query(
+            """
+            SELECT * FROM courses WHERE courseId = ?;
+            """,
+            (courseId,),
+            rowFactory=Course.fromRow
+        )
+        if len(courses) == 0:
+            return None
+
+        course = courses[0]
+        course.exams  = DatabaseConnector.query(
+            """
+            SELECT * FROM advancedworkbooks WHERE courseId = ? ORDER BY rowid;
+            """,
+            (courseId,),
+            rowFactory=AdvancedWorkbook.fromRow
+        )
+        course.exams += DatabaseConnector.query(
+            """
+            SELECT * FROM classtests WHERE courseId = ? ORDER BY rowid;
+            """,
+            (courseId,),
+            rowFactory=ClassTest.fromRow
+        )
+        return course
+
+    @staticmethod
+    def _takeExamsForCourse(exams,pendingExam:list,courseId:str) -> list:
+        """
+        Holt alle Exams eines Kurses aus einem nach "courseId" sortierten Exam-Iterator.
+
+        Args:
+            exams (Iterator)  : Nach "courseId" sortierte Exams (siehe "Exam.iterFromDB")
+            pendingExam (list): Ein-Element-Liste mit dem zuletzt gelesenen, noch nicht zugeordneten Exam
+            courseId (str)    : Die Kursnummer des aktuellen Kurses
+
+        Returns:
+            list: Die Exams des Kurses (in Reihenfolge der Datenbank)
+        """
+        courseExams = list()
+
+        #Exams ohne (vorhergehenden) Kurs überspringen
+        while pendingExam[0] is not None and pendingExam[0].courseId < courseId:
+            pendingExam[0] = next(exams,None)
+
+        while pendingExam[0] is not None and pendingExam[0].courseId == courseId:
+            courseExams.append(pendingExam[0])
+            pendingExam[0] = next(exams,None)
+
+        return courseExams
+
+    @staticmethod
+    def iterFromDB(arraysize:int = 1000):
+        """
+        Wie "getAllFromDB", liefert die Course-Objekte aber nacheinander (Generator), sortiert nach "courseId".
+        Kurse und Exams werden sortiert gelesen und zusammengeführt (Merge-Join), dadurch ist immer nur ein
+        Kurs mit seinen Exams im Speicher.
+
+        Args:
+            arraysize (int): Wie viele Zeilen auf einmal aus der Datenbank geholt werden
+
+        Returns:
+            Generator: Course-Objekte
+        """
+        courses = DatabaseConnector.iterQuery(
+            """
+            SELECT * FROM courses ORDER BY courseId;
+            """,
+            arraysize=arraysize,
+            rowFactory=Course.fromRow
+        )
+
+        aws = AdvancedWorkbook.iterFromDB(arraysize)
+        cts = ClassTest.iterFromDB(arraysize)
+        pendingAw = [next(aws,None)]
+        pendingCt = [next(cts,None)]
+
+        for course in courses:
+            course.exams  = Course._takeExamsForCourse(aws,pendingAw,course.courseId)
+            course.exams += Course._takeExamsForCourse(cts,pendingCt,course.courseId)
+            yield course
\ No newline at end of file
@@ -0,0 +1,299 @@
+##########################################################################################################
+#
+# CourseRepository.py
+#
+# Zwischenspeicher (Identity Map) für alle Kurse, damit die UI nicht bei jeder Seite die Datenbank abfragt.
+#
+##########################################################################################################
+
+import threading
+from typing import Optional
+
+from utils.DatabaseConnector import DatabaseConnector
+from utils.Metrics import Metrics
+from utils.Settings import Settings
+from utils.WriteBehind import WriteBehind
+
+from .Course import Course
+from .DashboardStats import DashboardStats
+from .exams.Exam import Exam
+
+class CourseRepository:
+    """
+    Statische Klasse, die alle Kurse einmalig aus der Datenbank lädt und danach aus dem Speicher liefert.
+
+    Pro "courseId" gibt es genau ein Course-Objekt (Identity Map). Änderungen laufen über die Methoden dieser
+    Klasse, die sowohl in die Datenbank schreiben als auch den Speicher aktualisieren (Write-Through). Die
+    Liste "Settings._student.courses" wird dabei synchron gehalten.
+
+    Läuft "WriteBehind", wird der Speicher sofort aktualisiert und die Datenbank erst im Hintergrund. Schlägt
+    das Schreiben fehl, meldet "WriteBehind.takeErrors" das, danach muss per "load" neu geladen werden (siehe
+    "ConsoleUI.drawMenu").
+    """
+
+    #"Private" Attribut: Alle geladenen Kurse, Schlüssel ist die "courseId" (Reihenfolge wie in der DB)
+    _courses = dict()
+
+    #"Private" Attribut: Ob die Kurse bereits aus der Datenbank geladen wurden
+    _loaded = False
+
+    #"Private" Attribut: Kennzahlen für das Dashboard, werden bei Änderungen inkrementell aktualisiert
+    _stats = None
+
+    #"Private" Attribute: Höchste Revision aus "course_revisions", die im Speicher berücksichtigt ist, und
+    #"PRAGMA data_version" beim letzten Abgleich (siehe "refresh")
+    _revision    = 0
+    _dataVersion = None
+
+    #"Private" Attribute: Revisionen aus Schreibvorgängen dieser Sitzung, die noch über "_revision" liegen (z.B.
+    #weil eine andere Sitzung dazwischen geschrieben hat). "refresh" lädt diese Kurse nicht neu. Wird ggf. aus
+    #dem Thread von "WriteBehind" geändert, daher "_revisionLock" (schützt auch "_revision").
+    _ownRevisions = set()
+    _revisionLock = threading.Lock()
+
+    ######################################################################################################
+
+    def __new__(cls):
+        """
+        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
+        """
+        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
+
+    ######################################################################################################
+    #-- Laden --
+
+    @staticmethod
+    def load():
+        """
+        Lädt alle Kurse (neu) aus der Datenbank, z.B. beim Start oder nach einem Import.
+        """
+
+        #Stand vor dem Laden merken: Was danach noch geändert wird, holt "refresh" (ggf. doppelt) nach
+        CourseRepository._dataVersion = DatabaseConnector.getDataVersion()
+        with CourseRepository._revisionLock:
+            CourseRepository._revision = CourseRepository._getRevision()
+            CourseRepository._ownRevisions = set()
+        CourseRepository._courses = {course.courseId: course for course in Course.getAllFromDB()}
+        CourseRepository._loaded = True
+        CourseRepository._stats = None
+        CourseRepository._syncStudent()
+
+    @staticmethod
+    def clear():
+        """
+        Verwirft alle geladenen Kurse, beim nächsten Zugriff wird neu aus der Datenbank geladen.
+        """
+        CourseRepository._courses = dict()
+        CourseRepository._loaded = False
+        CourseRepository._stats = None
+        CourseRepository._syncStudent()
+
+    @staticmethod
+    def _getRevision() -> int:
+        """
+        Gibt die höchste Revision aus "course_revisions" zurück.
+
+        Returns:
+            int: Die Revision (0, wenn noch nichts geändert wurde)
+        """
+        return DatabaseConnector.query("SELECT COALESCE(MAX(revision),0) FROM course_revisions;")[0][0]
+
+    @staticmethod
+    def _rememberRevision(courseId:str):
+        """
+        Merkt sich die Revision, die der eigene Schreibvorgang für einen Kurs erzeugt hat. Muss innerhalb der
+        Transaktion des Schreibvorgangs aufgerufen werden (siehe "afterWrite" bei "WriteBehind.write"), danach
+        könnte sie schon von einer anderen Sitzung stammen.
+
+        Args:
+            courseId (str): Die Kursnummer
+        """
+        rows = DatabaseConnector.query("SELECT revision FROM course_revisions WHERE courseId = ?;",(courseId,))
+        if len(rows) == 0:
+            return
+        with CourseRepository._revisionLock:
+            CourseRepository._ownRevisions.add(rows[0][0])
+
+            #Solange die Revisionen lückenlos von dieser Sitzung stammen, direkt weiterzählen
+            while CourseRepository._revision + 1 in CourseRepository._ownRevisions:
+                CourseRepository._revision += 1
+                CourseRepository._ownRevisions.discard(CourseRepository._revision)
+
+    @staticmethod
+    def refresh() -> int:
+        """
+        Übernimmt Änderungen anderer Sitzungen (z.B. ein zweites StudyTrack auf der gleichen Datenbank): Nur wenn
+        sich "PRAGMA data_version" geändert hat, werden die seit dem letzten Abgleich geänderten Kurse aus
+        "course_revisions" neu geladen (bzw. entfernt). Nach einem Massenimport wird alles neu geladen. Eigene
+        Schreibvorgänge (siehe "_rememberRevision") werden übersprungen.
+
+        Returns:
+            int: Anzahl der neu geladenen bzw. entfernten Kurse (0 = Nichts geändert)
+        """
+        if not CourseRepository._loaded:
+            return 0
+        dataVersion = DatabaseConnector.getDataVersion()
+        if dataVersion == CourseRepository._dataVersion:
+            return 0
+        CourseRepository._dataVersion = dataVersion
+
+        with CourseRepository._revisionLock:
+            revision = CourseRepository._revision
+        changes = DatabaseConnector.query(
+            "SELECT courseId, revision FROM course_revisions WHERE revision > ? ORDER BY revision;",(revision,)
+        )
+        if len(changes) == 0:
+            return 0
+
+        #Stand übernehmen, eigene Revisionen bis dahin sind damit erledigt
+        with CourseRepository._revisionLock:
+            CourseRepository._revision = max(CourseRepository._revision,changes[-1][1])
+            ownRevisions = CourseRepository._ownRevisions
+            CourseRepository._ownRevisions = {
+                revision for revision in ownRevisions if revision > CourseRepository._revision
+            }
+        changes = [(courseId, revision) for courseId, revision in changes if revision not in ownRevisions]
+        if len(changes) == 0:
+            return 0
+
+        #Massenimport (Zeile ohne "courseId", siehe "CourseStats.deferred") => Alles neu laden
+        if any(courseId is None for courseId, _ in changes):
+            CourseRepository.load()
+            return len(CourseRepository._courses)
+
+        for courseId, _ in changes:
+
+            #Bestehende Kurse behalten ihre Position, neue (höchste "rowid") kommen ans Ende
+            newCourse = Course.getFromDB(courseId)
+            if newCourse is not None:
+                CourseRepository._courses[courseId] = newCourse
+            else:
+                CourseRepository._courses.pop(courseId,None)
+
+        #Kennzahlen beim nächsten Zugriff neu berechnen (Änderungen anderer Sitzungen sind selten)
+        CourseRepository._stats = None
+        CourseRepository._syncStudent()
+        return len(changes)
+
+    @staticmethod
+    def _syncStudent():
+        """
+        Überträgt die Kurse in den Studenten (für Dashboard etc.).
+        """
+        Settings._student.courses = list(CourseRepository._courses.values())
+
+    ######################################################################################################
+    #-- Lesen --
+
+    @staticmethod
+    def getAll() -> list:
+        """
+        Gibt alle Kurse zurück (lädt nur beim ersten Zugriff aus der Datenbank).
+
+        Returns:
+            list: Eine Liste mit Course-Objekten
+        """
+        Metrics.cacheAccess("CourseRepository",CourseRepository._loaded)
+        if not CourseRepository._loaded:
+            CourseRepository.load()
+        return list(CourseRepository._courses.values())
+
+    @staticmethod
+    def get(courseId:str) -> Optional[Course]:
+        """
+        Gibt einen Kurs anhand seiner Kursnummer zurück.
+
+        Args:
+            courseId (str): Die Kursnummer
+
+        Returns:
+            Course: Der Kurs oder None, wenn es keinen Kurs mit der Kursnummer gibt
+        """
+        Metrics.cacheAccess("CourseRepository",CourseRepository._loaded)
+        if not CourseRepository._loaded:
+            CourseRepository.load()
+        return CourseRepository._courses.get(courseId)
+
+    @staticmethod
+    def getStats() -> DashboardStats:
+        """
+        Gibt die Kennzahlen für das Dashboard zurück. Sie werden nur beim ersten Zugriff (bzw. nach geänderten
+        Einstellungen) in einem Durchlauf berechnet und danach bei jeder Änderung inkrementell aktualisiert.
+
+        Returns:
+            DashboardStats: Die Kennzahlen
+        """
+        hit = CourseRepository._stats is not None and CourseRepository._stats.isCurrent()
+        Metrics.cacheAccess("DashboardStats",hit)
+        if not hit:
+            CourseRepository._stats = DashboardStats.fromCourses(CourseRepository.getAll())
+        return CourseRepository._stats
+
+    ######################################################################################################
+    #-- Schreiben --
+
+    @staticmethod
+    def add(course:Course) -> bool:
+        """
+        Speichert einen neuen Kurs in die Datenbank und in den Speicher.
+
+        Args:
+            course (Course): Der Kurs
+
+        Returns:
+            bool: True = Gespeichert / False = Kurs mit der Kursnummer ist bereits vorhanden
+        """
+        if CourseRepository.get(course.courseId) is not None:
+            return False
+        course.saveToDB(lambda: CourseRepository._rememberRevision(course.courseId))
+        CourseRepository._courses[course.courseId] = course
+        if CourseRepository._stats is not None:
+            CourseRepository._stats.addCourse(course)
+        CourseRepository._syncStudent()
+        return True
+
+    @staticmethod
+    def delete(courseId:str) -> bool:
+        """
+        Löscht einen Kurs aus der Datenbank (wie bisher nur aus der Tabelle "courses") und dem Speicher.
+
+        Args:
+            courseId (str): Die Kursnummer
+
+        Returns:
+            bool: True = Gelöscht / False = Kein Kurs mit der Kursnummer vorhanden
+        """
+        course = CourseRepository.get(courseId)
+        if course is None:
+            return False
+
+        #Ausstehende Schreibvorgänge erst schreiben, sonst würde z.B. der Kurs selbst nach dem Löschen eingefügt
+        WriteBehind.flush()
+        with DatabaseConnector.transaction():
+            DatabaseConnector.execute("DELETE FROM courses WHERE courseId = ?;",(courseId,))
+            CourseRepository._rememberRevision(courseId)
+        del CourseRepository._courses[courseId]
+        if CourseRepository._stats is not None:
+            CourseRepository._stats.removeCourse(course)
+        CourseRepository._syncStudent()
+        return True
+
+    @staticmethod
+    def addExam(exam:Exam) -> bool:
+        """
+        Speichert ein Exam in die Datenbank und hängt es an den geladenen Kurs an.
+
+        Args:
+            exam (Exam): Das Exam (bzw. eine der Unterklassen)
+
+        Returns:
+            bool: True = Gespeichert / False = Kein Kurs mit der Kursnummer des Exams vorhanden
+        """
+        course = CourseRepository.get(exam.courseId)
+        if course is None:
+            return False
+        exam.saveToDB(lambda: CourseRepository._rememberRevision(exam.courseId))
+        course.exams.append(exam)
+        if CourseRepository._stats is not None:
+            CourseRepository._stats.updateCourse(course)
+        return True
\ No newline at end of file
@@ -0,0 +1,121 @@
+##########################################################################################################
+#
+# CourseStats.py
+#
+# Zugriff auf die per Trigger gepflegte Zusammenfassung pro Kurs (Tabelle "course_stats").
+#
+##########################################################################################################
+
+from contextlib import contextmanager
+
+from utils.DatabaseConnector import DatabaseConnector
+from utils.Settings import Settings
+
+class CourseStats:
+    """
+    Statische Klasse für die Tabelle "course_stats" (siehe Migration 1 -> 2 in "DatabaseConnector").
+
+    Die Tabelle enthält pro Kurs Versuche, beste Punktzahl, Datum und Punkte des ersten bestandenen Exams,
+    Note und Bestanden-Status. SQLite-Trigger halten sie bei jedem INSERT / UPDATE / DELETE auf Kurse und
+    Exams aktuell, Abfragen müssen also keine Exams laden. Für Massenimporte können die Trigger per "deferred"
+    ausgesetzt werden.
+    """
+
+    def __new__(cls):
+        """
+        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
+        """
+        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
+
+    ######################################################################################################
+
+    @staticmethod
+    def sync() -> bool:
+        """
+        Überträgt "Settings._pointsToPass" und "Settings._gradingScheme" in die Datenbank, damit die Trigger
+        damit rechnen. Haben sich die Einstellungen geändert, wird die Zusammenfassung komplett neu berechnet.
+
+        Returns:
+            bool: True = Zusammenfassung wurde neu berechnet / False = Einstellungen waren aktuell
+        """
+        pointsToPass = DatabaseConnector.query("SELECT pointsToPass FROM course_stats_settings;")[0][0]
+        grades = DatabaseConnector.query("SELECT minPoints, grade FROM course_stats_grades ORDER BY minPoints;")
+        schemeGrades = [(float(minPoints),float(grade)) for minPoints, grade in Settings._gradingScheme.boundaries]
+
+        if pointsToPass == Settings._pointsToPass and grades == schemeGrades:
+            return False
+
+        with DatabaseConnector.transaction():
+            DatabaseConnector.execute("UPDATE course_stats_settings SET pointsToPass = ?;",(Settings._pointsToPass,))
+            DatabaseConnector.execute("DELETE FROM course_stats_grades;")
+            DatabaseConnector.executeMany(
+                "INSERT INTO course_stats_grades (minPoints,grade) VALUES (?,?);",
+                schemeGrades
+            )
+            CourseStats.rebuild()
+        return True
+
+    @staticmethod
+    def rebuild():
+        """
+        Berechnet die Zusammenfassung für alle Kurse neu.
+        """
+        with DatabaseConnector.transaction():
+            DatabaseConnector.execute("DELETE FROM course_stats;")
+            DatabaseConnector.execute("INSERT INTO course_stats SELECT * FROM course_stats_source;")
+
+    @staticmethod
+    @contextmanager
+    def deferred():
+        """
+        Kontextmanager für Massenimporte: Setzt die Trigger für die Dauer des "with"-Blocks aus und berechnet
+        die Zusammenfassung am Ende einmal komplett neu (statt pro Zeile). Alles läuft in einer Transaktion.
+        """
+        with DatabaseConnector.transaction():
+            DatabaseConnector.execute("UPDATE course_stats_settings SET deferred = 1;")
+            yield
+            DatabaseConnector.execute("UPDATE course_stats_settings SET deferred = 0;")
+            CourseStats.rebuild()
+
+            #Revisionen wurden ebenfalls ausgesetzt => Andere Sitzungen laden alles neu (Zeile ohne "courseId",
+            #siehe "course_revisions")
+            DatabaseConnector.execute("DELETE FROM course_revisions WHERE courseId IS NULL;")
+            DatabaseConnector.execute(
+                """
+                INSERT INTO course_revisions (courseId,revision)
+                VALUES (NULL,(SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions));
+                """
+            )
+
+    @staticmethod
+    def get(courseId:str):
+        """
+        Gibt die Zusammenfassung eines Kurses zurück.
+
+        Args:
+            courseId (str): Die Kursnummer
+
+        Returns:
+            tuple: (courseId, tries, bestPoints, firstPassedOn, firstPassedPoints, grade, passed) oder None
+        """
+        rows = DatabaseConnector.query("SELECT * FROM course_stats WHERE courseId = ?;",(courseId,))
+        return rows[0] if len(rows) > 0 else None
+
+    @staticmethod
+    def getOpenCourseIds() -> list:
+        """
+        Gibt die Kursnummern aller Kurse zurück, für die noch ein Exam eingetragen werden kann (noch nicht
+        bestanden und weniger als 3 Versuche), in der Reihenfolge der Kurse in der Datenbank.
+
+        Returns:
+            list: Liste mit Kursnummern
+        """
+        rows = DatabaseConnector.query(
+            """
+            SELECT s.courseId FROM course_stats s
+            JOIN courses c ON c.courseId = s.courseId
+            WHERE s.passed = 'Nein' AND s.tries < 3
+            ORDER BY c.rowid;
+            """
+        )
+        return [row[0] for row in rows]
\ No newline at end of file
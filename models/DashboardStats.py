@@ -0,0 +1,306 @@
+##########################################################################################################
+#
+# DashboardStats.py
+#
+# Die Kennzahlen des Dashboards, berechnet in einem Durchlauf über alle Kurse.
+#
+##########################################################################################################
+
+from typing import Optional
+
+from utils.DatabaseConnector import DatabaseConnector
+from utils.Settings import Settings
+
+from .Course import Course
+from .exams.Exam import Exam
+
+class DashboardStats:
+
+    #"Private" Attribut: Punkte-Spalten der Advanced Workbooks und maximal erreichbare Punkte (für "perCourseSQL",
+    #siehe "AdvancedWorkbook")
+    _workbookTasks = {"t1": 15,"t2": 15,"t3": 15,"t4": 15,"t5": 15,"t6": 15,"elaboration": 10}
+
+    def __init__(self):
+        """
+        Konstruktor (leere Statistik, Kurse über "addCourse" bzw. "fromCourses" hinzufügen)
+        """
+        self.courseCount     = 0    #Anzahl aller Kurse
+        self.passedCount     = 0    #Anzahl bestandener Kurse
+        self.ects            = 0    #Summe der ECTS aller bestandenen Kurse
+        self.overdueCourse   = None #Noch offener Kurs ("Nein"), der am längsten läuft
+        self.mostTriesCourse = None #Kurs mit den meisten Versuchen
+
+        #Summe der Noten aller bestandenen Kurse in Hundertsteln (ganzzahlig, damit beim inkrementellen
+        #Addieren und Subtrahieren keine Rundungsfehler entstehen)
+        self._gradeSumHundredths = 0
+
+        #Pro "courseId": [Position, Kurs, Bestanden-Status, Note] => Für inkrementelle Aktualisierung
+        self._entries = dict()
+        self._nextPosition = 0
+
+        #Mit welchen Einstellungen die Statistik berechnet wurde (siehe "isCurrent")
+        self._settingsKey = (Settings._pointsToPass,Settings._gradingScheme.key)
+
+    def __str__(self) -> str:
+        """
+        Repräsentation für UI
+
+        Returns:
+            str: Stringrepräsentation des Objektes
+        """
+        s  = "-- Dashboard-Statistik --\n\n"
+        s += f"Kurse            : {self.courseCount}\n"
+        s += f"Bestanden        : {self.passedCount}\n"
+        s += f"Notendurchschnitt: {self.averageGrade()}\n"
+        s += f"ECTS             : {self.ects}\n"
+        return s
+
+    ######################################################################################################
+
+    @staticmethod
+    def fromCourses(courses:list) -> "DashboardStats":
+        """
+        Berechnet alle Kennzahlen in einem Durchlauf über die Kurse.
+
+        Args:
+            courses (list): Liste mit Course-Objekten (z.B. "Settings._student.courses")
+
+        Returns:
+            DashboardStats: Die Statistik
+        """
+        stats = DashboardStats()
+        for course in courses:
+            stats.addCourse(course)
+        return stats
+
+    @staticmethod
+    def perCourseSQL(gradingScheme) -> str:
+        """
+        Gibt die WITH-Klausel zurück, die pro Kurs Versuche, Bestanden-Status und Note berechnet (Tabelle
+        "perCourse" mit den Spalten position, courseId, ects, startedAt, tries, passed, grade). Die Abfrage
+        braucht den Parameter ":pointsToPass".
+
+        Die Reihenfolge der Exams (erst Advanced Workbooks, dann Klausuren, jeweils nach "rowid") und der Kurse
+        ("rowid") entspricht der von "Course.getAllFromDB".
+
+        Args:
+            gradingScheme (GradingScheme): Der Notenschlüssel (z.B. "Settings._gradingScheme")
+
+        Returns:
+            str: "WITH ... perCourse AS (...)", danach folgt das eigentliche SELECT
+        """
+        #Punkte eingrenzen wie in den Konstruktoren der Exams (siehe "Exam.truncatePoints")
+        workbookPoints = " + ".join(
+            Exam.truncatePointsSQL(column,maxPoints) for column, maxPoints in DashboardStats._workbookTasks.items()
+        )
+        return f"""
+            WITH exams AS (
+                SELECT courseId, 0 AS examType, rowid AS position,
+                    {workbookPoints} AS points
+                FROM advancedworkbooks
+                UNION ALL
+                SELECT courseId, 1 AS examType, rowid AS position, {Exam.truncatePointsSQL("score",100)} AS points
+                FROM classtests
+            ),
+            tries AS (
+                SELECT courseId, COUNT(*) AS tries FROM exams GROUP BY courseId
+            ),
+            firstPassed AS (
+                SELECT courseId, points FROM (
+                    SELECT courseId, points,
+                        ROW_NUMBER() OVER (PARTITION BY courseId ORDER BY examType, position) AS passedNumber
+                    FROM exams
+                    WHERE points >= :pointsToPass
+                )
+                WHERE passedNumber = 1
+            ),
+            perCourse AS (
+                SELECT c.rowid AS position, c.courseId, c.ects, c.startedAt,
+                    COALESCE(t.tries,0) AS tries,
+                    CASE
+                        WHEN f.points IS NOT NULL THEN 'Ja'
+                        WHEN COALESCE(t.tries,0) >= 3 THEN 'Endgültig nicht'
+                        ELSE 'Nein'
+                    END AS passed,
+                    {gradingScheme.toSQL("f.points")} AS grade
+                FROM courses c
+                LEFT JOIN tries t ON t.courseId = c.courseId
+                LEFT JOIN firstPassed f ON f.courseId = c.courseId
+            )
+        """
+
+    @staticmethod
+    def fromDatabase() -> "DashboardStats":
+        """
+        Berechnet alle Kennzahlen direkt in SQLite (Aggregat- und Window-Funktionen), ohne vorher alle Kurse
+        und Exams als Objekte zu laden. Nur der "überfällige" Kurs und der Kurs mit den meisten Versuchen werden
+        danach einzeln geladen. Liefert die gleichen Werte wie "fromCourses" mit den Kursen aus der Datenbank,
+        kann aber nicht inkrementell aktualisiert werden.
+
+        Returns:
+            DashboardStats: Die Statistik
+        """
+        row = DatabaseConnector.query(
+            f"""
+            {DashboardStats.perCourseSQL(Settings._gradingScheme)}
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(passed = 'Ja'),0),
+                COALESCE(SUM(CASE WHEN passed = 'Ja' THEN CAST(ROUND(grade * 100) AS INTEGER) END),0),
+                COALESCE(SUM(CASE WHEN passed = 'Ja' THEN ects END),0),
+                (SELECT courseId FROM perCourse WHERE passed = 'Nein' ORDER BY startedAt, position LIMIT 1),
+                (SELECT courseId FROM perCourse ORDER BY tries DESC, position LIMIT 1)
+            FROM perCourse;
+            """,
+            {"pointsToPass": Settings._pointsToPass}
+        )[0]
+
+        stats = DashboardStats()
+        stats.courseCount, stats.passedCount, stats._gradeSumHundredths, stats.ects = row[0:4]
+        if row[4] is not None:
+            stats.overdueCourse = Course.getFromDB(row[4])
+        if row[5] is not None:
+            stats.mostTriesCourse = Course.getFromDB(row[5])
+        return stats
+
+    def isCurrent(self) -> bool:
+        """
+        Gibt an, ob die Statistik noch zu den Einstellungen (Punkte zum Bestehen, Notenschlüssel) passt.
+
+        Returns:
+            bool: True wenn ja / False wenn sie neu berechnet werden muss
+        """
+        return self._settingsKey == (Settings._pointsToPass,Settings._gradingScheme.key)
+
+    def averageGrade(self) -> Optional[float]:
+        """
+        Notendurchschnitt aller bestandenen Kurse.
+
+        Returns:
+            float: Der Durchschnitt (auf 2 Stellen gerundet) oder None, wenn noch kein Kurs bestanden wurde
+        """
+        if self.passedCount == 0:
+            return None
+        return round(self._gradeSumHundredths / 100 / self.passedCount,2)
+
+    def toDict(self) -> dict:
+        """
+        Die Kennzahlen als dict (z.B. für Exporte).
+
+        Returns:
+            dict: Die Kennzahlen, Kurse als "courseId"
+        """
+        return {
+            "courseCount": self.courseCount,
+            "passedCount": self.passedCount,
+            "averageGrade": self.averageGrade(),
+            "ects": self.ects,
+            "overdueCourse": None if self.overdueCourse is None else self.overdueCourse.courseId,
+            "mostTriesCourse": None if self.mostTriesCourse is None else self.mostTriesCourse.courseId
+        }
+
+    ######################################################################################################
+    #-- Inkrementelle Aktualisierung --
+
+    def _isBefore(self,course:Course,other:Optional[Course]) -> bool:
+        """
+        Ob ein Kurs in der Kursliste vor einem anderen steht (bei Gleichstand gewinnt wie bisher der erste).
+
+        Args:
+            course (Course): Der Kurs
+            other (Course) : Der andere Kurs oder None
+
+        Returns:
+            bool: True wenn "course" vorher kommt oder "other" None ist
+        """
+        return other is None or self._entries[course.courseId][0] < self._entries[other.courseId][0]
+
+    def _apply(self,course:Course,sign:int):
+        """
+        Addiert (sign = 1) bzw. subtrahiert (sign = -1) den Beitrag eines Kurses zu den Summen.
+
+        Args:
+            course (Course): Der Kurs (muss in "_entries" stehen)
+            sign (int)     : 1 oder -1
+        """
+        _, _, passed, grade = self._entries[course.courseId]
+        self.courseCount += sign
+        if passed == "Ja":
+            self.passedCount         += sign
+            self._gradeSumHundredths += sign * round(grade * 100)
+            self.ects                += sign * course.ects
+
+    def _considerCourse(self,course:Course):
+        """
+        Prüft, ob ein (neuer oder geänderter) Kurs der neue "überfällige" Kurs bzw. der Kurs mit den meisten
+        Versuchen ist.
+
+        Args:
+            course (Course): Der Kurs
+        """
+        if self._entries[course.courseId][2] == "Nein":
+            if (self.overdueCourse is None or course.startedAt < self.overdueCourse.startedAt or
+                (course.startedAt == self.overdueCourse.startedAt and self._isBefore(course,self.overdueCourse))
+            ):
+                self.overdueCourse = course
+
+        if (self.mostTriesCourse is None or course.tries() > self.mostTriesCourse.tries() or
+            (course.tries() == self.mostTriesCourse.tries() and self._isBefore(course,self.mostTriesCourse))
+        ):
+            self.mostTriesCourse = course
+
+    def _recomputeExtremes(self):
+        """
+        Sucht "überfälligen" Kurs und Kurs mit den meisten Versuchen neu (nur nötig, wenn einer von beiden
+        entfernt wurde oder nicht mehr in Frage kommt).
+        """
+        self.overdueCourse = None
+        self.mostTriesCourse = None
+        for _, course, _, _ in sorted(self._entries.values(),key=lambda entry: entry[0]):
+            self._considerCourse(course)
+
+    def addCourse(self,course:Course):
+        """
+        Nimmt einen Kurs (am Ende der Kursliste) in die Statistik auf.
+
+        Args:
+            course (Course): Der Kurs
+        """
+        self._entries[course.courseId] = [self._nextPosition,course,course.passed(),course.getGrade()]
+        self._nextPosition += 1
+        self._apply(course,1)
+        self._considerCourse(course)
+
+    def removeCourse(self,course:Course):
+        """
+        Entfernt einen Kurs aus der Statistik.
+
+        Args:
+            course (Course): Der Kurs
+        """
+        if course.courseId not in self._entries:
+            return
+        self._apply(course,-1)
+        del self._entries[course.courseId]
+        if course is self.overdueCourse or course is self.mostTriesCourse:
+            self._recomputeExtremes()
+
+    def updateCourse(self,course:Course):
+        """
+        Aktualisiert die Statistik, nachdem sich ein Kurs geändert hat (z.B. ein Exam eingetragen wurde).
+        Kostet O(1), außer der bisher "überfällige" Kurs ist nicht mehr offen.
+
+        Args:
+            course (Course): Der (bereits geänderte) Kurs
+        """
+        entry = self._entries[course.courseId]
+        self._apply(course,-1)
+        wasOverdue = course is self.overdueCourse
+        entry[2] = course.passed()
+        entry[3] = course.getGrade()
+        self._apply(course,1)
+
+        if wasOverdue and entry[2] != "Nein":
+            self._recomputeExtremes()
+        else:
+            self._considerCourse(course)
\ No newline at end of file
@@ -0,0 +1,251 @@
+##########################################################################################################
+#
+# ExamScoreStore.py
+#
+# Spaltenweiser Speicher für die Punkte vieler Exams (für Auswertungen über sehr viele Exams).
+#
+##########################################################################################################
+
+from array import array
+from datetime import date
+
+from utils.DatabaseConnector import DatabaseConnector
+from utils.Settings import Settings
+
+from .exams.AdvancedWorkbook import AdvancedWorkbook
+from .exams.Exam import Exam
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class ExamScoreStore:
+    """
+    Hält die Daten vieler Exams nicht als einzelne Objekte, sondern spaltenweise in zusammenhängenden
+    Arrays ("array"-Modul). Punkte, Bestanden-Status und Noten werden für alle Exams auf einmal berechnet,
+    ist NumPy installiert vektorisiert (die Arrays werden dafür ohne Kopie als NumPy-Arrays gelesen).
+
+    Beide Prüfungsarten stehen in denselben Spalten: Bei Klausuren sind die Aufgaben 0, bei Advanced Workbooks
+    ist "score" 0. Die Punkte eines Exams sind damit immer die Summe aller Punkte-Spalten.
+    """
+
+    #"Private" Attribut: Namen der Punkte-Spalten (Summe = Punkte des Exams) und maximal erreichbare Punkte
+    #(siehe "Exam.truncatePoints")
+    _pointColumns = {"t1": 15,"t2": 15,"t3": 15,"t4": 15,"t5": 15,"t6": 15,"elaboration": 10,"score": 100}
+
+    def __init__(self):
+        """
+        Konstruktor (leerer Speicher, Exams über "append" bzw. "fromExams" / "fromDatabase" hinzufügen)
+        """
+        self.examTypes   = array("b") #0 = Advanced Workbook / 1 = Klausur
+        self.courseCodes = array("l") #Index in "courseIds"
+        self.writtenOn   = array("l") #Datum als Ordinalzahl (siehe "date.toordinal")
+        self.columns     = {column: array("h") for column in ExamScoreStore._pointColumns}
+
+        #Kursnummern, die Exams verweisen über "courseCodes" darauf (jede Kursnummer nur einmal im Speicher)
+        self.courseIds    = list()
+        self._courseCodes = dict()
+
+    def __len__(self) -> int:
+        """
+        Anzahl der Exams im Speicher.
+
+        Returns:
+            int: Anzahl
+        """
+        return len(self.examTypes)
+
+    def __str__(self) -> str:
+        """
+        Repräsentation für UI
+
+        Returns:
+            str: Stringrepräsentation des Objektes
+        """
+        summary = self.summary()
+        s  = "-- Exams (spaltenweise) --\n\n"
+        s += f"Exams            : {summary['examCount']}\n"
+        s += f"Kurse            : {summary['courseCount']}\n"
+        s += f"Bestanden        : {summary['passedCount']}\n"
+        s += f"Punkte im Schnitt: {summary['averagePoints']}\n"
+        s += f"Note im Schnitt  : {summary['averageGrade']}\n"
+        return s
+
+    ######################################################################################################
+    #-- Befüllen --
+
+    def _courseCode(self,courseId:str) -> int:
+        """
+        Gibt den Index einer Kursnummer in "courseIds" zurück (legt ihn bei Bedarf an).
+
+        Args:
+            courseId (str): Die Kursnummer
+
+        Returns:
+            int: Der Index
+        """
+        code = self._courseCodes.get(courseId)
+        if code is None:
+            code = len(self.courseIds)
+            self._courseCodes[courseId] = code
+            self.courseIds.append(courseId)
+        return code
+
+    def _appendRow(self,examType:int,writtenOn:date,courseId:str,points:tuple):
+        """
+        Hängt ein Exam an alle Spalten an.
+
+        Args:
+            examType (int)  : 0 = Advanced Workbook / 1 = Klausur
+            writtenOn (date): Tag an dem das Exam gemacht wurde
+            courseId (str)  : Die Kursnummer
+            points (tuple)  : Werte für die Punkte-Spalten (Reihenfolge wie "_pointColumns")
+        """
+        self.examTypes.append(examType)
+        self.courseCodes.append(self._courseCode(courseId))
+        self.writtenOn.append(writtenOn.toordinal())
+        for column, value in zip(self.columns.values(),points):
+            column.append(value)
+
+    def append(self,exam:Exam):
+        """
+        Hängt ein Exam an.
+
+        Args:
+            exam (Exam): Das Exam (Advanced Workbook oder Klausur)
+        """
+        if isinstance(exam,AdvancedWorkbook):
+            self._appendRow(0,exam.writtenOn,exam.courseId,(
+                exam.t1,exam.t2,exam.t3,exam.t4,exam.t5,exam.t6,exam.elaboration,0
+            ))
+        else:
+            self._appendRow(1,exam.writtenOn,exam.courseId,(0,0,0,0,0,0,0,exam.points()))
+
+    @staticmethod
+    def fromExams(exams) -> "ExamScoreStore":
+        """
+        Erstellt den Speicher aus bereits geladenen Exams.
+
+        Args:
+            exams (iterable): Exam-Objekte (z.B. aus "Course.exams")
+
+        Returns:
+            ExamScoreStore: Der Speicher
+        """
+        store = ExamScoreStore()
+        for exam in exams:
+            store.append(exam)
+        return store
+
+    @staticmethod
+    def fromDatabase(arraysize:int = 1000) -> "ExamScoreStore":
+        """
+        Liest alle Exams direkt aus der Datenbank in die Spalten, ohne Exam-Objekte zu erstellen. Erst alle
+        Advanced Workbooks, dann alle Klausuren, jeweils nach Kurs und Eintragungsreihenfolge sortiert.
+
+        Args:
+            arraysize (int): Wie viele Zeilen pro "fetchmany" gelesen werden
+
+        Returns:
+            ExamScoreStore: Der Speicher
+        """
+        #Punkte eingrenzen wie in den Konstruktoren der Exams (sonst weichen die Ergebnisse von "fromExams" ab)
+        columns = {
+            column: Exam.truncatePointsSQL(column,maxPoints)
+            for column, maxPoints in ExamScoreStore._pointColumns.items()
+        }
+
+        store = ExamScoreStore()
+        for row in DatabaseConnector.iterQuery(
+            f"SELECT writtenOn, courseId, {columns['t1']}, {columns['t2']}, {columns['t3']}, {columns['t4']}, "
+            f"{columns['t5']}, {columns['t6']}, {columns['elaboration']} FROM advancedworkbooks "
+            "ORDER BY courseId, rowid;",arraysize=arraysize
+        ):
+            store._appendRow(0,row[0],row[1],(*row[2:],0))
+        for row in DatabaseConnector.iterQuery(
+            f"SELECT writtenOn, courseId, {columns['score']} FROM classtests ORDER BY courseId, rowid;",
+            arraysize=arraysize
+        ):
+            store._appendRow(1,row[0],row[1],(0,0,0,0,0,0,0,row[2]))
+        return store
+
+    ######################################################################################################
+    #-- Auswertung (für alle Exams auf einmal) --
+
+    def points(self):
+        """
+        Punkte (von 100) aller Exams.
+
+        Returns:
+            misc: NumPy-Array (wenn installiert) oder "array.array" mit den Punkten
+        """
+        if numpy is not None:
+            points = numpy.zeros(len(self),dtype=numpy.int16)
+            for column in self.columns.values():
+                points += numpy.frombuffer(column,dtype=numpy.int16)
+            return points
+        return array("h",map(sum,zip(*self.columns.values())))
+
+    def passedFlags(self,points = None):
+        """
+        Bestanden-Status aller Exams (ab "Settings._pointsToPass" Punkten).
+
+        Args:
+            points (misc): Bereits berechnete Punkte (Rückgabe von "points"), sonst werden sie berechnet
+
+        Returns:
+            misc: NumPy-Array mit bool (wenn installiert) oder "array.array" mit 1 / 0
+        """
+        if points is None:
+            points = self.points()
+        pointsToPass = Settings._pointsToPass
+        if numpy is not None:
+            return points >= pointsToPass
+        return array("b",[value >= pointsToPass for value in points])
+
+    def grades(self,points = None):
+        """
+        Noten aller Exams nach "Settings._gradingScheme".
+
+        Args:
+            points (misc): Bereits berechnete Punkte (Rückgabe von "points"), sonst werden sie berechnet
+
+        Returns:
+            misc: NumPy-Array (wenn installiert) oder Liste mit den Noten
+        """
+        if points is None:
+            points = self.points()
+        return Settings._gradingScheme.getGrades(points)
+
+    def summary(self) -> dict:
+        """
+        Kennzahlen über alle Exams im Speicher (Punkte und Noten werden dafür nur einmal berechnet).
+
+        Returns:
+            dict: Anzahl Exams und Kurse, Anzahl bestandener Exams, Durchschnitt von Punkten und Noten
+                  (Durchschnitte auf 2 Stellen gerundet, None wenn der Speicher leer ist)
+        """
+        examCount = len(self)
+        if examCount == 0:
+            return {"examCount": 0,"courseCount": 0,"passedCount": 0,"averagePoints": None,"averageGrade": None}
+
+        points = self.points()
+        passedFlags = self.passedFlags(points)
+        grades = self.grades(points)
+        if numpy is not None:
+            passedCount = int(passedFlags.sum())
+            pointSum = int(points.sum(dtype=numpy.int64))
+            gradeSum = float(grades.sum())
+        else:
+            passedCount = sum(passedFlags)
+            pointSum = sum(points)
+            gradeSum = sum(grades)
+
+        return {
+            "examCount": examCount,
+            "courseCount": len(self.courseIds),
+            "passedCount": passedCount,
+            "averagePoints": round(pointSum / examCount,2),
+            "averageGrade": round(gradeSum / examCount,2)
+        }
\ No newline at end of file
@@ -0,0 +1,125 @@
+##########################################################################################################
+#
+# GradingScheme.py
+#
+# Ein Notenschlüssel, der Punkte (von 100) in Noten umrechnet.
+#
+##########################################################################################################
+
+from bisect import bisect_right
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class GradingScheme:
+
+    def __init__(self,name:str,boundaries:list,maxPoints:int = 100):
+        """
+        Konstruktor. Die Noten werden einmalig für jede ganze Punktzahl vorberechnet (Tabelle), damit eine
+        Abfrage nur noch ein Index-Zugriff ist.
+
+        Args:
+            name (str)       : Name des Notenschlüssels
+            boundaries (list): Liste mit Tupeln (Mindestpunktzahl, Note), z.B. [(96,1.0),(91,1.3),...,(0,5.0)]
+                               => Eine Note gilt ab ihrer Mindestpunktzahl bis zur nächsthöheren Grenze
+            maxPoints (int)  : Maximal erreichbare Punktzahl
+        """
+        self.name       = name
+        self.boundaries = sorted(boundaries)
+        self.maxPoints  = maxPoints
+
+        #Vergleichswert nach Inhalt (z.B. für Zwischenspeicher, "id" kann nach dem Löschen wiederverwendet werden)
+        self.key = (tuple(tuple(boundary) for boundary in self.boundaries),maxPoints)
+
+        if len(self.boundaries) == 0 or self.boundaries[0][0] > 0:
+            raise ValueError("Der Notenschlüssel muss eine Note ab 0 Punkten enthalten!")
+
+        #Für "bisect": Aufsteigende Mindestpunktzahlen und die zugehörigen Noten
+        self._minPoints = [minPoints for minPoints, _ in self.boundaries]
+        self._grades    = [grade for _, grade in self.boundaries]
+
+        #Vorberechnete Note für jede ganze Punktzahl von 0 bis "maxPoints"
+        self._table = [self._gradeByBisect(points) for points in range(maxPoints + 1)]
+
+    def __str__(self) -> str:
+        """
+        Repräsentation für UI
+
+        Returns:
+            str: Stringrepräsentation des Objektes
+        """
+        s = f"-- Notenschlüssel '{self.name}' --\n\n"
+        for minPoints, grade in reversed(self.boundaries):
+            s += f"Ab {minPoints:>5} Punkten: {grade}\n"
+        return s
+
+    ######################################################################################################
+
+    def _gradeByBisect(self,points:float) -> float:
+        """
+        Sucht die Note per binärer Suche über die Mindestpunktzahlen.
+
+        Args:
+            points (float): Die erreichten Punkte
+
+        Returns:
+            float: Die Note
+        """
+        return self._grades[max(bisect_right(self._minPoints,points) - 1,0)]
+
+    def getGrade(self,points:float) -> float:
+        """
+        Gibt die Note für eine Punktzahl zurück. Ganze Punktzahlen werden direkt in der Tabelle nachgeschlagen,
+        alle anderen per binärer Suche (damit auch z.B. 95.95 korrekt eingeordnet wird).
+
+        Args:
+            points (float): Die erreichten Punkte (werden auf 0 bis "maxPoints" begrenzt)
+
+        Returns:
+            float: Die Note
+        """
+        points = min(max(points,0),self.maxPoints)
+        if type(points) is int:
+            return self._table[points]
+        return self._gradeByBisect(points)
+
+    def getGrades(self,scores):
+        """
+        Gibt die Noten für viele Punktzahlen auf einmal zurück (z.B. für Auswertungen). Ist NumPy installiert
+        und wird ein NumPy-Array übergeben, wird vektorisiert gerechnet.
+
+        Args:
+            scores (misc): Liste, "array.array" oder NumPy-Array mit Punktzahlen
+
+        Returns:
+            misc: NumPy-Array bei NumPy-Eingabe, sonst eine Liste mit den Noten
+        """
+        if numpy is not None and isinstance(scores,numpy.ndarray):
+            scores = numpy.clip(scores,0,self.maxPoints)
+            indices = numpy.searchsorted(self._minPoints,scores,side="right") - 1
+            return numpy.asarray(self._grades)[numpy.maximum(indices,0)]
+
+        table = self._table
+        maxPoints = self.maxPoints
+        return [
+            table[min(max(points,0),maxPoints)] if type(points) is int else self.getGrade(points)
+            for points in scores
+        ]
+
+    def toSQL(self,pointsExpression:str) -> str:
+        """
+        Gibt den Notenschlüssel als SQL-Ausdruck zurück (für Auswertungen direkt in der Datenbank).
+
+        Args:
+            pointsExpression (str): SQL-Ausdruck für die Punkte, z.B. "points"
+
+        Returns:
+            str: "CASE WHEN points >= 96 THEN 1.0 WHEN ... ELSE 5.0 END"
+        """
+        s = "CASE"
+        for minPoints, grade in reversed(self.boundaries[1:]):
+            s += f" WHEN {pointsExpression} >= {float(minPoints)!r} THEN {float(grade)!r}"
+        s += f" ELSE {float(self.boundaries[0][1])!r} END"
+        return s
\ No newline at end of file
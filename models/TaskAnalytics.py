@@ -0,0 +1,260 @@
+##########################################################################################################
+#
+# TaskAnalytics.py
+#
+# Verteilung der Punkte pro Aufgabe der Advanced Workbooks (welche Aufgaben kosten die meisten Punkte?).
+#
+##########################################################################################################
+
+from math import ceil
+from typing import Optional
+
+from utils.DatabaseConnector import DatabaseConnector
+from utils.Metrics import Metrics
+
+from .exams.Exam import Exam
+
+class TaskDistribution:
+
+    def __init__(self,task:str,maxPoints:int,histogram:Optional[list] = None):
+        """
+        Konstruktor
+
+        Args:
+            task (str)      : Die Spalte der Aufgabe, z.B. "t1" oder "elaboration"
+            maxPoints (int) : Maximal erreichbare Punkte in der Aufgabe
+            histogram (list): Anzahl Workbooks pro erreichter Punktzahl (OPTIONAL, sonst leer und über "add"
+                              befüllen)
+        """
+        self.task      = task
+        self.maxPoints = maxPoints
+        self.histogram = histogram if histogram is not None else [0] * (maxPoints + 1) #Index = Punkte
+        self.count     = sum(self.histogram) #Anzahl Workbooks insgesamt
+
+    def __str__(self) -> str:
+        """
+        Repräsentation für UI
+
+        Returns:
+            str: Stringrepräsentation des Objektes (eine Zeile)
+        """
+        if self.count == 0:
+            return f"{self.task:<12}: Keine Daten"
+        return (
+            f"{self.task:<12}: Schnitt {self.mean():>5.2f} / {self.maxPoints:<2} | Median {self.percentile(50):>2} "
+            f"| 10% {self.percentile(10):>2} | 90% {self.percentile(90):>2} | Verlust {self.lostPoints():>5.2f}"
+        )
+
+    ######################################################################################################
+
+    def add(self,points:int,count:int = 1):
+        """
+        Zählt eine Punktzahl (bzw. mehrere Workbooks mit der gleichen Punktzahl).
+
+        Args:
+            points (int): Die erreichten Punkte in der Aufgabe
+            count (int) : Wie viele Workbooks diese Punktzahl haben
+        """
+        self.histogram[points] += count
+        self.count += count
+
+    def mean(self) -> Optional[float]:
+        """
+        Durchschnittliche Punkte in der Aufgabe.
+
+        Returns:
+            float: Der Durchschnitt oder None, wenn es keine Daten gibt
+        """
+        if self.count == 0:
+            return None
+        return sum(points * count for points, count in enumerate(self.histogram)) / self.count
+
+    def percentile(self,percent:float) -> Optional[int]:
+        """
+        Perzentil der Punkte (Nearest-Rank, d.h. immer eine tatsächlich erreichte Punktzahl).
+
+        Args:
+            percent (float): 0 bis 100, z.B. 50 für den Median
+
+        Returns:
+            int: Die Punktzahl, die von "percent" Prozent der Workbooks höchstens erreicht wurde oder None,
+                 wenn es keine Daten gibt
+        """
+        if self.count == 0:
+            return None
+        rank = max(ceil(percent / 100 * self.count),1)
+        cumulative = 0
+        for points, count in enumerate(self.histogram):
+            cumulative += count
+            if cumulative >= rank:
+                return points
+        return self.maxPoints
+
+    def lostPoints(self) -> Optional[float]:
+        """
+        Wie viele Punkte in der Aufgabe im Schnitt verloren gehen (maximal erreichbare minus Durchschnitt).
+
+        Returns:
+            float: Die verlorenen Punkte oder None, wenn es keine Daten gibt
+        """
+        mean = self.mean()
+        return None if mean is None else self.maxPoints - mean
+
+class TaskAnalytics:
+    """
+    Statische Klasse für die Auswertung der Aufgaben "t1" bis "t6" und "elaboration" aller Advanced Workbooks,
+    pro Kurs und insgesamt.
+
+    Die Histogramme werden in einem Durchlauf über die Zeilen der Tabelle gezählt (nur die Aufgaben-Spalten,
+    ohne AdvancedWorkbook-Objekte zu erstellen). Durchschnitt und Perzentile ergeben sich aus den Histogrammen.
+    Das Ergebnis wird zwischengespeichert, bis sich die Datenbank ändert (siehe
+    "DatabaseConnector.getChangeToken").
+    """
+
+    #"Private" Attribut: Spalten der Aufgaben und maximal erreichbare Punkte (siehe "AdvancedWorkbook")
+    _tasks = {"t1": 15,"t2": 15,"t3": 15,"t4": 15,"t5": 15,"t6": 15,"elaboration": 10}
+
+    #"Private" Attribut: Zwischengespeichertes Ergebnis von "_compute" => (Histogramme insgesamt, pro Kurs)
+    _cache = None
+
+    #"Private" Attribut: Stand der Datenbank, zu dem "_cache" berechnet wurde
+    _cacheToken = None
+
+    ######################################################################################################
+
+    def __new__(cls):
+        """
+        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
+        """
+        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
+
+    ######################################################################################################
+
+    @staticmethod
+    def _distributions(histograms:list) -> dict:
+        """
+        Erstellt die Verteilungen aller Aufgaben aus den aneinandergehängten Histogrammen (siehe "_compute").
+
+        Args:
+            histograms (list): Histogramme aller Aufgaben hintereinander (Reihenfolge wie "_tasks") oder None
+                               für leere Verteilungen
+
+        Returns:
+            dict: Spalte der Aufgabe => TaskDistribution
+        """
+        distributions = dict()
+        offset = 0
+        for task, maxPoints in TaskAnalytics._tasks.items():
+            histogram = None if histograms is None else histograms[offset:offset + maxPoints + 1]
+            distributions[task] = TaskDistribution(task,maxPoints,histogram)
+            offset += maxPoints + 1
+        return distributions
+
+    @staticmethod
+    def _compute() -> tuple:
+        """
+        Zählt die Histogramme aller Aufgaben pro Kurs und insgesamt in einem Durchlauf.
+
+        Pro Kurs gibt es nur eine flache Liste mit den Histogrammen aller Aufgaben hintereinander, die
+        TaskDistribution-Objekte werden erst bei Bedarf erstellt (bei sehr vielen Kursen zu teuer).
+
+        Returns:
+            tuple: (Histogramme insgesamt, dict "courseId" => Histogramme des Kurses)
+        """
+
+        #Position der Aufgabe in der Liste => Index = Position + Punkte
+        offsets = list()
+        size = 0
+        for maxPoints in TaskAnalytics._tasks.values():
+            offsets.append(size)
+            size += maxPoints + 1
+        columns = list(zip(range(1,len(offsets) + 1),offsets,TaskAnalytics._tasks.values()))
+
+        overall = [0] * size
+        perCourse = dict()
+        for row in DatabaseConnector.iterQuery(
+            f"SELECT courseId, {', '.join(TaskAnalytics._tasks)} FROM advancedworkbooks;"
+        ):
+            histograms = perCourse.get(row[0])
+            if histograms is None:
+                histograms = [0] * size
+                perCourse[row[0]] = histograms
+            for column, offset, maxPoints in columns:
+
+                #Eingrenzen wie in "AdvancedWorkbook" (sonst landet ein Wert außerhalb im Histogramm der
+                #nächsten Aufgabe)
+                index = offset + Exam.truncatePoints(row[column],maxPoints)
+                histograms[index] += 1
+                overall[index] += 1
+        return overall, perCourse
+
+    @staticmethod
+    def _getCached() -> tuple:
+        """
+        Gibt das zwischengespeicherte Ergebnis zurück bzw. berechnet es neu, wenn sich die Datenbank seitdem
+        geändert hat.
+
+        Returns:
+            tuple: Siehe "_compute"
+        """
+        token = DatabaseConnector.getChangeToken()
+        hit = TaskAnalytics._cache is not None and TaskAnalytics._cacheToken == token
+        Metrics.cacheAccess("TaskAnalytics",hit)
+        if not hit:
+            TaskAnalytics._cache = TaskAnalytics._compute()
+            TaskAnalytics._cacheToken = token
+        return TaskAnalytics._cache
+
+    @staticmethod
+    def invalidate():
+        """
+        Verwirft das zwischengespeicherte Ergebnis (z.B. nach einem Wechsel der Datenbank).
+        """
+        TaskAnalytics._cache = None
+        TaskAnalytics._cacheToken = None
+
+    @staticmethod
+    def get(courseId:Optional[str] = None) -> dict:
+        """
+        Gibt die Verteilung der Punkte pro Aufgabe zurück.
+
+        Args:
+            courseId (str): Nur die Workbooks dieses Kurses (OPTIONAL, sonst alle Workbooks)
+
+        Returns:
+            dict: Spalte der Aufgabe => TaskDistribution (leere Verteilungen, wenn es keine Workbooks gibt)
+        """
+        overall, perCourse = TaskAnalytics._getCached()
+        if courseId is None:
+            return TaskAnalytics._distributions(overall)
+        return TaskAnalytics._distributions(perCourse.get(courseId))
+
+    @staticmethod
+    def getPerCourse() -> dict:
+        """
+        Gibt die Verteilung der Punkte pro Aufgabe für alle Kurse mit mindestens einem Workbook zurück (erstellt
+        für jeden Kurs neue TaskDistribution-Objekte, für einzelne Kurse besser "get" nutzen).
+
+        Returns:
+            dict: "courseId" => dict Spalte der Aufgabe => TaskDistribution
+        """
+        return {
+            courseId: TaskAnalytics._distributions(histograms)
+            for courseId, histograms in TaskAnalytics._getCached()[1].items()
+        }
+
+    @staticmethod
+    def getCostliestTasks(courseId:Optional[str] = None) -> list:
+        """
+        Gibt die Aufgaben sortiert nach den im Schnitt verlorenen Punkten zurück (teuerste zuerst).
+
+        Args:
+            courseId (str): Nur die Workbooks dieses Kurses (OPTIONAL, sonst alle Workbooks)
+
+        Returns:
+            list: Liste mit TaskDistribution-Objekten (ohne Aufgaben ohne Daten)
+        """
+        distributions = [
+            distribution for distribution in TaskAnalytics.get(courseId).values() if distribution.count > 0
+        ]
+        return sorted(distributions,key=lambda distribution: distribution.lostPoints(),reverse=True)
\ No newline at end of file
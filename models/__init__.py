@@ -1,5 +1,10 @@
-from .Course import Course
-from .Student import Student
-
-from .exams.Exam import Exam
+from .Course import Course
+from .Student import Student
+from .CourseRepository import CourseRepository
+from .CourseStats import CourseStats
+from .DashboardStats import DashboardStats
+from .ExamScoreStore import ExamScoreStore
+from .TaskAnalytics import TaskAnalytics
+
+from .exams.Exam import Exam
 from .exams.AdvancedWorkbook import AdvancedWorkbook
\ No newline at end of file
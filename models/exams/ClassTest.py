@@ -1,83 +1,102 @@
-##########################################################################################################
-#
-# ClassTest.py
-#
-# Eine konkrete Klasse von "Exam". Implementiert eine Klausur.
-#
-##########################################################################################################
-
-from datetime import date, datetime
-
-from .Exam import Exam
-from utils.DatabaseConnector import DatabaseConnector
-
-class ClassTest(Exam):
-
-    def __init__(self,writtenOn:date,courseId:str,score:int):
-        """
-        Konstruktor
-
-        Args:
-            writtenOn (date): Siehe Konstruktor Exam
-            courseId (str)  : Siehe Konstruktor Exam
-            score (int)     : Wie viele Punkte in der Klausur insgesamt erreicht wurden
-        """
-        super().__init__(writtenOn,courseId)
-        self.score = Exam.truncatePoints(score,100)
-
-    def __str__(self) -> str:
-        """
-        Überschreibe: Repräsentation für UI
-
-        Returns:
-            str: Stringrepräsentation des Objektes
-        """
-        s  = "\n-- Klausur --\n\n"
-        s += super().__str__() + "\n"
-        return s
-
-    def points(self) -> int:
-        """
-        Implementiert die abstrakte Methode "points" von "Exam".
-        """
-        return self.score
-    
-    def saveToDB(self):
-        """
-        Implementiert die abstrakte Methode "saveToDB" von "Exam".
-        """
-        DatabaseConnector.execute(
-            """
-            INSERT INTO classtests (
-                writtenOn,courseId,score
-            )
-            VALUES (?,?,?)
-            """,
-            (self.writtenOn,self.courseId,self.score,)
-        )
-
-    def getAllFromDB() -> list:
-        """
-        Implementiert die abstrakte, statische Methode "getAllFromDB" von "Exam"
-        """
-
-        #Alle Kurse aus DB abfragen
-        examTuples = DatabaseConnector.query(
-            """
-            SELECT * FROM classtests;
-            """
-        )
-
-        #Rückgabe
-        exams = list()
-
-        #Aus DB geladene Tuple in Objekte parsen
-        for examTuple in examTuples:
-            exams.append(
-                ClassTest(
-                    datetime.strptime(examTuple[0], "%Y-%m-%d").date(),
-                    examTuple[1],
-                    examTuple[2]
-            )   )
-
-        return exams
\ No newline at end of file
+##########################################################################################################
+#
+# ClassTest.py
+#
+# Eine konkrete Klasse von "Exam". Implementiert eine Klausur.
+#
+##########################################################################################################
+
+from datetime import date
+
+from .Exam import Exam
+from utils.DatabaseConnector import DatabaseConnector
+from utils.Metrics import Metrics
+from utils.WriteBehind import WriteBehind
+
+class ClassTest(Exam):
+
+    #Zusätzliche Attribute (siehe "__slots__" in "Exam")
+    __slots__ = ("score",)
+
+    def __init__(self,writtenOn:date,courseId:str,score:int):
+        """
+        Konstruktor
+
+        Args:
+            writtenOn (date): Siehe Konstruktor Exam
+            courseId (str)  : Siehe Konstruktor Exam
+            score (int)     : Wie viele Punkte in der Klausur insgesamt erreicht wurden
+        """
+        super().__init__(writtenOn,courseId)
+        self.score = Exam.truncatePoints(score,100)
+
+    def __str__(self) -> str:
+        """
+        Überschreibe: Repräsentation für UI
+
+        Returns:
+            str: Stringrepräsentation des Objektes
+        """
+        s  = "\n-- Klausur --\n\n"
+        s += super().__str__() + "\n"
+        return s
+
+    def points(self) -> int:
+        """
+        Implementiert die abstrakte Methode "points" von "Exam".
+        """
+        return self.score
+    
+    def saveToDB(self,afterWrite = None):
+        """
+        Implementiert die abstrakte Methode "saveToDB" von "Exam".
+        """
+        return WriteBehind.write(
+            """
+            INSERT INTO classtests (
+                writtenOn,courseId,score
+            )
+            VALUES (?,?,?)
+            """,
+            (self.writtenOn,self.courseId,self.score,),
+            "ClassTest",
+            afterWrite
+        )
+
+    @staticmethod
+    def fromRow(cursor,row:tuple):
+        """
+        Row-Factory für "DatabaseConnector.query" / "iterQuery": Erstellt das Objekt direkt aus einer Zeile der
+        Tabelle "classtests" (Spalten in Reihenfolge des Konstruktors, "writtenOn" bereits als date).
+
+        Args:
+            cursor (Cursor): Der Cursor (wird nicht benötigt, Vorgabe von sqlite3)
+            row (tuple)    : Die Zeile
+
+        Returns:
+            ClassTest: Das Objekt
+        """
+        return ClassTest(*row)
+
+    def getAllFromDB() -> list:
+        """
+        Implementiert die abstrakte, statische Methode "getAllFromDB" von "Exam"
+        """
+        exams = list(ClassTest.iterFromDB())
+        Metrics.increment("studytrack_models_hydrated",{"type": "ClassTest"},len(exams))
+        return exams
+
+    def iterFromDB(arraysize:int = 1000):
+        """
+        Implementiert die abstrakte, statische Methode "iterFromDB" von "Exam"
+        """
+
+        #Alle Exams aus DB abfragen, sortiert nach Kurs (Reihenfolge innerhalb eines Kurses bleibt erhalten)
+        #Die Zeilen werden per "fromRow" direkt beim Lesen in Objekte umgewandelt
+        return DatabaseConnector.iterQuery(
+            """
+            SELECT * FROM classtests ORDER BY courseId, rowid;
+            """,
+            arraysize=arraysize,
+            rowFactory=ClassTest.fromRow
+        )
\ No newline at end of file
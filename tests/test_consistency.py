@@ -0,0 +1,91 @@
+##########################################################################################################
+#
+# test_consistency.py
+#
+# Prüft, ob die Auswertungen direkt in SQLite die gleichen Ergebnisse liefern wie über die Objekte.
+#
+#   python -m pytest -q
+#
+##########################################################################################################
+
+import random
+from pathlib import Path
+
+import pytest
+
+from utils import DatabaseConnector
+from models.Course import Course
+from models.CourseStats import CourseStats
+from models.DashboardStats import DashboardStats
+from models.ExamScoreStore import ExamScoreStore
+
+##########################################################################################################
+
+@pytest.fixture
+def database(tmp_path:Path):
+    """
+    Frische Datenbank (inkl. Demo-Daten) mit zufälligen Kursen und Exams, darunter auch Punkte außerhalb der
+    erlaubten Bereiche (z.B. von Hand oder von älteren Versionen eingetragen).
+    """
+    databaseFile = DatabaseConnector._databaseFile
+    DatabaseConnector._databaseFile = tmp_path / "test.db"
+    DatabaseConnector.connectToDB()
+    DatabaseConnector.createDatabase()
+    DatabaseConnector.migrateDatabase()
+
+    rng = random.Random(42)
+    courses = [
+        (f"Kurs {i}",f"TEST{i:04d}","Test",rng.randint(1,10),f"2025-{rng.randint(1,12):02d}-01") for i in range(200)
+    ]
+    workbooks = list()
+    classTests = list()
+    for _, courseId, _, _, _ in courses:
+        for _ in range(rng.randint(0,3)):
+            workbooks.append(("2025-02-01",courseId,*[rng.randint(-5,20) for _ in range(6)],rng.randint(-5,15)))
+        for _ in range(rng.randint(0,3)):
+            classTests.append(("2025-02-01",courseId,rng.randint(-20,120)))
+
+    with CourseStats.deferred():
+        DatabaseConnector.executeMany("INSERT INTO courses VALUES (?,?,?,?,?)",courses)
+        DatabaseConnector.executeMany("INSERT INTO advancedworkbooks VALUES (?,?,?,?,?,?,?,?,?)",workbooks)
+        DatabaseConnector.executeMany("INSERT INTO classtests VALUES (?,?,?)",classTests)
+
+    yield
+
+    DatabaseConnector.disconnectFromDB()
+    DatabaseConnector._databaseFile = databaseFile
+
+##########################################################################################################
+
+def test_dashboardStatsFromDatabase(database):
+    """
+    "DashboardStats.fromDatabase" (SQL) liefert die gleichen Kennzahlen wie "DashboardStats.fromCourses".
+    """
+    pythonStats = DashboardStats.fromCourses(Course.getAllFromDB())
+    sqlStats = DashboardStats.fromDatabase()
+    assert sqlStats.toDict() == pythonStats.toDict()
+
+def test_examScoreStoreFromDatabase(database):
+    """
+    "ExamScoreStore.fromDatabase" (Spalten direkt aus der Datenbank) liefert die gleichen Punkte wie
+    "ExamScoreStore.fromExams" (Exam-Objekte).
+    """
+    exams = [exam for course in Course.getAllFromDB() for exam in course.exams]
+    objectStore = ExamScoreStore.fromExams(exams)
+    databaseStore = ExamScoreStore.fromDatabase()
+
+    #Reihenfolge der Exams unterscheidet sich (pro Kurs vs. pro Prüfungsart), daher sortiert vergleichen
+    assert sorted(objectStore.points()) == sorted(databaseStore.points())
+    assert objectStore.summary() == databaseStore.summary()
+
+def test_courseStats(database):
+    """
+    Die Zusammenfassung "course_stats" (Trigger bzw. Neuberechnung in SQL) stimmt mit "Course.passed",
+    "Course.tries" und "Course.getGrade" überein, auch nach einzeln eingetragenen Exams außerhalb der Bereiche.
+    """
+    DatabaseConnector.execute("INSERT INTO advancedworkbooks VALUES ('2025-03-01','TEST0000',100,0,0,0,0,0,0);")
+    DatabaseConnector.execute("INSERT INTO classtests VALUES ('2025-03-01','TEST0001',500);")
+
+    for course in Course.getAllFromDB():
+        _, tries, _, _, _, grade, passed = CourseStats.get(course.courseId)
+        assert (tries,passed,grade) == (course.tries(),course.passed(),course.getGrade()), course.courseId
\ No newline at end of file
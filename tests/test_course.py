@@ -0,0 +1,59 @@
+##########################################################################################################
+#
+# test_course.py
+#
+# Prüft den zwischengespeicherten, abgeleiteten Zustand der Kurse (erstes bestandenes Examen, Note).
+#
+##########################################################################################################
+
+from datetime import date
+
+from utils.Settings import Settings
+from models.Course import Course
+from models.GradingScheme import GradingScheme
+from models.exams.ClassTest import ClassTest
+
+##########################################################################################################
+
+def test_derivedStateAfterAppend():
+    """
+    Ein angehängtes Exam wird ohne "invalidate" erkannt.
+    """
+    course = Course("Kurs","TEST","Test",5,[ClassTest(date(2025,2,1),"TEST",10)])
+    assert course.passed() == "Nein"
+
+    course.exams.append(ClassTest(date(2025,2,1),"TEST",100))
+    assert course.passed() == "Ja"
+    assert course.getGrade() == Settings._gradingScheme.getGrade(100)
+
+def test_derivedStateAfterNewList():
+    """
+    Eine neu gesetzte Exam-Liste (auch mit gleicher Länge) wird ohne "invalidate" erkannt.
+    """
+    course = Course("Kurs","TEST","Test",5,[ClassTest(date(2025,2,1),"TEST",100)])
+    assert course.passed() == "Ja"
+
+    course.exams = [ClassTest(date(2025,2,1),"TEST",10)]
+    assert course.passed() == "Nein"
+    assert course.getGrade() == 0.0
+
+def test_derivedStateAfterInPlaceChange():
+    """
+    Ein in der Liste ausgetauschtes Exam (gleiche Liste, gleiche Länge) wird nach "invalidate" erkannt.
+    """
+    course = Course("Kurs","TEST","Test",5,[ClassTest(date(2025,2,1),"TEST",10)])
+    assert course.passed() == "Nein"
+
+    course.exams[0] = ClassTest(date(2025,2,1),"TEST",100)
+    course.invalidate()
+    assert course.passed() == "Ja"
+
+def test_derivedStateAfterGradingSchemeChange(monkeypatch):
+    """
+    Ein anderer Notenschlüssel führt zu einer neuen Note.
+    """
+    course = Course("Kurs","TEST","Test",5,[ClassTest(date(2025,2,1),"TEST",80)])
+    assert course.getGrade() == Settings._gradingScheme.getGrade(80)
+
+    monkeypatch.setattr(Settings,"_gradingScheme",GradingScheme("Test",[(80,1.0),(0,5.0)]))
+    assert course.getGrade() == 1.0
\ No newline at end of file
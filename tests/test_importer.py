@@ -0,0 +1,44 @@
+##########################################################################################################
+#
+# test_importer.py
+#
+# Prüft das Lesen von JSON-Arrays beim Massenimport.
+#
+##########################################################################################################
+
+import io
+import json
+
+import pytest
+
+from utils.Importer import Importer
+
+##########################################################################################################
+
+def test_iterJSONArray():
+    """
+    Elemente werden unabhängig von der Puffergröße vollständig gelesen (auch über Puffergrenzen hinweg).
+    """
+    elements = [{"name": f"Kurs {i}","description": "äöü" * i} for i in range(20)]
+    for bufferSize in (1,7,65536):
+        assert list(Importer._iterJSONArray(io.StringIO(json.dumps(elements)),bufferSize)) == elements
+
+def test_iterJSONArrayInvalidElement(monkeypatch):
+    """
+    Ein ungültiges Element wird nicht bis zum Dateiende gepuffert, der Fehler enthält die Position in Bytes.
+    """
+    monkeypatch.setattr(Importer,"_maxJSONElementSize",100)
+    file = io.StringIO('[{"ä": 1}, {"name": "' + "x" * 1000 + "]")
+    with pytest.raises(ValueError,match="ab Byte 12"):
+        list(Importer._iterJSONArray(file,16))
+    assert file.tell() < 1000
+def test_toRowsMissingColumn():
+    """
+    Eine fehlende Spalte führt zu einem ValueError mit der Nummer des Datensatzes (statt "KeyError").
+    """
+    records = [
+        {"writtenOn": "2025-02-01","courseId": "TEST","score": 50},
+        {"writtenOn": "2025-02-01","courseId": "TEST"}
+    ]
+    with pytest.raises(ValueError,match="Datensatz 11: Spalte\\(n\\) score fehlen"):
+        Importer._toRows(records,["writtenOn","courseId","score"],10)
\ No newline at end of file
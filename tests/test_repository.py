@@ -0,0 +1,72 @@
+##########################################################################################################
+#
+# test_repository.py
+#
+# Prüft den Abgleich von "CourseRepository.refresh" mit Änderungen anderer Sitzungen.
+#
+##########################################################################################################
+
+import sqlite3
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from utils import DatabaseConnector
+from models.Course import Course
+from models.CourseRepository import CourseRepository
+from models.exams.ClassTest import ClassTest
+
+##########################################################################################################
+
+@pytest.fixture
+def otherSession(tmp_path:Path):
+    """
+    Frische Datenbank mit geladenem "CourseRepository" und einer zweiten Verbindung als "andere Sitzung".
+    """
+    databaseFile = DatabaseConnector._databaseFile
+    DatabaseConnector._databaseFile = tmp_path / "test.db"
+    DatabaseConnector.connectToDB()
+    DatabaseConnector.createDatabase()
+    DatabaseConnector.migrateDatabase()
+    CourseRepository.load()
+
+    connection = sqlite3.connect(DatabaseConnector._databaseFile,isolation_level=None)
+    yield connection
+
+    connection.close()
+    CourseRepository.clear()
+    DatabaseConnector.disconnectFromDB()
+    DatabaseConnector._databaseFile = databaseFile
+
+def _addForeignCourse(connection:sqlite3.Connection,courseId:str):
+    """
+    Legt einen Kurs über die andere Sitzung an.
+    """
+    connection.execute("INSERT INTO courses VALUES ('Kurs',?,'Test',5,'2025-01-01');",(courseId,))
+
+##########################################################################################################
+
+def test_refreshSkipsOwnWrites(otherSession):
+    """
+    Eigene Schreibvorgänge (auch abwechselnd mit einer anderen Sitzung) gelten nicht als fremde Änderungen.
+    """
+    CourseRepository.add(Course("Kurs","OWN1","Test",5,[]))
+    CourseRepository.addExam(ClassTest(date(2025,2,1),"OWN1",90))
+    _addForeignCourse(otherSession,"OTHER1")
+    CourseRepository.add(Course("Kurs","OWN2","Test",5,[]))
+    CourseRepository.delete("OWN2")
+
+    assert CourseRepository.refresh() == 1
+    assert CourseRepository.get("OTHER1") is not None
+    assert CourseRepository.refresh() == 0
+
+def test_refreshWithCourseIdAsterisk(otherSession):
+    """
+    Ein Kurs mit der Kursnummer "*" führt nicht dazu, dass jedes Mal alles neu geladen wird.
+    """
+    CourseRepository.add(Course("Kurs","*","Test",5,[]))
+    _addForeignCourse(otherSession,"OTHER1")
+
+    assert CourseRepository.refresh() == 1
+    assert CourseRepository.get("*") is not None
\ No newline at end of file
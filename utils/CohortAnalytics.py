@@ -0,0 +1,214 @@
+##########################################################################################################
+#
+# CohortAnalytics.py
+#
+# Auswertungen über alle Studenten (Kohorte), jeder Student hat seine eigene Datenbank.
+#
+##########################################################################################################
+
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from models.DashboardStats import DashboardStats
+from .Settings import Settings
+
+class CohortStats:
+
+    def __init__(self):
+        """
+        Konstruktor (leere Statistik, Teilergebnisse werden über "merge" zusammengeführt)
+        """
+        self.studentCount = 0      #Anzahl ausgewerteter Studenten (Datenbanken)
+        self.onTrackCount = 0      #Anzahl Studenten, die mindestens die zu erwartenden ECTS haben
+        self.courses      = dict() #Pro "courseId": [Anzahl Studenten mit dem Kurs, Bestanden, Endgültig nicht]
+        self.grades       = dict() #Pro Note: Wie oft ein Kurs mit dieser Note bestanden wurde
+        self.students     = dict() #Pro Matrikelnummer: (Erreichte ECTS, Zu erwartende ECTS)
+
+    def __str__(self) -> str:
+        """
+        Repräsentation für UI
+
+        Returns:
+            str: Stringrepräsentation des Objektes
+        """
+        s  = "-- Kohorte --\n\n"
+        s += f"Studenten                    : {self.studentCount}\n"
+        s += f"Im Plan (ECTS vs. Semester)  : {self.onTrackCount} / {self.studentCount}\n"
+
+        s += "\n-- Bestehensquote pro Kurs --\n\n"
+        for courseId, (count, passed, failed) in sorted(self.courses.items()):
+            s += f"{courseId:<16}: {self.passRate(courseId):>6.1%} ({passed} / {count}, endgültig nicht: {failed})\n"
+
+        s += "\n-- Notenverteilung (bestandene Kurse) --\n\n"
+        for grade, count in sorted(self.grades.items()):
+            s += f"{grade:>4}: {count}\n"
+        return s
+
+    ######################################################################################################
+
+    def passRate(self,courseId:str) -> float:
+        """
+        Anteil der Studenten mit dem Kurs, die ihn bestanden haben.
+
+        Args:
+            courseId (str): Die Kursnummer
+
+        Returns:
+            float: 0.0 bis 1.0 (0.0 wenn kein Student den Kurs hat)
+        """
+        count, passed, _ = self.courses.get(courseId,(0,0,0))
+        return passed / count if count > 0 else 0.0
+
+    def merge(self,other:"CohortStats"):
+        """
+        Führt ein Teilergebnis (z.B. eines Prozesses) mit dieser Statistik zusammen.
+
+        Args:
+            other (CohortStats): Das Teilergebnis
+        """
+        self.studentCount += other.studentCount
+        self.onTrackCount += other.onTrackCount
+        for courseId, counts in other.courses.items():
+            ownCounts = self.courses.setdefault(courseId,[0,0,0])
+            for i in range(3):
+                ownCounts[i] += counts[i]
+        for grade, count in other.grades.items():
+            self.grades[grade] = self.grades.get(grade,0) + count
+        self.students.update(other.students)
+
+class CohortAnalytics:
+    """
+    Statische Klasse für Auswertungen über alle Studenten in "Settings._students": Bestehensquote pro Kurs,
+    Notenverteilung und ECTS-Fortschritt im Vergleich zur Regelstudienzeit.
+
+    Jede Datenbank wird für sich ausgewertet (in einem eigenen Prozess, schreibgeschützt geöffnet), danach
+    werden die Teilergebnisse zusammengeführt. Damit skaliert die Auswertung mit der Anzahl der CPU-Kerne.
+    """
+
+    def __new__(cls):
+        """
+        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
+        """
+        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
+
+    ######################################################################################################
+
+    @staticmethod
+    def expectedEcts(targetEcts:int,period:int,enrolled:date,today:date) -> int:
+        """
+        Wie viele ECTS man bei gleichmäßigem Fortschritt in der Regelstudienzeit bis heute haben sollte.
+
+        Args:
+            targetEcts (int): ECTS für den Abschluss
+            period (int)    : Regelstudienzeit in Semestern
+            enrolled (date) : Wann das Studium gestartet wurde
+            today (date)    : Stichtag
+
+        Returns:
+            int: Die zu erwartenden ECTS (höchstens "targetEcts")
+        """
+        months = (today.year - enrolled.year) * 12 + today.month - enrolled.month
+        completedSemesters = max(months // 6,0)
+        return min(targetEcts * completedSemesters // period,targetEcts)
+
+    @staticmethod
+    def _aggregateDatabase(task:tuple) -> CohortStats:
+        """
+        Wertet die Datenbank eines Studenten aus (läuft im Worker-Prozess, daher nur über Parameter und mit
+        eigener, schreibgeschützter Verbindung).
+
+        Args:
+            task (tuple): (Datenbankdatei, Matrikelnummer, Erwartete ECTS, Punkte zum Bestehen, Notenschlüssel)
+
+        Returns:
+            CohortStats: Das Teilergebnis für diesen Studenten
+        """
+        databaseFile, studentNumber, expectedEcts, pointsToPass, gradingScheme = task
+
+        connection = sqlite3.connect(f"{databaseFile.as_uri()}?mode=ro",uri=True)
+        try:
+            rows = connection.execute(
+                f"""
+                {DashboardStats.perCourseSQL(gradingScheme)}
+                SELECT courseId, ects, passed, grade FROM perCourse;
+                """,
+                {"pointsToPass": pointsToPass}
+            ).fetchall()
+        finally:
+            connection.close()
+
+        stats = CohortStats()
+        ects = 0
+        for courseId, courseEcts, passed, grade in rows:
+            counts = stats.courses.setdefault(courseId,[0,0,0])
+            counts[0] += 1
+            if passed == "Ja":
+                counts[1] += 1
+                stats.grades[grade] = stats.grades.get(grade,0) + 1
+                ects += courseEcts
+            elif passed == "Endgültig nicht":
+                counts[2] += 1
+
+        stats.studentCount = 1
+        stats.onTrackCount = 1 if ects >= expectedEcts else 0
+        stats.students[studentNumber] = (ects,expectedEcts)
+        return stats
+
+    @staticmethod
+    def _tasks(today:date) -> list:
+        """
+        Erstellt die Aufträge für "_aggregateDatabase", einen pro Student mit vorhandener Datenbank.
+
+        Args:
+            today (date): Stichtag für die zu erwartenden ECTS
+
+        Returns:
+            list: Liste mit Tupeln (siehe "_aggregateDatabase")
+        """
+        tasks = list()
+        for studentNumber, student in Settings._students.items():
+            databaseFile = Settings.getDatabaseFile(studentNumber)
+            if not databaseFile.exists():
+                continue
+            tasks.append((
+                databaseFile,
+                studentNumber,
+                CohortAnalytics.expectedEcts(student.ects,student.period,student.enrolled,today),
+                Settings._pointsToPass,
+                Settings._gradingScheme
+            ))
+        return tasks
+
+    @staticmethod
+    def compute(workers:int = None,today:date = None) -> tuple:
+        """
+        Wertet alle Studenten aus.
+
+        Args:
+            workers (int): Anzahl Prozesse (OPTIONAL, Standard = Anzahl CPU-Kerne) ; 1 = Ohne Prozesse im
+                           aktuellen Prozess
+            today (date) : Stichtag für den ECTS-Fortschritt (OPTIONAL, Standard = heute)
+
+        Returns:
+            tuple: (CohortStats, Dauer in Sekunden)
+        """
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        tasks = CohortAnalytics._tasks(today if today is not None else date.today())
+
+        start = time.perf_counter()
+        stats = CohortStats()
+        if workers <= 1:
+            for task in tasks:
+                stats.merge(CohortAnalytics._aggregateDatabase(task))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+
+                #Mehrere Datenbanken pro Auftrag an die Prozesse, damit der Overhead pro Auftrag nicht überwiegt
+                chunksize = max(len(tasks) // (workers * 4),1)
+                for partial in executor.map(CohortAnalytics._aggregateDatabase,tasks,chunksize=chunksize):
+                    stats.merge(partial)
+
+        return stats, time.perf_counter() - start
\ No newline at end of file
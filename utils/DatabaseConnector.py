@@ -1,270 +1,1058 @@
-##########################################################################################################
-#
-# DatabaseConnector.py
-#
-# Regelt Datenbankzugriff zu SQLite.
-#
-##########################################################################################################
-
-import sqlite3
-from pathlib import Path
-
-class DatabaseConnector:
-    """
-    Statische Klasse für das Handling der Datenbankanbingung an SQLite.
-    """
-
-    #"Protected" Attribut: Datenbankverbindung über Methoden hinweg
-    _connection = None
-
-    #"Private" Attribut: Pfad der Datenbankdatei -> Liegt im gleichen Verzeichnis wie diese Datei
-    _databaseFile = Path(__file__).parent.resolve() / "studytrack.db"
-
-    ######################################################################################################
-
-    def __new__(cls):
-        """
-        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
-        """
-        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
-
-    def __str__() -> str:
-        """
-        Repräsentation für UI
-        """
-        s = "-- DatabaseConnector -- \n\n"
-        s += f"__connection  : {DatabaseConnector._connection}\n"
-        s += f"__databaseFile: {DatabaseConnector._databaseFile}\n"
-        return s
-
-    ######################################################################################################
-    #-- Verbindung --
-
-    @staticmethod
-    def isConnected() -> bool:
-        """
-        Gibt an, ob eine Verbindung zur Datenbank besteht.
-
-        Returns:
-            bool: Wenn die Verbindung besteht True, ansonsten False
-        """
-        return DatabaseConnector._connection is not None
-
-    @staticmethod
-    def connectToDB():
-        """
-        Stellt die Verbindung zur Datenbank her.
-        """
-        if not DatabaseConnector.isConnected():
-            DatabaseConnector._connection = sqlite3.connect(DatabaseConnector._databaseFile)
-
-    @staticmethod
-    def disconnectFromDB():
-        """
-        Schließt die Verbindung zur Datenbank.
-        """
-        if DatabaseConnector.isConnected():
-            DatabaseConnector._connection.close()
-            DatabaseConnector._connection = None
-
-    ######################################################################################################
-    #-- Interaktion --
-
-    @staticmethod
-    def execute(sql:str,params:tuple = ()):
-        """
-        Führt einen SQL-Befehl in der Datenbank aus, keine Rückgabe.
-
-        Args:
-            sql (str)     : Der SQL-Befehl als prepared Statement: INSERT INTO students (name) VALUES (?)
-            params (tuple): Parameter für Statement: ("Alice",)
-        """
-        if DatabaseConnector._connection is None:
-            raise RuntimeError("Keine Verbindung zur Datenbank!")
-        cursor = DatabaseConnector._connection.cursor()
-        cursor.execute(sql,params)
-        DatabaseConnector._connection.commit()
-        cursor.close()
-
-    @staticmethod
-    def query(sql:str,params:tuple = ()):
-        """
-        Führt einen SQL-Befehl in der Datenbank aus, mit Rückgabe.
-
-        Args:
-            sql (str)     : Der SQL-Befehl als prepared Statement: INSERT INTO students (name) VALUES (?)
-            params (tuple): Parameter für Statement: ("Alice",)
-        Returns:
-            misc
-        """
-        if DatabaseConnector._connection is None:
-            raise RuntimeError("Keine Verbindung zur Datenbank!")
-        cursor = DatabaseConnector._connection.cursor()
-        cursor.execute(sql, params)
-        results = cursor.fetchall()
-        cursor.close()
-        return results
-
-    ######################################################################################################
-    #-- Verwaltung --
-
-    @staticmethod
-    def createDatabase() -> bool:
-        """
-        Erstellt das Datenbankschema der Anwendung.
-
-        Returns:
-            bool: False = Es wurde kein Setup gemacht / True = Setup wurde gemacht
-        """
-
-        #Prüfe, ob die Datenbank bereis eingerichtet wurde
-        #q = DatabaseConnector.query("SELECT name FROM sqlite_master WHERE type='table' AND name='courses';")
-        #print(q)
-        cursor = DatabaseConnector._connection.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='courses';")
-        if not cursor.fetchone():
-
-            #Die Statements für das Erstellen der Tabellen.
-            tableSetupStatements = [
-                """
-                CREATE TABLE IF NOT EXISTS courses (
-                    name TEXT NOT NULL,
-                    courseId TEXT PRIMARY KEY,
-                    description NOT NULL,
-                    ects INTEGER NOT NULL,
-                    startedAt DATE NOT NULL
-                );
-                """,
-                """
-                CREATE TABLE IF NOT EXISTS advancedworkbooks (
-                    writtenOn DATE NOT NULL,
-                    courseId TEXT NOT NULL,
-                    t1 INTEGER NOT NULL,
-                    t2 INTEGER NOT NULL,
-                    t3 INTEGER NOT NULL,
-                    t4 INTEGER NOT NULL,
-                    t5 INTEGER NOT NULL,
-                    t6 INTEGER NOT NULL,
-                    elaboration INTEGER NOT NULL,
-                    FOREIGN KEY (courseId) REFERENCES courses(courseId)
-                );
-                """,
-                """
-                CREATE TABLE IF NOT EXISTS classtests (
-                    writtenOn DATE NOT NULL,
-                    courseId TEXT NOT NULL,
-                    score INTEGER NOT NULL,
-                    FOREIGN KEY (courseId) REFERENCES courses(courseId)
-                );
-                """
-            ]
-
-            for tableSetupStatement in tableSetupStatements:
-                DatabaseConnector.execute(tableSetupStatement)
-            
-            #Die Statements für das Einrichten von Demo-Daten
-            demoSetupStatements = [
-
-                #-- Kurse --
-                """
-                INSERT INTO courses VALUES (
-                    'Einführung in das wissenschaftliche Arbeiten für IT und Technik',
-                    'DLBWIRITT01',
-                    'Als Forschende hält man Argumente nicht einfach für wahr, sondern geht ihnen systematisch auf den Grund.',
-                    5,
-                    '2025-01-28'
-                );
-                """,
-                """
-                INSERT INTO courses VALUES (
-                    'Spezifikation',
-                    'ISPE01',
-                    'Anforderungsanalysen müssen Anforderungen an IT-Systeme präzise beschrieben werden.',
-                    5,
-                    '2025-02-01'
-                );
-                """,
-                """
-                INSERT INTO courses VALUES (
-                    'Datenstruktur und Java-Klassenbibliothek',
-                    'DLBCSDSJCL02_D',
-                    'Kenntnisse der objektorientierten Programmierung werden am Beispiel von Java vertieft.',
-                    5,
-                    '2025-02-18'
-                );
-                """,
-                """
-                INSERT INTO courses VALUES (
-                    'Algorithmen, Datenstrukturen und Programmiersprachen',
-                    'DLBIADPS01-01',
-                    'Geeignete Algorithmen und Datenstrukturen auswählen und diese in Programmcode umzusetzen.',
-                    5,
-                    '2025-03-11'
-                );
-                """,
-                """
-                INSERT INTO courses VALUES (
-                    'Einführung in Data Science',
-                    'DLBDSIDS01-01_D',
-                    'Data Science hat sich als multidisziplinäres Feld entwickelt, das darauf abzielt, aus Daten Werte zu schaffen.',
-                    5,
-                    '2025-05-21'
-                );
-                """,
-
-                #-- Examen -> Advanced Workbooks --
-                """
-                INSERT INTO advancedworkbooks VALUES (
-                    '2025-02-10',
-                    'DLBWIRITT01',
-                    15,
-                    15,
-                    15,
-                    15,
-                    15,
-                    15,
-                    9
-                );
-                """,
-                """
-                INSERT INTO advancedworkbooks VALUES (
-                    '2025-04-29',
-                    'DLBIADPS01-01',
-                    15,
-                    14,
-                    15,
-                    12,
-                    15,
-                    15,
-                    7
-                );
-                """,
-
-                #-- Examen -> Klausuren --
-                """
-                INSERT INTO classtests VALUES (
-                    '2025-02-20',
-                    'ISPE01',
-                    45
-                );
-                """,
-                """
-                INSERT INTO classtests VALUES (
-                    '2025-02-20',
-                    'ISPE01',
-                    80
-                );
-                """
-            ]
-
-            for demoSetupStatement in demoSetupStatements:
-                DatabaseConnector.execute(demoSetupStatement)
-
-            #Daten committen
-            DatabaseConnector._connection.commit()
-
-            #Setup ausgeführt
-            return True
-        
-        #Kein Setup
-        return False
\ No newline at end of file
+##########################################################################################################
+#
+# DatabaseConnector.py
+#
+# Regelt Datenbankzugriff zu SQLite.
+#
+##########################################################################################################
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
+from .QueryTracer import QueryTracer
+
+class DatabaseConnector:
+    """
+    Statische Klasse für das Handling der Datenbankanbingung an SQLite.
+
+    Geschrieben wird immer über eine einzige Verbindung ("_connection"), die durch "_writeLock" von einem
+    Thread nach dem anderen genutzt wird. Gelesen wird über eine schreibgeschützte Verbindung pro Thread (siehe
+    "_getReadConnection"), damit z.B. Auswertungen im Hintergrund parallel zur UI lesen können (im WAL-Modus
+    ohne sich gegenseitig zu blockieren). Nur innerhalb einer Transaktion liest der Thread über die
+    Schreibverbindung, damit er seine eigenen, noch nicht committeten Änderungen sieht.
+    """
+
+    #"Protected" Attribut: Datenbankverbindung über Methoden hinweg (Schreibverbindung)
+    _connection = None
+
+    #"Private" Attribut: Nur ein Thread gleichzeitig darf über "_connection" schreiben bzw. eine Transaktion
+    #offen haben (reentrant, damit "execute" innerhalb von "transaction" funktioniert)
+    _writeLock = threading.RLock()
+
+    #"Private" Attribut: Thread, der gerade eine Transaktion offen hat (siehe "transaction")
+    _writerThread = None
+
+    #"Private" Attribut: Verschachtelungstiefe offener Transaktionen (0 = keine Transaktion offen)
+    _transactionDepth = 0
+
+    #"Private" Attribute: Lesende Verbindungen => Pro Thread in "_readLocal", alle zusammen in "_readConnections"
+    #(zum Schließen in "disconnectFromDB"). "_generation" wird beim Trennen erhöht, damit Threads danach eine
+    #neue Verbindung öffnen.
+    _readLocal       = threading.local()
+    _readConnections = list()
+    _readLock        = threading.Lock()
+    _generation      = 0
+
+    #"Private" Attribute: Wie oft ein Schreibvorgang wiederholt wird, wenn die Datenbank von einer anderen
+    #Verbindung gesperrt ist (nach "busy_timeout"), und die Wartezeit vor der ersten Wiederholung (verdoppelt
+    #sich jedes Mal)
+    _busyRetries    = 3
+    _busyRetryDelay = 0.1
+
+    #"Private" Attribut: PRAGMAs, die beim Verbinden gesetzt werden (siehe "connectToDB" bzw. die Speicherprofile
+    #in "Settings._storageProfiles")
+    _pragmas = dict()
+
+    #"Private" Attribut: Pfad der Datenbankdatei -> Liegt im gleichen Verzeichnis wie diese Datei
+    _databaseFile = Path(__file__).parent.resolve() / "studytrack.db"
+
+    #"Private" Attribute: Punkte eines Advanced Workbooks (Alias "a") bzw. einer Klausur (Alias "t") in SQL, jede
+    #Spalte eingegrenzt wie in den Konstruktoren der Exams. Entspricht "Exam.truncatePointsSQL", das hier wegen
+    #des zirkulären Imports (models => utils) nicht genutzt werden kann.
+    _workbookPointsSQL = " + ".join(
+        f"MIN(MAX(a.{column},0),{maxPoints})"
+        for column, maxPoints in (("t1",15),("t2",15),("t3",15),("t4",15),("t5",15),("t6",15),("elaboration",10))
+    )
+    _classTestPointsSQL = "MIN(MAX(t.score,0),100)"
+
+    #"Private" Attribut: Migrationen des Schemas. Der Index entspricht der Schemaversion ("PRAGMA user_version"),
+    #von der aus die Statements ausgeführt werden => Neue Migrationen immer nur hinten anhängen!
+    _migrations = [
+
+        #-- 0 -> 1: Indizes für Abfragen pro Kurs und nach Datum --
+        [
+            "CREATE INDEX IF NOT EXISTS idx_advancedworkbooks_courseId ON advancedworkbooks (courseId);",
+            "CREATE INDEX IF NOT EXISTS idx_advancedworkbooks_writtenOn ON advancedworkbooks (writtenOn);",
+            "CREATE INDEX IF NOT EXISTS idx_classtests_courseId ON classtests (courseId);",
+            "CREATE INDEX IF NOT EXISTS idx_classtests_writtenOn ON classtests (writtenOn);",
+            "CREATE INDEX IF NOT EXISTS idx_courses_startedAt ON courses (startedAt);"
+        ],
+
+        #-- 1 -> 2: Zusammenfassung pro Kurs ("course_stats"), aktuell gehalten durch Trigger --
+        [
+            #Einstellungen, die für die Berechnung nötig sind (werden per "CourseStats.sync" aus "Settings"
+            #übernommen, hier nur die Standardwerte)
+            """
+            CREATE TABLE IF NOT EXISTS course_stats_settings (
+                pointsToPass INTEGER NOT NULL,
+                deferred INTEGER NOT NULL
+            );
+            """,
+            "INSERT INTO course_stats_settings (pointsToPass,deferred) VALUES (50,0);",
+            """
+            CREATE TABLE IF NOT EXISTS course_stats_grades (
+                minPoints REAL PRIMARY KEY,
+                grade REAL NOT NULL
+            );
+            """,
+            """
+            INSERT INTO course_stats_grades (minPoints,grade) VALUES
+                (96,1.0),(91,1.3),(86,1.7),(81,2.0),(76,2.3),(71,2.7),(66,3.0),(61,3.3),(56,3.7),(50,4.0),(0,5.0);
+            """,
+
+            #Die Zusammenfassung selbst
+            """
+            CREATE TABLE IF NOT EXISTS course_stats (
+                courseId TEXT PRIMARY KEY,
+                tries INTEGER NOT NULL,
+                bestPoints INTEGER,
+                firstPassedOn DATE,
+                firstPassedPoints INTEGER,
+                grade REAL NOT NULL,
+                passed TEXT NOT NULL
+            );
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_course_stats_passed ON course_stats (passed, tries);",
+
+            #Berechnung der Zusammenfassung für jeden Kurs (wie "Course.passed", "Course.tries" etc.). Das erste
+            #bestandene Exam wird wie in "Course.getAllFromDB" zuerst bei den Advanced Workbooks gesucht.
+            #Als View, da Trigger keine WITH-Klauseln erlauben. Filter auf "courseId" nutzen die Indizes.
+            """
+            CREATE VIEW IF NOT EXISTS course_stats_source AS
+            SELECT courseId, tries, bestPoints, firstPassedOn, firstPassedPoints,
+                CASE
+                    WHEN firstPassedPoints IS NULL THEN 0.0
+                    ELSE (
+                        SELECT g.grade FROM course_stats_grades g WHERE g.minPoints <= firstPassedPoints
+                        ORDER BY g.minPoints DESC LIMIT 1
+                    )
+                END AS grade,
+                CASE
+                    WHEN firstPassedPoints IS NOT NULL THEN 'Ja'
+                    WHEN tries >= 3 THEN 'Endgültig nicht'
+                    ELSE 'Nein'
+                END AS passed
+            FROM (
+                SELECT c.courseId,
+                    (SELECT COUNT(*) FROM advancedworkbooks a WHERE a.courseId = c.courseId) +
+                    (SELECT COUNT(*) FROM classtests t WHERE t.courseId = c.courseId) AS tries,
+                    NULLIF(MAX(
+                        COALESCE((
+                            SELECT MAX(a.t1 + a.t2 + a.t3 + a.t4 + a.t5 + a.t6 + a.elaboration)
+                            FROM advancedworkbooks a WHERE a.courseId = c.courseId
+                        ),-1),
+                        COALESCE((SELECT MAX(t.score) FROM classtests t WHERE t.courseId = c.courseId),-1)
+                    ),-1) AS bestPoints,
+                    COALESCE((
+                        SELECT a.writtenOn FROM advancedworkbooks a
+                        WHERE a.courseId = c.courseId
+                        AND a.t1 + a.t2 + a.t3 + a.t4 + a.t5 + a.t6 + a.elaboration >= s.pointsToPass
+                        ORDER BY a.rowid LIMIT 1
+                    ),(
+                        SELECT t.writtenOn FROM classtests t
+                        WHERE t.courseId = c.courseId AND t.score >= s.pointsToPass
+                        ORDER BY t.rowid LIMIT 1
+                    )) AS firstPassedOn,
+                    COALESCE((
+                        SELECT a.t1 + a.t2 + a.t3 + a.t4 + a.t5 + a.t6 + a.elaboration FROM advancedworkbooks a
+                        WHERE a.courseId = c.courseId
+                        AND a.t1 + a.t2 + a.t3 + a.t4 + a.t5 + a.t6 + a.elaboration >= s.pointsToPass
+                        ORDER BY a.rowid LIMIT 1
+                    ),(
+                        SELECT t.score FROM classtests t
+                        WHERE t.courseId = c.courseId AND t.score >= s.pointsToPass
+                        ORDER BY t.rowid LIMIT 1
+                    )) AS firstPassedPoints
+                FROM courses c, course_stats_settings s
+            );
+            """,
+
+            #Trigger: Bei jeder Änderung eines Exams wird die Zeile des Kurses neu berechnet (außer bei
+            #Massenimporten, siehe "CourseStats.deferred")
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_advancedworkbooks_insert AFTER INSERT ON advancedworkbooks
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_stats SELECT * FROM course_stats_source WHERE courseId = NEW.courseId;
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_advancedworkbooks_delete AFTER DELETE ON advancedworkbooks
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_stats SELECT * FROM course_stats_source WHERE courseId = OLD.courseId;
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_advancedworkbooks_update AFTER UPDATE ON advancedworkbooks
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_stats SELECT * FROM course_stats_source WHERE courseId = OLD.courseId;
+                INSERT OR REPLACE INTO course_stats SELECT * FROM course_stats_source WHERE courseId = NEW.courseId;
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_classtests_insert AFTER INSERT ON classtests
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_stats SELECT * FROM course_stats_source WHERE courseId = NEW.courseId;
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_classtests_delete AFTER DELETE ON classtests
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_stats SELECT * FROM course_stats_source WHERE courseId = OLD.courseId;
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_classtests_update AFTER UPDATE ON classtests
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_stats SELECT * FROM course_stats_source WHERE courseId = OLD.courseId;
+                INSERT OR REPLACE INTO course_stats SELECT * FROM course_stats_source WHERE courseId = NEW.courseId;
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_courses_insert AFTER INSERT ON courses
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_stats SELECT * FROM course_stats_source WHERE courseId = NEW.courseId;
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_courses_delete AFTER DELETE ON courses
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                DELETE FROM course_stats WHERE courseId = OLD.courseId;
+            END;
+            """,
+
+            #Bestehende Kurse übernehmen
+            "INSERT OR REPLACE INTO course_stats SELECT * FROM course_stats_source;"
+        ],
+
+        #-- 2 -> 3: Revision pro Kurs ("course_revisions") für die Erkennung von Änderungen anderer Sitzungen --
+        [
+            #Jede Änderung eines Kurses bzw. seiner Exams bekommt die nächsthöhere Revision (über alle Kurse).
+            #Wer sich die höchste gesehene Revision merkt, findet so alle seitdem geänderten Kurse (siehe
+            #"CourseRepository.refresh"). "*" = Massenimport, alles neu laden (siehe "CourseStats.deferred", ab
+            #Version 6 NULL statt "*").
+            """
+            CREATE TABLE IF NOT EXISTS course_revisions (
+                courseId TEXT PRIMARY KEY,
+                revision INTEGER NOT NULL
+            );
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_course_revisions_revision ON course_revisions (revision);",
+
+            #Trigger: Wie bei "course_stats" nicht während Massenimporten
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_courses_revision_insert AFTER INSERT ON courses
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_revisions (courseId,revision) VALUES (NEW.courseId,(
+                    SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions
+                ));
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_courses_revision_delete AFTER DELETE ON courses
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_revisions (courseId,revision) VALUES (OLD.courseId,(
+                    SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions
+                ));
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_courses_revision_update AFTER UPDATE ON courses
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_revisions (courseId,revision) VALUES (OLD.courseId,(
+                    SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions
+                ));
+                INSERT OR REPLACE INTO course_revisions (courseId,revision) VALUES (NEW.courseId,(
+                    SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions
+                ));
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_advancedworkbooks_revision_insert AFTER INSERT ON advancedworkbooks
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_revisions (courseId,revision) VALUES (NEW.courseId,(
+                    SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions
+                ));
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_advancedworkbooks_revision_delete AFTER DELETE ON advancedworkbooks
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_revisions (courseId,revision) VALUES (OLD.courseId,(
+                    SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions
+                ));
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_advancedworkbooks_revision_update AFTER UPDATE ON advancedworkbooks
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_revisions (courseId,revision) VALUES (OLD.courseId,(
+                    SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions
+                ));
+                INSERT OR REPLACE INTO course_revisions (courseId,revision) VALUES (NEW.courseId,(
+                    SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions
+                ));
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_classtests_revision_insert AFTER INSERT ON classtests
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_revisions (courseId,revision) VALUES (NEW.courseId,(
+                    SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions
+                ));
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_classtests_revision_delete AFTER DELETE ON classtests
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_revisions (courseId,revision) VALUES (OLD.courseId,(
+                    SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions
+                ));
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_classtests_revision_update AFTER UPDATE ON classtests
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                INSERT OR REPLACE INTO course_revisions (courseId,revision) VALUES (OLD.courseId,(
+                    SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions
+                ));
+                INSERT OR REPLACE INTO course_revisions (courseId,revision) VALUES (NEW.courseId,(
+                    SELECT COALESCE(MAX(revision),0) + 1 FROM course_revisions
+                ));
+            END;
+            """
+        ],
+
+        #-- 3 -> 4: Fehlender Trigger für geänderte Kurse (z.B. ECTS oder Kursnummer) in "course_stats" --
+        [
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_courses_update AFTER UPDATE ON courses
+            WHEN (SELECT deferred FROM course_stats_settings) = 0
+            BEGIN
+                DELETE FROM course_stats WHERE courseId = OLD.courseId;
+                INSERT OR REPLACE INTO course_stats SELECT * FROM course_stats_source WHERE courseId = NEW.courseId;
+            END;
+            """,
+
+            #Bisher verpasste Änderungen nachholen
+            "DELETE FROM course_stats;",
+            "INSERT INTO course_stats SELECT * FROM course_stats_source;"
+        ],
+
+        #-- 4 -> 5: "course_stats_source" grenzt die Punkte ein (wie die Exam-Objekte, sonst weicht z.B. der
+        #Bestanden-Status bei Punkten außerhalb der erlaubten Bereiche von "Course.passed" ab) --
+        [
+            "DROP VIEW IF EXISTS course_stats_source;",
+            f"""
+            CREATE VIEW course_stats_source AS
+            SELECT courseId, tries, bestPoints, firstPassedOn, firstPassedPoints,
+                CASE
+                    WHEN firstPassedPoints IS NULL THEN 0.0
+                    ELSE (
+                        SELECT g.grade FROM course_stats_grades g WHERE g.minPoints <= firstPassedPoints
+                        ORDER BY g.minPoints DESC LIMIT 1
+                    )
+                END AS grade,
+                CASE
+                    WHEN firstPassedPoints IS NOT NULL THEN 'Ja'
+                    WHEN tries >= 3 THEN 'Endgültig nicht'
+                    ELSE 'Nein'
+                END AS passed
+            FROM (
+                SELECT c.courseId,
+                    (SELECT COUNT(*) FROM advancedworkbooks a WHERE a.courseId = c.courseId) +
+                    (SELECT COUNT(*) FROM classtests t WHERE t.courseId = c.courseId) AS tries,
+                    NULLIF(MAX(
+                        COALESCE((
+                            SELECT MAX({_workbookPointsSQL})
+                            FROM advancedworkbooks a WHERE a.courseId = c.courseId
+                        ),-1),
+                        COALESCE((
+                            SELECT MAX({_classTestPointsSQL}) FROM classtests t WHERE t.courseId = c.courseId
+                        ),-1)
+                    ),-1) AS bestPoints,
+                    COALESCE((
+                        SELECT a.writtenOn FROM advancedworkbooks a
+                        WHERE a.courseId = c.courseId AND {_workbookPointsSQL} >= s.pointsToPass
+                        ORDER BY a.rowid LIMIT 1
+                    ),(
+                        SELECT t.writtenOn FROM classtests t
+                        WHERE t.courseId = c.courseId AND {_classTestPointsSQL} >= s.pointsToPass
+                        ORDER BY t.rowid LIMIT 1
+                    )) AS firstPassedOn,
+                    COALESCE((
+                        SELECT {_workbookPointsSQL} FROM advancedworkbooks a
+                        WHERE a.courseId = c.courseId AND {_workbookPointsSQL} >= s.pointsToPass
+                        ORDER BY a.rowid LIMIT 1
+                    ),(
+                        SELECT {_classTestPointsSQL} FROM classtests t
+                        WHERE t.courseId = c.courseId AND {_classTestPointsSQL} >= s.pointsToPass
+                        ORDER BY t.rowid LIMIT 1
+                    )) AS firstPassedPoints
+                FROM courses c, course_stats_settings s
+            );
+            """,
+
+            #Bestehende Zeilen neu berechnen
+            "DELETE FROM course_stats;",
+            "INSERT INTO course_stats SELECT * FROM course_stats_source;"
+        ],
+
+        #-- 5 -> 6: Massenimporte in "course_revisions" mit "courseId" NULL markieren ("*" ist auch eine gültige
+        #Kursnummer). Eine bisherige Zeile "*" wird im Zweifel als Massenimport gewertet (alles neu laden). --
+        [
+            "UPDATE course_revisions SET courseId = NULL WHERE courseId = '*';"
+        ]
+    ]
+
+    ######################################################################################################
+
+    def __new__(cls):
+        """
+        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
+        """
+        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
+
+    def __str__() -> str:
+        """
+        Repräsentation für UI
+        """
+        s = "-- DatabaseConnector -- \n\n"
+        s += f"__connection  : {DatabaseConnector._connection}\n"
+        s += f"__databaseFile: {DatabaseConnector._databaseFile}\n"
+        s += f"__pragmas     : {DatabaseConnector._pragmas}\n"
+        s += f"__readers     : {len(DatabaseConnector._readConnections)}\n"
+        return s
+
+    ######################################################################################################
+    #-- Typumwandlung --
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _convertDate(value:bytes) -> date:
+        """
+        Konverter für Spalten vom Typ "DATE" (siehe "sqlite3.register_converter"). Viele Exams teilen sich ein
+        Datum, daher werden bereits umgewandelte Werte zwischengespeichert ("date" ist unveränderlich).
+
+        Args:
+            value (bytes): Der Wert aus der Datenbank im ISO-Format: b"2025-01-28"
+
+        Returns:
+            date: Das Datum
+        """
+        return date.fromisoformat(value.decode())
+
+    @staticmethod
+    def _adaptDate(value:date) -> str:
+        """
+        Adapter für "date"-Objekte als Parameter (siehe "sqlite3.register_adapter").
+
+        Args:
+            value (date): Das Datum
+
+        Returns:
+            str: Das Datum im ISO-Format: "2025-01-28"
+        """
+        return value.isoformat()
+
+    ######################################################################################################
+    #-- Verbindung --
+
+    @staticmethod
+    def isConnected() -> bool:
+        """
+        Gibt an, ob eine Verbindung zur Datenbank besteht.
+
+        Returns:
+            bool: Wenn die Verbindung besteht True, ansonsten False
+        """
+        return DatabaseConnector._connection is not None
+
+    @staticmethod
+    def connectToDB(pragmas:dict = None):
+        """
+        Stellt die Verbindung zur Datenbank her.
+
+        Args:
+            pragmas (dict): PRAGMAs, die direkt nach dem Verbinden gesetzt werden, z.B. {"journal_mode": "WAL"}
+                            (OPTIONAL, sonst die zuletzt übergebenen, siehe "Settings.getStoragePragmas")
+        """
+        if not DatabaseConnector.isConnected():
+
+            #"DATE"-Spalten direkt als "date" lesen bzw. "date" als ISO-String schreiben
+            sqlite3.register_converter("DATE",DatabaseConnector._convertDate)
+            sqlite3.register_adapter(date,DatabaseConnector._adaptDate)
+
+            #Die Schreibverbindung wird von allen Threads genutzt (abgesichert über "_writeLock")
+            DatabaseConnector._connection = sqlite3.connect(
+                DatabaseConnector._databaseFile,detect_types=sqlite3.PARSE_DECLTYPES,check_same_thread=False
+            )
+
+            #Speicherprofil anwenden ("PRAGMA" kann keine Parameter haben, die Werte kommen aus "Settings")
+            if pragmas is not None:
+                DatabaseConnector._pragmas = dict(pragmas)
+            for name, value in DatabaseConnector._pragmas.items():
+                DatabaseConnector._connection.execute(f"PRAGMA {name} = {value};").fetchall()
+
+            #Abfragen mitschreiben, falls aktiviert (siehe "QueryTracer")
+            if QueryTracer.isEnabled():
+                QueryTracer.attach(DatabaseConnector._connection)
+
+    @staticmethod
+    def disconnectFromDB():
+        """
+        Schließt die Verbindung zur Datenbank (inkl. aller lesenden Verbindungen der Threads).
+        """
+        with DatabaseConnector._readLock:
+            DatabaseConnector._generation += 1
+            for connection in DatabaseConnector._readConnections:
+                connection.close()
+            DatabaseConnector._readConnections = list()
+
+        if DatabaseConnector.isConnected():
+            with DatabaseConnector._writeLock:
+                DatabaseConnector._connection.close()
+                DatabaseConnector._connection = None
+
+    @staticmethod
+    def _getReadConnection():
+        """
+        Gibt die Verbindung zurück, über die der aktuelle Thread liest: Innerhalb einer eigenen Transaktion die
+        Schreibverbindung, ansonsten eine schreibgeschützte Verbindung nur für diesen Thread (URI "mode=ro",
+        wird beim ersten Lesen geöffnet).
+
+        Returns:
+            Connection: Die Verbindung
+        """
+        if DatabaseConnector._connection is None:
+            raise RuntimeError("Keine Verbindung zur Datenbank!")
+        if DatabaseConnector._writerThread == threading.get_ident():
+            return DatabaseConnector._connection
+
+        local = DatabaseConnector._readLocal
+        if getattr(local,"generation",None) != DatabaseConnector._generation:
+            connection = sqlite3.connect(
+                f"{Path(DatabaseConnector._databaseFile).resolve().as_uri()}?mode=ro",uri=True,
+                detect_types=sqlite3.PARSE_DECLTYPES,check_same_thread=False
+            )
+
+            #"journal_mode" ist eine Eigenschaft der Datei und wird von der Schreibverbindung gesetzt
+            for name, value in DatabaseConnector._pragmas.items():
+                if name != "journal_mode":
+                    connection.execute(f"PRAGMA {name} = {value};").fetchall()
+            if QueryTracer.isEnabled():
+                QueryTracer.attach(connection)
+
+            with DatabaseConnector._readLock:
+                DatabaseConnector._readConnections.append(connection)
+                local.connection = connection
+                local.generation = DatabaseConnector._generation
+        return local.connection
+
+    @staticmethod
+    def closeReadConnection():
+        """
+        Schließt die lesende Verbindung des aktuellen Threads (z.B. am Ende eines Hintergrund-Threads, sonst
+        bleibt sie bis "disconnectFromDB" offen).
+        """
+        local = DatabaseConnector._readLocal
+        if getattr(local,"generation",None) == DatabaseConnector._generation:
+            with DatabaseConnector._readLock:
+                DatabaseConnector._readConnections.remove(local.connection)
+            local.connection.close()
+        local.connection = None
+        local.generation = None
+
+    ######################################################################################################
+    #-- Interaktion --
+
+    @staticmethod
+    @contextmanager
+    def transaction():
+        """
+        Kontextmanager für eine Transaktion. Alle Aufrufe von "execute" und "executeMany" innerhalb des
+        "with"-Blocks werden gemeinsam (mit nur einem Commit) am Ende des äußersten Blocks committet. Bei einer
+        Exception wird alles zurückgerollt. Verschachtelte Blöcke werden Teil der äußeren Transaktion.
+
+        Beispiel:
+            with DatabaseConnector.transaction():
+                course.saveToDB()
+                exam.saveToDB()
+        """
+        if DatabaseConnector._connection is None:
+            raise RuntimeError("Keine Verbindung zur Datenbank!")
+
+        #Andere Threads warten, bis die Transaktion beendet ist
+        with DatabaseConnector._writeLock:
+
+            #Nur der äußerste Block startet die Transaktion (explizit, damit auch CREATE etc. enthalten sind).
+            #"IMMEDIATE" holt die Schreibsperre gleich am Anfang: Ist eine andere Sitzung am Schreiben, wird hier
+            #gewartet statt mitten in der Transaktion mit "database is locked" abzubrechen.
+            if DatabaseConnector._transactionDepth == 0:
+                if not DatabaseConnector._connection.in_transaction:
+                    DatabaseConnector._retryIfBusy(lambda: DatabaseConnector._connection.execute("BEGIN IMMEDIATE;"))
+                DatabaseConnector._writerThread = threading.get_ident()
+
+            DatabaseConnector._transactionDepth += 1
+            try:
+                yield
+            except BaseException:
+                DatabaseConnector._transactionDepth -= 1
+                if DatabaseConnector._transactionDepth == 0:
+                    DatabaseConnector._writerThread = None
+                    DatabaseConnector._connection.rollback()
+                raise
+            else:
+                DatabaseConnector._transactionDepth -= 1
+                if DatabaseConnector._transactionDepth == 0:
+                    DatabaseConnector._writerThread = None
+                    try:
+                        DatabaseConnector._retryIfBusy(DatabaseConnector._connection.commit)
+                    except BaseException:
+
+                        #Sonst bliebe die Transaktion offen und würde vom nächsten "execute" mitcommittet
+                        DatabaseConnector._connection.rollback()
+                        raise
+
+    @staticmethod
+    def inTransaction() -> bool:
+        """
+        Gibt an, ob gerade eine mit "transaction" geöffnete Transaktion läuft.
+
+        Returns:
+            bool: True wenn ja / False wenn nein
+        """
+        return DatabaseConnector._transactionDepth > 0 and DatabaseConnector._writerThread == threading.get_ident()
+
+    @staticmethod
+    def execute(sql:str,params:tuple = ()):
+        """
+        Führt einen SQL-Befehl in der Datenbank aus, keine Rückgabe. Außerhalb einer Transaktion (siehe
+        "transaction") wird sofort committet, ansonsten erst am Ende der Transaktion.
+
+        Args:
+            sql (str)     : Der SQL-Befehl als prepared Statement: INSERT INTO students (name) VALUES (?)
+            params (tuple): Parameter für Statement: ("Alice",)
+        """
+        if DatabaseConnector._connection is None:
+            raise RuntimeError("Keine Verbindung zur Datenbank!")
+        tracing = QueryTracer.isEnabled()
+        with DatabaseConnector._writeLock:
+            start = QueryTracer.begin() if tracing else 0.0
+            cursor = DatabaseConnector._connection.cursor()
+            if DatabaseConnector.inTransaction():
+                cursor.execute(sql,params)
+            else:
+                DatabaseConnector._retryIfBusy(lambda: DatabaseConnector._executeAndCommit(cursor.execute,sql,params))
+            if tracing:
+                QueryTracer.record(sql,start,cursor.rowcount)
+            cursor.close()
+
+    @staticmethod
+    def executeMany(sql:str,paramsList):
+        """
+        Führt einen SQL-Befehl für mehrere Parameter-Tupel in der Datenbank aus (Bulk), keine Rückgabe.
+        Committet wie "execute" nur außerhalb einer Transaktion, dann aber nur einmal für alle Tupel.
+
+        Args:
+            sql (str)        : Der SQL-Befehl als prepared Statement: INSERT INTO students (name) VALUES (?)
+            paramsList (misc): Liste bzw. Iterable mit Parameter-Tupeln: [("Alice",),("Bob",)]
+        
+        Returns:
+            int: Anzahl der betroffenen Zeilen
+        """
+        if DatabaseConnector._connection is None:
+            raise RuntimeError("Keine Verbindung zur Datenbank!")
+        tracing = QueryTracer.isEnabled()
+        with DatabaseConnector._writeLock:
+            start = QueryTracer.begin() if tracing else 0.0
+            cursor = DatabaseConnector._connection.cursor()
+            if DatabaseConnector.inTransaction():
+                cursor.executemany(sql,paramsList)
+            else:
+
+                #Für eine Wiederholung müssen die Parameter erneut durchlaufen werden können
+                paramsList = list(paramsList)
+                DatabaseConnector._retryIfBusy(
+                    lambda: DatabaseConnector._executeAndCommit(cursor.executemany,sql,paramsList)
+                )
+            rowCount = cursor.rowcount
+            if tracing:
+                QueryTracer.record(sql,start,rowCount)
+            cursor.close()
+        return rowCount
+
+    @staticmethod
+    def _isBusy(error:Exception) -> bool:
+        """
+        Gibt an, ob ein Fehler daher kommt, dass eine andere Verbindung die Datenbank gesperrt hat.
+
+        Args:
+            error (Exception): Der Fehler
+
+        Returns:
+            bool: True = "database is locked" o.ä. / False = Anderer Fehler
+        """
+        return (
+            isinstance(error,sqlite3.OperationalError) and
+            (getattr(error,"sqlite_errorcode",0) & 0xFF) in (sqlite3.SQLITE_BUSY,sqlite3.SQLITE_LOCKED)
+        )
+
+    @staticmethod
+    def _retryIfBusy(function):
+        """
+        Führt eine Funktion aus und wiederholt sie (mit wachsender Wartezeit), wenn die Datenbank trotz
+        "busy_timeout" noch von einer anderen Verbindung gesperrt ist (siehe "_busyRetries").
+
+        Args:
+            function (callable): Die Funktion (ohne Parameter)
+
+        Returns:
+            misc: Rückgabe der Funktion
+        """
+        delay = DatabaseConnector._busyRetryDelay
+        for attempt in range(DatabaseConnector._busyRetries + 1):
+            try:
+                return function()
+            except sqlite3.OperationalError as e:
+                if not DatabaseConnector._isBusy(e) or attempt == DatabaseConnector._busyRetries:
+                    raise
+            time.sleep(delay)
+            delay *= 2
+
+    @staticmethod
+    def _executeAndCommit(execute,sql:str,params):
+        """
+        Führt einen Befehl außerhalb einer Transaktion aus und committet. Schlägt etwas fehl, wird die implizit
+        gestartete Transaktion zurückgerollt, damit eine Wiederholung (siehe "_retryIfBusy") sauber beginnt.
+
+        Args:
+            execute (callable): "cursor.execute" bzw. "cursor.executemany"
+            sql (str)         : Der SQL-Befehl
+            params (misc)     : Parameter bzw. Liste mit Parametern
+        """
+        try:
+            execute(sql,params)
+            DatabaseConnector._connection.commit()
+        except BaseException:
+            if DatabaseConnector._connection.in_transaction:
+                DatabaseConnector._connection.rollback()
+            raise
+
+    @staticmethod
+    def query(sql:str,params:tuple = (),rowFactory = None):
+        """
+        Führt einen SQL-Befehl in der Datenbank aus, mit Rückgabe (lesend, siehe "_getReadConnection").
+
+        Args:
+            sql (str)            : Der SQL-Befehl als prepared Statement: INSERT INTO students (name) VALUES (?)
+            params (tuple)       : Parameter für Statement: ("Alice",)
+            rowFactory (callable): Wandelt jede Zeile direkt um, z.B. "ClassTest.fromRow" (OPTIONAL)
+        Returns:
+            misc
+        """
+        tracing = QueryTracer.isEnabled()
+        start = QueryTracer.begin() if tracing else 0.0
+        cursor = DatabaseConnector._getReadConnection().cursor()
+        cursor.row_factory = rowFactory
+        cursor.execute(sql, params)
+        results = cursor.fetchall()
+        cursor.close()
+        if tracing:
+            QueryTracer.record(sql,start,len(results))
+        return results
+
+    @staticmethod
+    def iterQuery(sql:str,params:tuple = (),arraysize:int = 1000,rowFactory = None):
+        """
+        Führt einen SQL-Befehl in der Datenbank aus und liefert die Ergebnisse nach und nach (Generator). Es
+        werden immer nur "arraysize" Zeilen per "fetchmany" geholt, statt alles per "fetchall" zu laden (lesend,
+        siehe "_getReadConnection").
+
+        Args:
+            sql (str)            : Der SQL-Befehl als prepared Statement: SELECT * FROM students WHERE name = ?
+            params (tuple)       : Parameter für Statement: ("Alice",)
+            arraysize (int)      : Wie viele Zeilen pro "fetchmany" geholt werden
+            rowFactory (callable): Wandelt jede Zeile direkt um, z.B. "ClassTest.fromRow" (OPTIONAL)
+        Returns:
+            Generator: Ein Tupel (bzw. Rückgabe von "rowFactory") pro Zeile
+        """
+        tracing = QueryTracer.isEnabled()
+        cursor = DatabaseConnector._getReadConnection().cursor()
+        cursor.arraysize = arraysize
+        cursor.row_factory = rowFactory
+        rowCount = 0
+        try:
+            #Gemessen wird nur die Zeit in "execute" / "fetchmany", nicht die Verarbeitung beim Aufrufer
+            start = QueryTracer.begin() if tracing else 0.0
+            cursor.execute(sql,params)
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                rowCount += len(rows)
+                if tracing:
+                    paused = time.perf_counter()
+                yield from rows
+                if tracing:
+                    start += time.perf_counter() - paused
+        finally:
+            cursor.close()
+            if tracing:
+                QueryTracer.record(sql,start,rowCount)
+
+    ######################################################################################################
+    #-- Verwaltung --
+
+    @staticmethod
+    def createDatabase() -> bool:
+        """
+        Erstellt das Datenbankschema der Anwendung.
+
+        Returns:
+            bool: False = Es wurde kein Setup gemacht / True = Setup wurde gemacht
+        """
+
+        #Prüfe, ob die Datenbank bereis eingerichtet wurde
+        #q = DatabaseConnector.query("SELECT name FROM sqlite_master WHERE type='table' AND name='courses';")
+        #print(q)
+        cursor = DatabaseConnector._connection.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='courses';")
+        alreadySetUp = cursor.fetchone() is not None
+        cursor.close()
+        if not alreadySetUp:
+
+            #Die Statements für das Erstellen der Tabellen.
+            tableSetupStatements = [
+                """
+                CREATE TABLE IF NOT EXISTS courses (
+                    name TEXT NOT NULL,
+                    courseId TEXT PRIMARY KEY,
+                    description NOT NULL,
+                    ects INTEGER NOT NULL,
+                    startedAt DATE NOT NULL
+                );
+                """,
+                """
+                CREATE TABLE IF NOT EXISTS advancedworkbooks (
+                    writtenOn DATE NOT NULL,
+                    courseId TEXT NOT NULL,
+                    t1 INTEGER NOT NULL,
+                    t2 INTEGER NOT NULL,
+                    t3 INTEGER NOT NULL,
+                    t4 INTEGER NOT NULL,
+                    t5 INTEGER NOT NULL,
+                    t6 INTEGER NOT NULL,
+                    elaboration INTEGER NOT NULL,
+                    FOREIGN KEY (courseId) REFERENCES courses(courseId)
+                );
+                """,
+                """
+                CREATE TABLE IF NOT EXISTS classtests (
+                    writtenOn DATE NOT NULL,
+                    courseId TEXT NOT NULL,
+                    score INTEGER NOT NULL,
+                    FOREIGN KEY (courseId) REFERENCES courses(courseId)
+                );
+                """
+            ]
+
+            #Die Statements für das Einrichten von Demo-Daten
+            demoSetupStatements = [
+
+                #-- Kurse --
+                """
+                INSERT INTO courses VALUES (
+                    'Einführung in das wissenschaftliche Arbeiten für IT und Technik',
+                    'DLBWIRITT01',
+                    'Als Forschende hält man Argumente nicht einfach für wahr, sondern geht ihnen systematisch auf den Grund.',
+                    5,
+                    '2025-01-28'
+                );
+                """,
+                """
+                INSERT INTO courses VALUES (
+                    'Spezifikation',
+                    'ISPE01',
+                    'Anforderungsanalysen müssen Anforderungen an IT-Systeme präzise beschrieben werden.',
+                    5,
+                    '2025-02-01'
+                );
+                """,
+                """
+                INSERT INTO courses VALUES (
+                    'Datenstruktur und Java-Klassenbibliothek',
+                    'DLBCSDSJCL02_D',
+                    'Kenntnisse der objektorientierten Programmierung werden am Beispiel von Java vertieft.',
+                    5,
+                    '2025-02-18'
+                );
+                """,
+                """
+                INSERT INTO courses VALUES (
+                    'Algorithmen, Datenstrukturen und Programmiersprachen',
+                    'DLBIADPS01-01',
+                    'Geeignete Algorithmen und Datenstrukturen auswählen und diese in Programmcode umzusetzen.',
+                    5,
+                    '2025-03-11'
+                );
+                """,
+                """
+                INSERT INTO courses VALUES (
+                    'Einführung in Data Science',
+                    'DLBDSIDS01-01_D',
+                    'Data Science hat sich als multidisziplinäres Feld entwickelt, das darauf abzielt, aus Daten Werte zu schaffen.',
+                    5,
+                    '2025-05-21'
+                );
+                """,
+
+                #-- Examen -> Advanced Workbooks --
+                """
+                INSERT INTO advancedworkbooks VALUES (
+                    '2025-02-10',
+                    'DLBWIRITT01',
+                    15,
+                    15,
+                    15,
+                    15,
+                    15,
+                    15,
+                    9
+                );
+                """,
+                """
+                INSERT INTO advancedworkbooks VALUES (
+                    '2025-04-29',
+                    'DLBIADPS01-01',
+                    15,
+                    14,
+                    15,
+                    12,
+                    15,
+                    15,
+                    7
+                );
+                """,
+
+                #-- Examen -> Klausuren --
+                """
+                INSERT INTO classtests VALUES (
+                    '2025-02-20',
+                    'ISPE01',
+                    45
+                );
+                """,
+                """
+                INSERT INTO classtests VALUES (
+                    '2025-02-20',
+                    'ISPE01',
+                    80
+                );
+                """
+            ]
+
+            #Tabellen und Demo-Daten in einer Transaktion (ein Commit) anlegen
+            with DatabaseConnector.transaction():
+                for tableSetupStatement in tableSetupStatements:
+                    DatabaseConnector.execute(tableSetupStatement)
+                for demoSetupStatement in demoSetupStatements:
+                    DatabaseConnector.execute(demoSetupStatement)
+
+            #Setup ausgeführt
+            return True
+        
+        #Kein Setup
+        return False
+
+    @staticmethod
+    def getSchemaVersion() -> int:
+        """
+        Gibt die Version des Datenbankschemas zurück (gespeichert in "PRAGMA user_version").
+
+        Returns:
+            int: 0 = Noch keine Migration ausgeführt / Sonst Anzahl der ausgeführten Migrationen
+        """
+        return DatabaseConnector.query("PRAGMA user_version;")[0][0]
+
+    @staticmethod
+    def getChangeToken() -> tuple:
+        """
+        Gibt einen Wert zurück, der sich bei jeder Änderung der Datenbank ändert (z.B. als Schlüssel für
+        Zwischenspeicher). "total_changes" zählt die Änderungen über diese Verbindung, "PRAGMA data_version"
+        ändert sich, wenn eine andere Verbindung etwas committet hat.
+
+        Returns:
+            tuple: (total_changes, data_version)
+        """
+        if DatabaseConnector._connection is None:
+            raise RuntimeError("Keine Verbindung zur Datenbank!")
+        return (
+            DatabaseConnector._connection.total_changes,
+            DatabaseConnector.query("PRAGMA data_version;")[0][0]
+        )
+
+    @staticmethod
+    def getDataVersion() -> int:
+        """
+        Gibt "PRAGMA data_version" der Schreibverbindung zurück. Der Wert ändert sich nur, wenn eine andere
+        Verbindung (z.B. eine zweite Sitzung in einem anderen Prozess) etwas committet hat, und ist sehr günstig
+        abzufragen (siehe "CourseRepository.refresh").
+
+        Returns:
+            int: Die Version
+        """
+        if DatabaseConnector._connection is None:
+            raise RuntimeError("Keine Verbindung zur Datenbank!")
+        with DatabaseConnector._writeLock:
+            return DatabaseConnector._connection.execute("PRAGMA data_version;").fetchone()[0]
+
+    @staticmethod
+    def migrateDatabase() -> int:
+        """
+        Bringt eine bestehende Datenbank auf die aktuelle Schemaversion, indem alle noch nicht ausgeführten
+        Migrationen nacheinander ausgeführt werden. Funktioniert "in place", vorhandene Daten bleiben erhalten.
+
+        Returns:
+            int: Anzahl der ausgeführten Migrationen (0 = Datenbank war bereits aktuell)
+        """
+        currentVersion = DatabaseConnector.getSchemaVersion()
+        targetVersion = len(DatabaseConnector._migrations)
+
+        if currentVersion > targetVersion:
+            raise RuntimeError(
+                f"Datenbankschema (Version {currentVersion}) ist neuer als das Programm (Version {targetVersion})!"
+            )
+
+        for version in range(currentVersion,targetVersion):
+
+            #Jede Migration inkl. Versionserhöhung läuft atomar in einer eigenen Transaktion
+            with DatabaseConnector.transaction():
+                for migrationStatement in DatabaseConnector._migrations[version]:
+                    DatabaseConnector.execute(migrationStatement)
+
+                #"PRAGMA" kann keine Parameter haben, Version ist aber immer ein int
+                DatabaseConnector.execute(f"PRAGMA user_version = {version + 1};")
+
+        return targetVersion - currentVersion
\ No newline at end of file
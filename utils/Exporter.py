@@ -0,0 +1,126 @@
+##########################################################################################################
+#
+# Exporter.py
+#
+# Export aller Kurse inkl. Exams, Noten und Bestanden-Status als CSV oder JSON Lines.
+#
+##########################################################################################################
+
+import csv
+import json
+import time
+from pathlib import Path
+
+from models.Course import Course
+from models.exams.AdvancedWorkbook import AdvancedWorkbook
+
+class Exporter:
+    """
+    Statische Klasse für den Export des Notenspiegels (Transcript).
+
+    Die Kurse werden über "Course.iterFromDB" gestreamt, es ist also immer nur ein Kurs mit seinen Exams im
+    Speicher, egal wie groß die Datenbank ist. Formate:
+        - .csv  : Eine Zeile pro Exam (Kurse ohne Exam haben eine Zeile mit leeren Exam-Spalten)
+        - .jsonl: Ein JSON-Objekt pro Kurs mit der Liste seiner Exams
+    """
+
+    #"Private" Attribut: Wie viele Zeilen pro "fetchmany" aus der Datenbank gelesen werden
+    _arraysize = 1000
+
+    #"Private" Attribut: Spalten der CSV-Datei
+    _csvColumns = [
+        "courseId","name","description","ects","startedAt","passed","tries","grade",
+        "examType","writtenOn","points","t1","t2","t3","t4","t5","t6","elaboration","score"
+    ]
+
+    ######################################################################################################
+
+    def __new__(cls):
+        """
+        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
+        """
+        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
+
+    ######################################################################################################
+    #-- Schreiben --
+
+    @staticmethod
+    def _examToDict(exam) -> dict:
+        """
+        Wandelt ein Exam in ein dict für den Export um.
+
+        Args:
+            exam (Exam): Das Exam
+
+        Returns:
+            dict: Die Exam-Felder
+        """
+        examDict = {"examType": type(exam).__name__,"writtenOn": str(exam.writtenOn),"points": exam.points()}
+        if isinstance(exam,AdvancedWorkbook):
+            examDict.update({
+                "t1": exam.t1,"t2": exam.t2,"t3": exam.t3,"t4": exam.t4,"t5": exam.t5,"t6": exam.t6,
+                "elaboration": exam.elaboration
+            })
+        else:
+            examDict["score"] = exam.score
+        return examDict
+
+    @staticmethod
+    def _courseToDict(course:Course) -> dict:
+        """
+        Wandelt einen Kurs (ohne Exams) in ein dict für den Export um.
+
+        Args:
+            course (Course): Der Kurs
+
+        Returns:
+            dict: Die Kurs-Felder inkl. Bestanden-Status, Versuche und Note
+        """
+        return {
+            "courseId": course.courseId,
+            "name": course.name,
+            "description": course.description,
+            "ects": course.ects,
+            "startedAt": str(course.startedAt),
+            "passed": course.passed(),
+            "tries": course.tries(),
+            "grade": course.getGrade()
+        }
+
+    @staticmethod
+    def exportFile(path) -> tuple:
+        """
+        Exportiert alle Kurse mit ihren Exams in eine Datei, das Format ergibt sich aus der Dateiendung.
+
+        Args:
+            path (str|Path): Die Zieldatei (.csv / .jsonl)
+
+        Returns:
+            tuple: (Anzahl exportierter Kurse, Dauer in Sekunden)
+        """
+        path = Path(path)
+        suffix = path.suffix.lower()
+        if suffix not in (".csv",".jsonl"):
+            raise ValueError(f"Dateiformat '{suffix}' wird nicht unterstützt (.csv / .jsonl)!")
+
+        courseCount = 0
+        start = time.perf_counter()
+        with open(path,"w",encoding="utf-8",newline="") as file:
+            if suffix == ".csv":
+                writer = csv.DictWriter(file,fieldnames=Exporter._csvColumns)
+                writer.writeheader()
+                for course in Course.iterFromDB(Exporter._arraysize):
+                    courseDict = Exporter._courseToDict(course)
+                    if not course.exams:
+                        writer.writerow(courseDict)
+                    for exam in course.exams:
+                        writer.writerow(courseDict | Exporter._examToDict(exam))
+                    courseCount += 1
+            else:
+                for course in Course.iterFromDB(Exporter._arraysize):
+                    courseDict = Exporter._courseToDict(course)
+                    courseDict["exams"] = [Exporter._examToDict(exam) for exam in course.exams]
+                    file.write(json.dumps(courseDict,ensure_ascii=False) + "\n")
+                    courseCount += 1
+
+        return courseCount, time.perf_counter() - start
\ No newline at end of file
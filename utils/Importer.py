@@ -0,0 +1,254 @@
+##########################################################################################################
+#
+# Importer.py
+#
+# Import von Kursen und Exams aus CSV- und JSON-Dateien (z.B. Notenspiegel aus anderen Systemen).
+#
+##########################################################################################################
+
+import csv
+import json
+import time
+from datetime import date
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+
+from models.CourseStats import CourseStats
+from models.exams.Exam import Exam
+from .DatabaseConnector import DatabaseConnector
+from .WriteBehind import WriteBehind
+
+class Importer:
+    """
+    Statische Klasse für den Massenimport von Daten in die Datenbank.
+
+    Die Dateien werden gestreamt und in Blöcken ("Chunks") verarbeitet, der Speicherverbrauch hängt also nur
+    von der Blockgröße ab und nicht von der Anzahl der Zeilen in der Datei. Unterstützte Formate:
+        - .csv  : Erste Zeile enthält die Spaltennamen
+        - .jsonl: Ein JSON-Objekt pro Zeile
+        - .json : Ein JSON-Array mit Objekten
+    Die Spaltennamen entsprechen denen der jeweiligen Tabelle (siehe "DatabaseConnector.createDatabase").
+    """
+
+    #"Private" Attribut: Wie viele Zeilen pro "executemany" in die Datenbank geschrieben werden
+    _chunkSize = 10000
+
+    #"Private" Attribut: Pro Tabelle das INSERT-Statement und die Spalten in dessen Reihenfolge
+    _tables = {
+        "courses": (
+            "INSERT INTO courses (name,courseId,description,ects,startedAt) VALUES (?,?,?,?,?)",
+            ["name","courseId","description","ects","startedAt"]
+        ),
+        "advancedworkbooks": (
+            "INSERT INTO advancedworkbooks (writtenOn,courseId,t1,t2,t3,t4,t5,t6,elaboration) "
+            "VALUES (?,?,?,?,?,?,?,?,?)",
+            ["writtenOn","courseId","t1","t2","t3","t4","t5","t6","elaboration"]
+        ),
+        "classtests": (
+            "INSERT INTO classtests (writtenOn,courseId,score) VALUES (?,?,?)",
+            ["writtenOn","courseId","score"]
+        )
+    }
+
+    #"Private" Attribut: Wie viele Zeichen ein einzelnes Element eines JSON-Arrays höchstens haben darf (sonst
+    #würde eine kaputte oder abgeschnittene Datei bis zum Dateiende in den Puffer gelesen)
+    _maxJSONElementSize = 4 * 1024 * 1024
+
+    #"Private" Attribut: Maximale Punktzahlen für "Exam.truncatePoints" (wie in den Konstruktoren der Exams)
+    _maxPoints = {
+        "t1": 15, "t2": 15, "t3": 15, "t4": 15, "t5": 15, "t6": 15, "elaboration": 10, "score": 100
+    }
+
+    ######################################################################################################
+
+    def __new__(cls):
+        """
+        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
+        """
+        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
+
+    ######################################################################################################
+    #-- Lesen --
+
+    @staticmethod
+    def _iterRecords(path:Path):
+        """
+        Liest die Datensätze einer Datei nacheinander ein (Generator).
+
+        Args:
+            path (Path): Die zu lesende Datei
+
+        Returns:
+            Generator: Ein dict pro Datensatz
+        """
+        suffix = path.suffix.lower()
+        with open(path,"r",encoding="utf-8",newline="") as file:
+            if suffix == ".csv":
+                yield from csv.DictReader(file)
+            elif suffix == ".jsonl":
+                for line in file:
+                    if line.strip():
+                        yield json.loads(line)
+            elif suffix == ".json":
+                yield from Importer._iterJSONArray(file)
+            else:
+                raise ValueError(f"Dateiformat '{suffix}' wird nicht unterstützt (.csv / .jsonl / .json)!")
+
+    @staticmethod
+    def _iterJSONArray(file,bufferSize:int = 65536):
+        """
+        Liest ein JSON-Array Element für Element, ohne die ganze Datei in den Speicher zu laden. Ein ungültiges
+        Element (bzw. eines größer als "_maxJSONElementSize") führt zu einem ValueError mit der Position in Bytes.
+
+        Args:
+            file (TextIO)   : Die geöffnete Datei
+            bufferSize (int): Wie viele Zeichen auf einmal gelesen werden
+
+        Returns:
+            Generator: Die Elemente des Arrays
+        """
+        decoder = json.JSONDecoder()
+        buffer = file.read(bufferSize)
+        position = len(buffer) - len(buffer.lstrip())
+        if not buffer.startswith("[",position):
+            raise ValueError("Die JSON-Datei enthält kein Array!")
+        position += 1
+
+        #Bytes (UTF-8) vor dem Anfang von "buffer", für die Position in Fehlermeldungen
+        offset = 0
+
+        while True:
+
+            #Leerzeichen und Kommas zwischen den Elementen überspringen (ggf. nachlesen)
+            while True:
+                while position < len(buffer) and buffer[position] in " \t\r\n,":
+                    position += 1
+                if position < len(buffer):
+                    break
+                offset += len(buffer.encode("utf-8"))
+                buffer = file.read(bufferSize)
+                position = 0
+                if not buffer:
+                    raise ValueError("Unerwartetes Dateiende in der JSON-Datei!")
+
+            #Ende des Arrays
+            if buffer[position] == "]":
+                return
+
+            #Nächstes Element dekodieren, bei unvollständigem Puffer weiterlesen
+            try:
+                element, position = decoder.raw_decode(buffer,position)
+            except json.JSONDecodeError as error:
+                elementOffset = offset + len(buffer[:position].encode("utf-8"))
+                if len(buffer) - position > Importer._maxJSONElementSize:
+                    raise ValueError(
+                        f"Ungültiges oder zu großes Element in der JSON-Datei ab Byte {elementOffset}!"
+                    ) from error
+                chunk = file.read(bufferSize)
+                if not chunk:
+                    raise ValueError(
+                        f"Ungültiges oder unvollständiges Element in der JSON-Datei ab Byte {elementOffset}!"
+                    ) from error
+                buffer = buffer[position:] + chunk
+                offset = elementOffset
+                position = 0
+                continue
+            yield element
+
+    ######################################################################################################
+    #-- Validierung --
+
+    @staticmethod
+    def _toRows(records:list,columns:list,firstNumber:int = 1) -> list:
+        """
+        Wandelt einen Block Datensätze in Parameter-Tupel für "executemany" um. Punkte werden dabei über
+        "Exam.truncatePoints" eingegrenzt und Datumswerte geprüft. Fehlende Werte (JSON "null") werden zu NULL
+        (und nicht zum Text "None"), der Import scheitert dann an "NOT NULL". Fehlt eine Spalte oder ist ein
+        Wert ungültig, gibt es einen ValueError mit der Nummer des Datensatzes in der Datei.
+
+        Args:
+            records (list)   : Liste mit dicts (aus "_iterRecords")
+            columns (list)   : Die Spalten der Zieltabelle in der Reihenfolge des INSERT-Statements
+            firstNumber (int): Nummer des ersten Datensatzes im Block (ab 1, für Fehlermeldungen)
+
+        Returns:
+            list: Liste mit Tupeln
+        """
+
+        #Umwandlung pro Spalte einmalig festlegen, nicht pro Zeile
+        converters = list()
+        for column in columns:
+            if column in Importer._maxPoints:
+                maxPoints = Importer._maxPoints[column]
+                converters.append(lambda value, maxPoints=maxPoints: Exam.truncatePoints(int(value),maxPoints))
+            elif column == "ects":
+                converters.append(int)
+            elif column in ("writtenOn","startedAt"):
+                #Viele Exams teilen sich ein Datum, daher nur einmal pro Wert prüfen
+                converters.append(lru_cache(maxsize=4096)(lambda value: date.fromisoformat(value).isoformat()))
+            else:
+                converters.append(str)
+
+        rows = list()
+        for number, record in enumerate(records,start=firstNumber):
+            if "startedAt" in columns and not record.get("startedAt"):
+                record["startedAt"] = date.today().isoformat()
+            missing = [column for column in columns if column not in record]
+            if missing:
+                raise ValueError(f"Datensatz {number}: Spalte(n) {', '.join(missing)} fehlen!")
+            try:
+                rows.append(tuple(
+                    None if record[column] is None else converter(record[column])
+                    for converter, column in zip(converters,columns)
+                ))
+            except (TypeError,ValueError) as e:
+                raise ValueError(f"Datensatz {number}: {e}") from e
+        return rows
+
+    ######################################################################################################
+    #-- Import --
+
+    @staticmethod
+    def importFile(path,table:str,chunkSize:int = None,progress = None) -> tuple:
+        """
+        Importiert eine Datei in eine Tabelle. Alles läuft in einer Transaktion, bei einem Fehler (z.B. doppelte
+        Kursnummer oder ungültiger Wert) wird also nichts importiert. Die Kurs-Zusammenfassung ("course_stats")
+        wird am Ende einmal neu berechnet.
+
+        Args:
+            path (str|Path)    : Die zu importierende Datei (.csv / .jsonl / .json)
+            table (str)        : "courses" / "advancedworkbooks" / "classtests"
+            chunkSize (int)    : Zeilen pro Block (OPTIONAL, Standard ist "_chunkSize")
+            progress (callable): Wird nach jedem Block mit (Zeilen bisher, Sekunden bisher) aufgerufen (OPTIONAL)
+
+        Returns:
+            tuple: (Anzahl importierter Zeilen, Dauer in Sekunden)
+        """
+        if table not in Importer._tables:
+            raise ValueError(f"Unbekannte Tabelle '{table}'!")
+        if chunkSize is None:
+            chunkSize = Importer._chunkSize
+
+        insertStatement, columns = Importer._tables[table]
+        records = Importer._iterRecords(Path(path))
+
+        #Ausstehende Schreibvorgänge zuerst, damit die Reihenfolge in der Datenbank stimmt (siehe "WriteBehind")
+        WriteBehind.flush()
+
+        rowCount = 0
+        recordCount = 0 #Gelesene Datensätze (für die Nummer in Fehlermeldungen)
+        start = time.perf_counter()
+        #Trigger für "course_stats" während des Imports aussetzen, am Ende einmal neu berechnen
+        with CourseStats.deferred():
+            while True:
+                chunk = list(islice(records,chunkSize))
+                if not chunk:
+                    break
+                rows = Importer._toRows(chunk,columns,recordCount + 1)
+                recordCount += len(chunk)
+                rowCount += DatabaseConnector.executeMany(insertStatement,rows)
+                if progress is not None:
+                    progress(rowCount,time.perf_counter() - start)
+
+        return rowCount, time.perf_counter() - start
\ No newline at end of file
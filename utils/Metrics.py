@@ -0,0 +1,249 @@
+##########################################################################################################
+#
+# Metrics.py
+#
+# Kennzahlen des laufenden Programms (Zähler und Latenz-Histogramme), exportierbar im OpenMetrics-Format.
+#
+##########################################################################################################
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+
+class Metrics:
+    """
+    Statische Klasse mit einer kleinen Registry für Zähler und Histogramme im Speicher des Prozesses.
+
+    Jede Metrik hat einen Namen und optional Labels (dict), z.B. die Seitennummer. Mit "startPeriodicFlush"
+    wird die Registry regelmäßig im OpenMetrics-Textformat in eine Datei geschrieben (atomar per Umbenennen),
+    die z.B. ein Monitoring-Agent einlesen kann.
+    """
+
+    #"Private" Attribut: Beschreibung und Typ jeder Metrik => Name: (Typ, Hilfetext)
+    _metrics = {
+        "studytrack_page_renders": ("counter","Wie oft eine Seite der UI angezeigt wurde"),
+        "studytrack_page_render_seconds": ("histogram","Dauer pro Seite der UI ohne Wartezeit auf Eingaben"),
+        "studytrack_models_hydrated": ("counter","Aus der Datenbank erstellte Objekte pro Typ (getAllFromDB)"),
+        "studytrack_cache_requests": ("counter","Zugriffe auf Zwischenspeicher pro Ergebnis (hit / miss)"),
+        "studytrack_rows_written": ("counter","Per saveToDB geschriebene Zeilen pro Typ")
+    }
+
+    #"Private" Attribut: Obergrenzen der Histogramm-Buckets in Sekunden
+    _buckets = (0.001,0.005,0.01,0.025,0.05,0.1,0.25,0.5,1.0,2.5,5.0,10.0)
+
+    #"Private" Attribut: Werte der Zähler => Name: {Labels (sortierte Tupel): Wert}
+    _counters = dict()
+
+    #"Private" Attribut: Werte der Histogramme => Name: {Labels: [Anzahl pro Bucket (+Inf am Ende), Summe]}
+    _histograms = dict()
+
+    #"Private" Attribut: Schützt die Werte, da "startPeriodicFlush" aus einem eigenen Thread liest
+    _lock = threading.Lock()
+
+    #"Private" Attribut: Immer nur ein "flush" gleichzeitig (Hintergrund-Thread und Programmende)
+    _flushLock = threading.Lock()
+
+    #"Private" Attribut: Thread für "startPeriodicFlush" bzw. Signal zum Beenden
+    _flushThread = None
+    _stopFlush = threading.Event()
+
+    ######################################################################################################
+
+    def __new__(cls):
+        """
+        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
+        """
+        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
+
+    ######################################################################################################
+    #-- Erfassen --
+
+    @staticmethod
+    def increment(name:str,labels:dict = None,value:int = 1):
+        """
+        Erhöht einen Zähler.
+
+        Args:
+            name (str)   : Name der Metrik (siehe "_metrics")
+            labels (dict): Labels, z.B. {"type": "Course"} (OPTIONAL)
+            value (int)  : Um wie viel erhöht wird
+        """
+        key = tuple(sorted(labels.items())) if labels else ()
+        with Metrics._lock:
+            values = Metrics._counters.setdefault(name,dict())
+            values[key] = values.get(key,0) + value
+
+    @staticmethod
+    def observe(name:str,seconds:float,labels:dict = None):
+        """
+        Trägt eine Dauer in ein Histogramm ein.
+
+        Args:
+            name (str)     : Name der Metrik (siehe "_metrics")
+            seconds (float): Die Dauer in Sekunden
+            labels (dict)  : Labels, z.B. {"page": "1"} (OPTIONAL)
+        """
+        key = tuple(sorted(labels.items())) if labels else ()
+        with Metrics._lock:
+            values = Metrics._histograms.setdefault(name,dict())
+            histogram = values.get(key)
+            if histogram is None:
+                histogram = [[0] * (len(Metrics._buckets) + 1),0.0]
+                values[key] = histogram
+            histogram[0][bisect_left(Metrics._buckets,seconds)] += 1
+            histogram[1] += seconds
+
+    @staticmethod
+    @contextmanager
+    def timer(name:str,labels:dict = None):
+        """
+        Kontextmanager, der die Dauer des "with"-Blocks in ein Histogramm einträgt.
+
+        Args:
+            name (str)   : Name der Metrik (siehe "_metrics")
+            labels (dict): Labels (OPTIONAL)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            Metrics.observe(name,time.perf_counter() - start,labels)
+
+    @staticmethod
+    def cacheAccess(cache:str,hit:bool):
+        """
+        Zählt einen Zugriff auf einen Zwischenspeicher (für die Trefferquote).
+
+        Args:
+            cache (str): Name des Zwischenspeichers, z.B. "TaskAnalytics"
+            hit (bool) : True = Treffer / False = Musste neu geladen bzw. berechnet werden
+        """
+        Metrics.increment("studytrack_cache_requests",{"cache": cache,"result": "hit" if hit else "miss"})
+
+    @staticmethod
+    def clear():
+        """
+        Setzt alle Werte zurück.
+        """
+        with Metrics._lock:
+            Metrics._counters = dict()
+            Metrics._histograms = dict()
+
+    ######################################################################################################
+    #-- Export --
+
+    @staticmethod
+    def _formatLabels(key:tuple,extra:tuple = ()) -> str:
+        """
+        Formatiert Labels für OpenMetrics: {name="wert",...}
+
+        Args:
+            key (tuple)  : Labels als Tupel von (Name, Wert)
+            extra (tuple): Zusätzliche Labels, z.B. (("le","0.5"),)
+
+        Returns:
+            str: Die Labels inkl. Klammern oder "" ohne Labels
+        """
+        labels = key + extra
+        if len(labels) == 0:
+            return ""
+        escaped = [
+            (name,str(value).replace("\\","\\\\").replace("\"","\\\"").replace("\n","\\n"))
+            for name, value in labels
+        ]
+        return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+    @staticmethod
+    def render() -> str:
+        """
+        Gibt alle Metriken im OpenMetrics-Textformat zurück.
+
+        Returns:
+            str: Der Text (endet mit "# EOF")
+        """
+        lines = list()
+        with Metrics._lock:
+            for name, (metricType, helpText) in Metrics._metrics.items():
+                lines.append(f"# TYPE {name} {metricType}")
+                lines.append(f"# HELP {name} {helpText}")
+                if metricType == "counter":
+                    for key, value in Metrics._counters.get(name,dict()).items():
+                        lines.append(f"{name}_total{Metrics._formatLabels(key)} {value}")
+                else:
+                    for key, (counts, total) in Metrics._histograms.get(name,dict()).items():
+                        cumulative = 0
+                        for bound, count in zip(Metrics._buckets + ("+Inf",),counts):
+                            cumulative += count
+                            lines.append(f"{name}_bucket{Metrics._formatLabels(key,(('le',str(bound)),))} {cumulative}")
+                        lines.append(f"{name}_count{Metrics._formatLabels(key)} {cumulative}")
+                        lines.append(f"{name}_sum{Metrics._formatLabels(key)} {total}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def flush(path):
+        """
+        Schreibt alle Metriken in eine Datei. Es wird erst eine temporäre Datei (mit eindeutigem Namen im
+        gleichen Verzeichnis) geschrieben und dann umbenannt, damit ein Leser nie eine halb geschriebene Datei
+        sieht.
+
+        Args:
+            path (str|Path): Die Zieldatei
+        """
+        path = Path(path)
+        with Metrics._flushLock:
+            with tempfile.NamedTemporaryFile(
+                "w",encoding="utf-8",dir=path.parent,prefix=path.name + ".",suffix=".tmp",delete=False
+            ) as file:
+                temporaryPath = file.name
+                try:
+                    file.write(Metrics.render())
+                except BaseException:
+                    file.close()
+                    os.remove(temporaryPath)
+                    raise
+            try:
+                os.replace(temporaryPath,path)
+            except BaseException:
+                os.remove(temporaryPath)
+                raise
+
+    @staticmethod
+    def startPeriodicFlush(path,interval:float):
+        """
+        Schreibt die Metriken ab jetzt alle "interval" Sekunden in eine Datei (Hintergrund-Thread, läuft bis
+        "stopPeriodicFlush" bzw. Programmende).
+
+        Args:
+            path (str|Path) : Die Zieldatei
+            interval (float): Abstand in Sekunden
+        """
+        Metrics.stopPeriodicFlush()
+        Metrics._stopFlush.clear()
+
+        def run():
+            while not Metrics._stopFlush.wait(interval):
+
+                #Z.B. volle Platte: Melden und beim nächsten Mal erneut versuchen
+                try:
+                    Metrics.flush(path)
+                except OSError as e:
+                    print(f"Kennzahlen konnten nicht nach '{path}' geschrieben werden: {e}",file=sys.stderr)
+
+        Metrics._flushThread = threading.Thread(target=run,name="MetricsFlush",daemon=True)
+        Metrics._flushThread.start()
+
+    @staticmethod
+    def stopPeriodicFlush():
+        """
+        Beendet das regelmäßige Schreiben (ohne nochmal zu schreiben).
+        """
+        if Metrics._flushThread is not None:
+            Metrics._stopFlush.set()
+            Metrics._flushThread.join()
+            Metrics._flushThread = None
\ No newline at end of file
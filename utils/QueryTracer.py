@@ -0,0 +1,270 @@
+##########################################################################################################
+#
+# QueryTracer.py
+#
+# Optionale Messung aller Datenbankabfragen (Laufzeit, Zeilen, Aufrufer) zur Analyse der Performance.
+#
+##########################################################################################################
+
+import json
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+class QueryTracer:
+    """
+    Statische Klasse, die alle Abfragen über "DatabaseConnector" mitschreibt, wenn sie aktiviert ist.
+
+    Pro Aufruf von "execute" / "executeMany" / "query" / "iterQuery" wird ein Eintrag mit Seite der UI, SQL,
+    Laufzeit, Anzahl Zeilen und Aufrufer (Datei:Zeile außerhalb von "DatabaseConnector") gespeichert. Über
+    "sqlite3.Connection.set_trace_callback" wird zusätzlich gezählt, wie viele Statements SQLite dafür
+    tatsächlich ausgeführt hat (inkl. Trigger).
+
+    Abfragen laufen auch in anderen Threads (lesende Verbindungen, "WriteBehind"): Die Statements werden daher
+    pro Thread gezählt und es werden höchstens "_maxRecords" Einträge behalten (die ältesten fallen weg).
+    """
+
+    #"Private" Attribut: Ob mitgeschrieben wird (siehe "enable")
+    _enabled = False
+
+    #"Private" Attribute: Die letzten "_maxRecords" Einträge, je ein dict (siehe "record"), geschützt über
+    #"_recordsLock". "_droppedRecords" zählt die weggefallenen.
+    _maxRecords     = 100000
+    _records        = deque(maxlen=_maxRecords)
+    _recordsLock    = threading.Lock()
+    _droppedRecords = 0
+
+    #"Private" Attribut: Wo in der UI man sich gerade befindet (wird von "ConsoleUI.drawMenu" gesetzt)
+    _page = "Start"
+
+    #"Private" Attribut: Pro Thread "pendingStatements" => Von SQLite ausgeführte Statements seit dem letzten
+    #Eintrag (Trace-Callback, läuft im Thread, der das Statement ausführt)
+    _local = threading.local()
+
+    ######################################################################################################
+
+    def __new__(cls):
+        """
+        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
+        """
+        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
+
+    ######################################################################################################
+    #-- Steuerung --
+
+    @staticmethod
+    def enable(connection = None):
+        """
+        Schaltet das Mitschreiben ein.
+
+        Args:
+            connection (Connection): Bestehende Verbindung, für die der Trace-Callback gesetzt wird (OPTIONAL,
+                                     neue Verbindungen setzt "DatabaseConnector.connectToDB")
+        """
+        QueryTracer._enabled = True
+        if connection is not None:
+            QueryTracer.attach(connection)
+
+    @staticmethod
+    def disable(connection = None):
+        """
+        Schaltet das Mitschreiben aus (bisherige Einträge bleiben erhalten).
+
+        Args:
+            connection (Connection): Verbindung, deren Trace-Callback entfernt wird (OPTIONAL)
+        """
+        QueryTracer._enabled = False
+        if connection is not None:
+            connection.set_trace_callback(None)
+
+    @staticmethod
+    def isEnabled() -> bool:
+        """
+        Gibt an, ob mitgeschrieben wird.
+
+        Returns:
+            bool: True wenn ja / False wenn nein
+        """
+        return QueryTracer._enabled
+
+    @staticmethod
+    def attach(connection):
+        """
+        Setzt den Trace-Callback für eine Verbindung.
+
+        Args:
+            connection (Connection): Die Verbindung
+        """
+        connection.set_trace_callback(QueryTracer._onStatement)
+
+    @staticmethod
+    def clear():
+        """
+        Verwirft alle Einträge.
+        """
+        with QueryTracer._recordsLock:
+            QueryTracer._records = deque(maxlen=QueryTracer._maxRecords)
+            QueryTracer._droppedRecords = 0
+        QueryTracer._local.pendingStatements = 0
+
+    @staticmethod
+    def setPage(page):
+        """
+        Setzt die aktuelle Seite der UI, alle folgenden Einträge werden ihr zugeordnet.
+
+        Args:
+            page (misc): Seitennummer oder Bezeichnung
+        """
+        QueryTracer._page = page
+
+    ######################################################################################################
+    #-- Mitschreiben --
+
+    @staticmethod
+    def _onStatement(statement:str):
+        """
+        Trace-Callback von SQLite, wird für jedes ausgeführte Statement aufgerufen (auch in Triggern).
+
+        Args:
+            statement (str): Das Statement
+        """
+        QueryTracer._local.pendingStatements = getattr(QueryTracer._local,"pendingStatements",0) + 1
+
+    @staticmethod
+    def _callSite() -> str:
+        """
+        Sucht den Aufrufer außerhalb von "DatabaseConnector" und "QueryTracer".
+
+        Returns:
+            str: "Datei:Zeile (Funktion)"
+        """
+        frame = sys._getframe(1)
+        while frame is not None:
+            fileName = Path(frame.f_code.co_filename).name
+            if fileName not in ("DatabaseConnector.py","QueryTracer.py","contextlib.py"):
+                return f"{fileName}:{frame.f_lineno} ({frame.f_code.co_name})"
+            frame = frame.f_back
+        return "?"
+
+    @staticmethod
+    def begin() -> float:
+        """
+        Wird vor einer Abfrage aufgerufen (von "DatabaseConnector"): Statements davor (z.B. COMMIT) werden
+        nicht der Abfrage zugeordnet.
+
+        Returns:
+            float: Startzeit für "record" (siehe "time.perf_counter")
+        """
+        QueryTracer._local.pendingStatements = 0
+        return time.perf_counter()
+
+    @staticmethod
+    def record(sql:str,start:float,rowCount:int):
+        """
+        Speichert einen Eintrag (wird von "DatabaseConnector" aufgerufen).
+
+        Args:
+            sql (str)     : Der SQL-Befehl
+            start (float) : Rückgabe von "begin"
+            rowCount (int): Gelesene bzw. geänderte Zeilen (-1 wenn unbekannt)
+        """
+        seconds = time.perf_counter() - start
+        record = {
+            "page": QueryTracer._page,
+            "sql": " ".join(sql.split()),
+            "seconds": seconds,
+            "rows": rowCount,
+            "statements": getattr(QueryTracer._local,"pendingStatements",0),
+            "callSite": QueryTracer._callSite()
+        }
+        QueryTracer._local.pendingStatements = 0
+        with QueryTracer._recordsLock:
+            if len(QueryTracer._records) == QueryTracer._records.maxlen:
+                QueryTracer._droppedRecords += 1
+            QueryTracer._records.append(record)
+
+    @staticmethod
+    def _getRecords() -> list:
+        """
+        Gibt eine Kopie der Einträge zurück (andere Threads können währenddessen weiter mitschreiben).
+
+        Returns:
+            list: Die Einträge
+        """
+        with QueryTracer._recordsLock:
+            return list(QueryTracer._records)
+
+    ######################################################################################################
+    #-- Auswertung --
+
+    @staticmethod
+    def summarize() -> list:
+        """
+        Fasst die Einträge pro Seite und SQL-Befehl zusammen.
+
+        Returns:
+            list: Ein dict pro (Seite, SQL) mit Anzahl, Gesamt- und Maximaldauer, Zeilen, Statements und
+                  Aufrufern, sortiert nach Gesamtdauer (längste zuerst)
+        """
+        groups = dict()
+        for record in QueryTracer._getRecords():
+            key = (str(record["page"]),record["sql"])
+            group = groups.get(key)
+            if group is None:
+                group = {
+                    "page": key[0],"sql": key[1],"count": 0,"seconds": 0.0,"maxSeconds": 0.0,"rows": 0,
+                    "statements": 0,"callSites": list()
+                }
+                groups[key] = group
+            group["count"] += 1
+            group["seconds"] += record["seconds"]
+            group["maxSeconds"] = max(group["maxSeconds"],record["seconds"])
+            group["rows"] += max(record["rows"],0)
+            group["statements"] += record["statements"]
+            if record["callSite"] not in group["callSites"]:
+                group["callSites"].append(record["callSite"])
+        return sorted(groups.values(),key=lambda group: group["seconds"],reverse=True)
+
+    @staticmethod
+    def summary(limit:int = 20) -> str:
+        """
+        Zusammenfassung für die UI.
+
+        Args:
+            limit (int): Wie viele Einträge (die langsamsten) höchstens angezeigt werden
+
+        Returns:
+            str: Die Zusammenfassung
+        """
+        groups = QueryTracer.summarize()
+        records = QueryTracer._getRecords()
+        s  = "-- Abfragen --\n\n"
+        s += f"Einträge: {len(records)}"
+        if QueryTracer._droppedRecords > 0:
+            s += f" (ältere verworfen: {QueryTracer._droppedRecords})"
+        s += f", Gesamtdauer: {sum(record['seconds'] for record in records) * 1000:.2f} ms\n"
+        for group in groups[:limit]:
+            sql = group["sql"] if len(group["sql"]) <= 70 else group["sql"][:67] + "..."
+            s += f"\nSeite {group['page']}: {sql}\n"
+            s += (
+                f"    {group['count']}x, {group['seconds'] * 1000:.2f} ms (max. {group['maxSeconds'] * 1000:.2f} ms), "
+                f"{group['rows']} Zeilen, {group['statements']} Statements\n"
+            )
+            s += f"    Aufrufer: {', '.join(group['callSites'])}\n"
+        return s
+
+    @staticmethod
+    def dump(path):
+        """
+        Schreibt Zusammenfassung und alle Einträge als JSON-Datei.
+
+        Args:
+            path (str|Path): Die Zieldatei
+        """
+        with open(path,"w",encoding="utf-8") as file:
+            json.dump(
+                {"summary": QueryTracer.summarize(),"records": QueryTracer._getRecords()},
+                file,ensure_ascii=False,indent=2,default=str
+            )
\ No newline at end of file
@@ -1,53 +1,217 @@
-##########################################################################################################
-#
-# Settings.py
-#
-# Globale Einstellungen, hier kann man Dinge ändern.
-#
-##########################################################################################################
-
-from datetime import date
-
-from models.Student import Student
-from .DatabaseConnector import DatabaseConnector
-
-class Settings:
-    """
-    Statische Klasse für das Speichern von Einstellungen etc.
-    """
-
-    #"Private" Attribut: User
-    _student = Student(
-        "Max Mustermann",
-        date(2000,1,1),
-        "IU12345678",
-        "Bachelor Softwareentwicklung",
-        list(), #Aus DB holen bzw. später setzen
-        12,
-        date(2025,2,2),
-        180
-    )
-
-    #"Private" Attribute: Gibt an, ab wie vielen Punkten ein Exam bestanden ist (>= Wert)
-    _pointsToPass = 50
-
-    ######################################################################################################
-
-    def __new__(cls):
-        """
-        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
-        """
-        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
-
-    def __str__() -> str:
-        """
-        Repräsentation für UI
-
-        Returns:
-            str: Stringrepräsentation des Objektes
-        """
-        s  = "-- Einstellungen --\n\n"
-        s += f"Anzahl benötigter Punkte zum Bestehen eines Kurses: {Settings._pointsToPass}\n"
-        s += f"Datenbankdatei: {DatabaseConnector._databaseFile}\n"
-        s += f"\n{str(Settings._student)}"
+##########################################################################################################
+#
+# Settings.py
+#
+# Globale Einstellungen, hier kann man Dinge ändern.
+#
+##########################################################################################################
+
+from datetime import date
+from pathlib import Path
+
+from models.Student import Student
+from models.GradingScheme import GradingScheme
+from .DatabaseConnector import DatabaseConnector
+
+class Settings:
+    """
+    Statische Klasse für das Speichern von Einstellungen etc.
+    """
+
+    #"Private" Attribut: Alle Studenten, Schlüssel ist die Matrikelnummer. Jeder Student hat eine eigene
+    #Datenbankdatei (siehe "getDatabaseFile"), beim Start wird einer davon ausgewählt.
+    _students = {
+        student.studentNumber: student for student in [
+            Student(
+                "Max Mustermann",
+                date(2000,1,1),
+                "IU12345678",
+                "Bachelor Softwareentwicklung",
+                list(), #Aus DB holen bzw. später setzen
+                12,
+                date(2025,2,2),
+                180
+            ),
+            Student(
+                "Erika Musterfrau",
+                date(1999,6,15),
+                "IU87654321",
+                "Bachelor Informatik",
+                list(),
+                6,
+                date(2024,10,1),
+                180
+            )
+        ]
+    }
+
+    #"Private" Attribut: Der aktuell ausgewählte User (siehe "selectStudent")
+    _student = _students["IU12345678"]
+
+    #"Private" Attribut: Verzeichnis, in dem die Datenbankdateien der Studenten liegen
+    _databaseDirectory = DatabaseConnector._databaseFile.parent
+
+    #"Private" Attribute: Gibt an, ab wie vielen Punkten ein Exam bestanden ist (>= Wert)
+    _pointsToPass = 50
+
+    #"Private" Attribut: Wo die Kennzahlen des Dashboards berechnet werden
+    #"python" = Aus den geladenen Kursen (inkrementell) / "sql" = Direkt in der Datenbank (für große Datenmengen)
+    _dashboardMode = "python"
+
+    #"Private" Attribut: Speicherprofile der Datenbank => Name: PRAGMAs, die beim Verbinden gesetzt werden
+    #(Messwerte siehe README). "cache_size" negativ = in KiB, "mmap_size" in Bytes.
+    _storageProfiles = {
+
+        #Standard von SQLite: Rollback-Journal, jeder Commit wird vollständig auf die Platte geschrieben
+        "durable": {
+            "journal_mode": "DELETE",
+            "synchronous": "FULL",
+            "mmap_size": 0,
+            "cache_size": -2000,
+            "temp_store": "DEFAULT"
+        },
+
+        #Write-Ahead-Log: Commits sind deutlich schneller und Leser blockieren den Schreiber nicht. Bei einem
+        #Stromausfall können die letzten Commits fehlen, die Datei bleibt aber konsistent.
+        "balanced": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "mmap_size": 268435456,
+            "cache_size": -65536,
+            "temp_store": "MEMORY"
+        },
+
+        #Nur für Massenimporte bzw. Benchmarks in Dateien, die man neu erstellen kann: Kein Sync, Journal im
+        #Speicher => Bei einem Absturz kann die Datenbank beschädigt werden!
+        "bulk-load": {
+            "journal_mode": "MEMORY",
+            "synchronous": "OFF",
+            "mmap_size": 268435456,
+            "cache_size": -262144,
+            "temp_store": "MEMORY"
+        }
+    }
+
+    #"Private" Attribut: Das aktive Speicherprofil (siehe "_storageProfiles")
+    _storageProfile = "balanced"
+
+    #"Private" Attribut: Wie lange (ms) gewartet wird, wenn eine andere Sitzung die Datenbank gerade sperrt, bevor
+    #"DatabaseConnector" es erneut versucht (gilt für alle Profile)
+    _busyTimeout = 5000
+
+    #"Private" Attribute: Alle Datenbankabfragen mitschreiben (siehe "QueryTracer"), Zusammenfassung auf der Seite
+    #"Einstellungen" und beim Beenden als JSON in "_traceFile" (None = keine Datei)
+    _traceQueries = False
+    _traceFile    = None
+
+    #"Private" Attribute: "saveToDB" schreibt im Hintergrund (siehe "WriteBehind"), bis zu "_writeBehindBatchSize"
+    #Schreibvorgänge pro Transaktion, gesammelt höchstens "_writeBehindDelay" Sekunden lang
+    _writeBehind          = False
+    _writeBehindBatchSize = 100
+    _writeBehindDelay     = 0.05
+
+    #"Private" Attribute: Kennzahlen des Programms (siehe "Metrics") alle "_metricsInterval" Sekunden im
+    #OpenMetrics-Format in "_metricsFile" schreiben (None = aus)
+    _metricsFile     = None
+    _metricsInterval = 15
+
+    #"Private" Attribut: Notenschlüssel für die Umrechnung von Punkten in Noten (hier: Notenschlüssel der IU)
+    _gradingScheme = GradingScheme(
+        "IU",
+        [
+            (96,1.0),
+            (91,1.3),
+            (86,1.7),
+            (81,2.0),
+            (76,2.3),
+            (71,2.7),
+            (66,3.0),
+            (61,3.3),
+            (56,3.7),
+            (50,4.0),
+            (0,5.0)
+        ]
+    )
+
+    ######################################################################################################
+
+    def __new__(cls):
+        """
+        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
+        """
+        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
+
+    @staticmethod
+    def getDatabaseFile(studentNumber:str) -> Path:
+        """
+        Gibt die Datenbankdatei eines Studenten zurück: "studytrack_<Matrikelnummer>.db".
+
+        Args:
+            studentNumber (str): Die Matrikelnummer
+
+        Returns:
+            Path: Pfad der Datei
+        """
+        return Settings._databaseDirectory / f"studytrack_{studentNumber}.db"
+
+    @staticmethod
+    def selectStudent(studentNumber:str):
+        """
+        Wählt einen Studenten aus und stellt "DatabaseConnector" auf seine Datenbankdatei um. Eine bestehende
+        Verbindung wird dabei getrennt, die Daten der anderen Studenten werden nicht angefasst. Geladene Kurse
+        etc. müssen danach neu geladen werden (siehe "main.openStudent").
+
+        Die frühere, gemeinsame "studytrack.db" wird beim ersten Start vom ersten Studenten übernommen.
+
+        Args:
+            studentNumber (str): Die Matrikelnummer
+        """
+        if studentNumber not in Settings._students:
+            raise ValueError(f"Kein Student mit der Matrikelnummer '{studentNumber}' vorhanden!")
+
+        databaseFile = Settings.getDatabaseFile(studentNumber)
+        legacyFile = Settings._databaseDirectory / "studytrack.db"
+        if (studentNumber == next(iter(Settings._students)) and legacyFile.exists() and
+            not databaseFile.exists()
+        ):
+            legacyFile.rename(databaseFile)
+
+        DatabaseConnector.disconnectFromDB()
+        DatabaseConnector._databaseFile = databaseFile
+        Settings._student = Settings._students[studentNumber]
+
+    @staticmethod
+    def getStoragePragmas(profile:str = None) -> dict:
+        """
+        Gibt die PRAGMAs eines Speicherprofils inkl. "busy_timeout" zurück (für "DatabaseConnector.connectToDB").
+
+        Args:
+            profile (str): Name des Profils (OPTIONAL, sonst "_storageProfile")
+
+        Returns:
+            dict: PRAGMA => Wert
+        """
+        profile = profile if profile is not None else Settings._storageProfile
+        if profile not in Settings._storageProfiles:
+            raise ValueError(f"Kein Speicherprofil '{profile}' vorhanden!")
+        return {**Settings._storageProfiles[profile],"busy_timeout": Settings._busyTimeout}
+
+    def __str__() -> str:
+        """
+        Repräsentation für UI
+
+        Returns:
+            str: Stringrepräsentation des Objektes
+        """
+        s  = "-- Einstellungen --\n\n"
+        s += f"Anzahl benötigter Punkte zum Bestehen eines Kurses: {Settings._pointsToPass}\n"
+        s += f"Notenschlüssel: {Settings._gradingScheme.name}\n"
+        s += f"Berechnung des Dashboards: {Settings._dashboardMode}\n"
+        s += f"Datenbankdatei: {DatabaseConnector._databaseFile}\n"
+        s += f"Speicherprofil: {Settings._storageProfile}\n"
+        s += f"Speichern im Hintergrund: {'Ja' if Settings._writeBehind else 'Nein'}\n"
+        s += f"Abfragen mitschreiben: {'Ja' if Settings._traceQueries else 'Nein'}"
+        s += f" (Datei: {Settings._traceFile})\n" if Settings._traceFile is not None else "\n"
+        s += f"Kennzahlen (OpenMetrics): {Settings._metricsFile if Settings._metricsFile is not None else 'Aus'}\n"
+        s += f"\n{str(Settings._student)}"
         return s
\ No newline at end of file
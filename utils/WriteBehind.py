@@ -0,0 +1,253 @@
+##########################################################################################################
+#
+# WriteBehind.py
+#
+# Optionales Speichern im Hintergrund: "saveToDB" wartet nicht mehr auf den Commit.
+#
+##########################################################################################################
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from .DatabaseConnector import DatabaseConnector
+from .Metrics import Metrics
+
+class WriteBehind:
+    """
+    Statische Klasse für das Schreiben im Hintergrund (Write-Behind).
+
+    Solange sie läuft (siehe "start"), landen die INSERTs von "saveToDB" in einer Warteschlange. Ein eigener
+    Thread schreibt sie gesammelt (bis zu "_batchSize" Stück bzw. nach "_maxDelay" Sekunden) in einer
+    Transaktion. Jeder Schreibvorgang hat einen eigenen Savepoint, ein Fehler (z.B. doppelte Kursnummer)
+    verwirft also nur diesen einen und nicht den ganzen Block.
+
+    Fehler landen im Future, das "write" zurückgibt, und zusätzlich in "takeErrors" (für die UI, die nicht auf
+    das Future wartet). Mit "flush" wartet man, bis alles committet ist, "stop" schreibt alles und beendet
+    den Thread (z.B. beim Beenden des Programms).
+    """
+
+    #"Private" Attribut: Ausstehende Schreibvorgänge => (SQL, Parameter, Typ für "Metrics", "afterWrite", Future)
+    #bzw. None als Signal zum Beenden
+    _queue = queue.Queue()
+
+    #"Private" Attribut: Der Thread, der die Warteschlange abarbeitet (None = Write-Behind ist aus)
+    _thread = None
+
+    #"Private" Attribute: "stop" wurde aufgerufen, neue Schreibvorgänge gehen direkt in die Datenbank (sonst
+    #landen sie hinter dem Signal zum Beenden). "_stateLock" schützt "_thread", "_stopping" und das Einreihen.
+    _stopping  = False
+    _stateLock = threading.Lock()
+
+    #"Private" Attribute: Maximale Anzahl Schreibvorgänge pro Transaktion bzw. wie lange höchstens auf weitere
+    #gewartet wird (Sekunden)
+    _batchSize = 100
+    _maxDelay  = 0.05
+
+    #"Private" Attribut: Fehlgeschlagene Schreibvorgänge seit dem letzten "takeErrors" => (Typ, Parameter, Exception)
+    _errors = list()
+    _errorsLock = threading.Lock()
+
+    ######################################################################################################
+
+    def __new__(cls):
+        """
+        Verhindere VOR der Objekterstellung, dass ein Objekt erstellt wird.
+        """
+        raise TypeError("Diese Klasse darf nicht instanziiert werden.")
+
+    ######################################################################################################
+    #-- Steuerung --
+
+    @staticmethod
+    def start(batchSize:int = None,maxDelay:float = None):
+        """
+        Startet den Thread, ab jetzt schreibt "write" im Hintergrund.
+
+        Args:
+            batchSize (int) : Maximale Anzahl Schreibvorgänge pro Transaktion (OPTIONAL)
+            maxDelay (float): Wie lange höchstens auf weitere Schreibvorgänge gewartet wird (OPTIONAL)
+        """
+        with WriteBehind._stateLock:
+            if WriteBehind._thread is not None:
+                return
+            if batchSize is not None:
+                WriteBehind._batchSize = batchSize
+            if maxDelay is not None:
+                WriteBehind._maxDelay = maxDelay
+            WriteBehind._thread = threading.Thread(target=WriteBehind._run,name="WriteBehind",daemon=True)
+            WriteBehind._thread.start()
+
+    @staticmethod
+    def stop():
+        """
+        Schreibt alle ausstehenden Schreibvorgänge und beendet den Thread, danach wird wieder direkt geschrieben.
+        """
+        with WriteBehind._stateLock:
+            if WriteBehind._thread is None or WriteBehind._stopping:
+                return
+            WriteBehind._stopping = True
+            WriteBehind._queue.put(None)
+            thread = WriteBehind._thread
+
+        thread.join()
+        with WriteBehind._stateLock:
+            WriteBehind._thread = None
+            WriteBehind._stopping = False
+
+    @staticmethod
+    def isRunning() -> bool:
+        """
+        Gibt an, ob im Hintergrund geschrieben wird.
+
+        Returns:
+            bool: True wenn ja / False wenn nein
+        """
+        return WriteBehind._thread is not None
+
+    @staticmethod
+    def flush():
+        """
+        Wartet, bis alle bisher eingereihten Schreibvorgänge committet (bzw. fehlgeschlagen) sind.
+        """
+        if WriteBehind.isRunning():
+            WriteBehind._queue.join()
+
+    @staticmethod
+    def takeErrors() -> list:
+        """
+        Gibt die fehlgeschlagenen Schreibvorgänge seit dem letzten Aufruf zurück.
+
+        Returns:
+            list: Liste mit Tupeln (Typ, Parameter, Exception)
+        """
+        with WriteBehind._errorsLock:
+            errors = WriteBehind._errors
+            WriteBehind._errors = list()
+        return errors
+
+    ######################################################################################################
+    #-- Schreiben --
+
+    @staticmethod
+    def write(sql:str,params:tuple,rowType:str,afterWrite = None):
+        """
+        Schreibt eine Zeile (für "saveToDB"): Im Hintergrund, wenn Write-Behind läuft, ansonsten bzw. innerhalb
+        von "DatabaseConnector.transaction" direkt (damit die Zeile Teil der Transaktion ist).
+
+        Args:
+            sql (str)            : Der SQL-Befehl als prepared Statement
+            params (tuple)       : Parameter für Statement
+            rowType (str)        : Typ der Zeile für "Metrics", z.B. "Course"
+            afterWrite (callable): Wird direkt nach dem Statement in derselben Transaktion aufgerufen (ggf. im
+                                   Thread von Write-Behind), z.B. um von Triggern geschriebene Werte zu lesen
+                                   (OPTIONAL)
+
+        Returns:
+            Future: Ergebnis des Schreibvorgangs im Hintergrund (Exception bei Fehler) oder None, wenn direkt
+                    geschrieben wurde
+        """
+        if not DatabaseConnector.inTransaction():
+            with WriteBehind._stateLock:
+                if WriteBehind._thread is not None and not WriteBehind._stopping:
+                    future = Future()
+                    WriteBehind._queue.put((sql,params,rowType,afterWrite,future))
+                    return future
+
+        if afterWrite is None:
+            DatabaseConnector.execute(sql,params)
+        else:
+            with DatabaseConnector.transaction():
+                DatabaseConnector.execute(sql,params)
+                afterWrite()
+        Metrics.increment("studytrack_rows_written",{"type": rowType})
+        return None
+
+    @staticmethod
+    def _run():
+        """
+        Schleife des Threads: Sammelt Schreibvorgänge und schreibt sie blockweise (siehe "_writeBatch").
+        """
+        running = True
+        while running:
+            item = WriteBehind._queue.get()
+            if item is None:
+                WriteBehind._queue.task_done()
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + WriteBehind._maxDelay
+            while len(batch) < WriteBehind._batchSize:
+                try:
+                    item = WriteBehind._queue.get(timeout=max(deadline - time.monotonic(),0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+
+            try:
+
+                #Abgebrochene Futures (siehe "Future.cancel") nicht mehr schreiben, alle anderen sind ab jetzt
+                #nicht mehr abbrechbar
+                WriteBehind._writeBatch([item for item in batch if item[4].set_running_or_notify_cancel()])
+            except Exception as e:
+
+                #Unerwarteter Fehler: Melden, aber den Thread weiterlaufen lassen (sonst hängt "flush")
+                for sql, params, rowType, afterWrite, future in batch:
+                    if not future.done():
+                        WriteBehind._addError(rowType,params,e)
+                        future.set_exception(e)
+            finally:
+                for _ in range(len(batch) + (0 if running else 1)):
+                    WriteBehind._queue.task_done()
+
+    @staticmethod
+    def _writeBatch(batch:list):
+        """
+        Schreibt einen Block in einer Transaktion, jeden Schreibvorgang in einem eigenen Savepoint.
+
+        Args:
+            batch (list): Die Schreibvorgänge (siehe "_queue")
+        """
+        failed = dict() #id(Future) => Exception
+        try:
+            with DatabaseConnector.transaction():
+                for sql, params, rowType, afterWrite, future in batch:
+                    DatabaseConnector.execute("SAVEPOINT writeBehind;")
+                    try:
+                        DatabaseConnector.execute(sql,params)
+                        if afterWrite is not None:
+                            afterWrite()
+                    except Exception as e:
+                        DatabaseConnector.execute("ROLLBACK TO writeBehind;")
+                        failed[id(future)] = e
+                    DatabaseConnector.execute("RELEASE writeBehind;")
+        except Exception as e:
+
+            #Commit fehlgeschlagen => Nichts aus dem Block wurde gespeichert
+            failed = {id(future): e for *_, future in batch}
+
+        for sql, params, rowType, afterWrite, future in batch:
+            error = failed.get(id(future))
+            if error is None:
+                Metrics.increment("studytrack_rows_written",{"type": rowType})
+                future.set_result(None)
+            else:
+                WriteBehind._addError(rowType,params,error)
+                future.set_exception(error)
+
+    @staticmethod
+    def _addError(rowType:str,params:tuple,error:Exception):
+        """
+        Merkt sich einen fehlgeschlagenen Schreibvorgang für "takeErrors".
+
+        Args:
+            rowType (str)    : Typ der Zeile, z.B. "Course"
+            params (tuple)   : Parameter des Statements
+            error (Exception): Der Fehler
+        """
+        with WriteBehind._errorsLock:
+            WriteBehind._errors.append((rowType,params,error))
\ No newline at end of file
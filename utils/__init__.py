@@ -1,3 +1,9 @@
-from .ConsoleUI import ConsoleUI
-from .DatabaseConnector import DatabaseConnector
-from .Settings import Settings
\ No newline at end of file
+from .ConsoleUI import ConsoleUI
+from .DatabaseConnector import DatabaseConnector
+from .QueryTracer import QueryTracer
+from .Metrics import Metrics
+from .WriteBehind import WriteBehind
+from .Settings import Settings
+from .Importer import Importer
+from .Exporter import Exporter
+from .CohortAnalytics import CohortAnalytics
\ No newline at end of file